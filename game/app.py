@@ -4,88 +4,180 @@ import pygame
 
 from game.constants import FPS, SCREEN_HEIGHT, SCREEN_WIDTH, TITLE
 from game.audio import Audio
-from game.save import load_slot, reset_state, save_slot
 from game.scenes.base import Scene
-from game.scenes.home import HomeBaseScene
-from game.scenes.startup import StartupScene
-from game.scenes.title import TitleScene
+from game.scenes.registry import SceneRef, make_scene, resolve_scene
+
+# Saves (and the GameState/event modules under them) and the profiler are imported where
+# they're first used, so `import game.app` stays the window, the mixer and the scene registry.
 
 
 class GameApp:
     def __init__(self) -> None:
-        pygame.init()
+        # Only what the first frame needs (events come with display). The mixer is
+        # started in the background after the first flip; see Audio.start().
+        pygame.display.init()
+        pygame.font.init()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption(TITLE)
         self.clock = pygame.time.Clock()
 
+        from game.autosave import AutosaveRing
+        from game.save_service import SaveService
+
         self.audio = Audio()
+        self.saves = SaveService()
+        self.autosaves = AutosaveRing(self.saves)
 
         self.toast_text = ""
         self.toast_time_left = 0.0
+        # F3; see toggle_profiler.
+        self.profiler_overlay = None
 
         self.running = True
-        self.scene: Scene = StartupScene(self)
+        self.scene: Scene = make_scene(self, "startup")
+
+    def set_scene(self, scene: SceneRef) -> None:
+        self.scene = resolve_scene(self, scene)
+
+    def save_slot(self, slot: int, *, toast: str | None = None) -> None:
+        """Saves in the background; the toast shows once the write has finished."""
+        done_text = toast or f"Saved (slot {slot})"
+
+        def on_done(ok: bool) -> None:
+            self.toast(done_text if ok else f"Save failed (slot {slot})")
+
+        self.saves.save_slot(slot, on_done=on_done)
+
+    def autosave(self, *, toast: str | None = "Autosaved") -> None:
+        """Appends to the autosave ring (saves/autosave/); never touches the manual slots."""
+
+        def on_done(ok: bool) -> None:
+            if not ok:
+                self.toast("Autosave failed")
+            elif toast:
+                self.toast(toast)
+
+        self.autosaves.autosave(on_done=on_done)
+
+    def load_slot(self, slot: int) -> bool:
+        from game.save import load_slot
 
-    def set_scene(self, scene: Scene) -> None:
-        self.scene = scene
+        # A save for this slot may still be in flight.
+        self.saves.flush()
+        self.autosaves.restart()
+        try:
+            return load_slot(slot)
+        except (OSError, ValueError):
+            # Corrupt or truncated save (the payload hash is checked before STATE is touched).
+            return False
+
+    def load_autosave(self) -> bool:
+        self.autosaves.restart()
+        return self.autosaves.load_latest()
 
     def run(self) -> None:
+        # One method per phase so the profiler (F3) can wrap each in a span.
         while self.running:
             dt = self.clock.tick(FPS) / 1000.0
             if self.toast_time_left > 0:
                 self.toast_time_left = max(0.0, self.toast_time_left - dt)
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-                    break
-
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_F5:
-                        save_slot(1)
-                        self.toast("Saved (slot 1)")
-                    elif event.key == pygame.K_F6:
-                        save_slot(2)
-                        self.toast("Saved (slot 2)")
-                    elif event.key == pygame.K_F7:
-                        save_slot(3)
-                        self.toast("Saved (slot 3)")
-                    elif event.key == pygame.K_F9:
-                        if load_slot(1):
-                            self.set_scene(HomeBaseScene(self))
-                            self.toast("Loaded (slot 1)")
-                        else:
-                            self.toast("No save in slot 1")
-                    elif event.key == pygame.K_F10:
-                        if load_slot(2):
-                            self.set_scene(HomeBaseScene(self))
-                            self.toast("Loaded (slot 2)")
-                        else:
-                            self.toast("No save in slot 2")
-                    elif event.key == pygame.K_F11:
-                        if load_slot(3):
-                            self.set_scene(HomeBaseScene(self))
-                            self.toast("Loaded (slot 3)")
-                        else:
-                            self.toast("No save in slot 3")
-                    elif event.key == pygame.K_F8:
-                        reset_state()
-                        self.set_scene(TitleScene(self))
-                        self.toast("Reset state")
-
-                next_scene = self.scene.handle_event(event)
-                if next_scene is not None:
-                    self.set_scene(next_scene)
-
-            next_scene = self.scene.update(dt)
+            self._handle_events()
+            self._update(dt)
+            self._draw()
+            if self.profiler_overlay is not None:
+                self.profiler_overlay.draw(self.screen, dt)
+            self._flip()
+            self.audio.start()
+
+        # Nothing to export unless F3 loaded the profiler at some point.
+        profiler = sys.modules.get("game.profiler")
+        if profiler is not None and profiler.PROFILER.stats:
+            profiler.PROFILER.disable()
+            profiler.PROFILER.export()
+        self.saves.shutdown()
+        self.audio.shutdown()
+        pygame.quit()
+        sys.exit()
+
+    def _handle_events(self) -> None:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.running = False
+                break
+
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_F5:
+                    self.save_slot(1)
+                elif event.key == pygame.K_F6:
+                    self.save_slot(2)
+                elif event.key == pygame.K_F7:
+                    self.save_slot(3)
+                elif event.key == pygame.K_F9:
+                    if self.load_slot(1):
+                        self.set_scene("home")
+                        self.toast("Loaded (slot 1)")
+                    else:
+                        self.toast("No save in slot 1")
+                elif event.key == pygame.K_F10:
+                    if self.load_slot(2):
+                        self.set_scene("home")
+                        self.toast("Loaded (slot 2)")
+                    else:
+                        self.toast("No save in slot 2")
+                elif event.key == pygame.K_F11:
+                    if self.load_slot(3):
+                        self.set_scene("home")
+                        self.toast("Loaded (slot 3)")
+                    else:
+                        self.toast("No save in slot 3")
+                elif event.key == pygame.K_F8:
+                    from game.save import reset_state
+
+                    reset_state()
+                    self.autosaves.restart()
+                    self.set_scene("title")
+                    self.toast("Reset state")
+                elif event.key == pygame.K_F3:
+                    self.toggle_profiler()
+
+            next_scene = self.scene.handle_event(event)
             if next_scene is not None:
                 self.set_scene(next_scene)
 
-            self.scene.draw(self.screen)
-            self.draw_toast(self.screen)
-            pygame.display.flip()
+    def _update(self, dt: float) -> None:
+        next_scene = self.scene.update(dt)
+        if next_scene is not None:
+            self.set_scene(next_scene)
+        self.audio.update()
+        self.saves.update()
 
-        pygame.quit()
-        sys.exit()
+    def _draw(self) -> None:
+        self.scene.draw(self.screen)
+        self.draw_toast(self.screen)
+
+    def _flip(self) -> None:
+        pygame.display.flip()
+
+    def toggle_profiler(self) -> None:
+        """F3: frame and dungeon-turn spans plus the overlay. Off again restores the untimed methods."""
+        from game.profiler import PROFILER, sim_targets
+
+        if PROFILER.enabled:
+            PROFILER.disable()
+            self.profiler_overlay = None
+            return
+        from game.ui.profiler_overlay import ProfilerOverlay
+
+        PROFILER.enable(
+            [
+                (self, "_handle_events", "frame.events"),
+                (self, "_update", "frame.update"),
+                (self, "_draw", "frame.draw"),
+                (self, "_flip", "frame.flip"),
+            ]
+            + sim_targets()
+        )
+        self.profiler_overlay = ProfilerOverlay(PROFILER)
 
     def toast(self, text: str, *, seconds: float = 2.0) -> None:
         self.toast_text = text
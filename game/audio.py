@@ -1,60 +1,150 @@
 from __future__ import annotations
 
+import threading
 from pathlib import Path
+from random import Random
 
 import pygame
 
+from game.music import MusicManager
+from game.synth import is_placeholder_wav, placeholder_variants
+
 
 class Audio:
+    """
+    The mixer is brought up by `start()` on a background thread, so a slow audio backend
+    never delays the window. Until it's ready, music requests are queued (latest wins)
+    and replayed by `update()`; SFX are dropped since they'd play late anyway.
+    """
+
     def __init__(self) -> None:
         self.enabled = False
+        self._music: MusicManager | None = None
+        # Per path: the loaded file, or synthesized variants (one is picked per play).
+        self._sfx_cache: dict[Path, list[pygame.mixer.Sound]] = {}
+        self._sfx_rng = Random()
+
+        self._init_thread: threading.Thread | None = None
+        self._init_ok = False
+        self._init_done = False
+        self._queued_music: tuple[Path, float, bool] | None = None
+        self._queued_stop = False
+        self._queued_prefetch: list[Path] = []
+
+    def start(self) -> None:
+        if self._init_thread is not None:
+            return
+        self._init_thread = threading.Thread(target=self._init_mixer, name="mixer-init", daemon=True)
+        self._init_thread.start()
+
+    def _init_mixer(self) -> None:
         try:
             if not pygame.mixer.get_init():
                 pygame.mixer.init()
-            self.enabled = True
+            self._init_ok = True
         except Exception:
-            self.enabled = False
+            self._init_ok = False
 
-        self._current_music: Path | None = None
-        self._sfx_cache: dict[Path, pygame.mixer.Sound] = {}
+    def _finish_init(self) -> None:
+        self._init_done = True
+        self.enabled = self._init_ok
+        if self.enabled:
+            try:
+                self._music = MusicManager()
+            except Exception:
+                self._music = None
+        queued, stop, prefetch = self._queued_music, self._queued_stop, self._queued_prefetch
+        self._queued_music, self._queued_stop, self._queued_prefetch = None, False, []
+        for p in prefetch:
+            self.prefetch_music(p)
+        if queued is not None:
+            p, volume, loop = queued
+            self.play_music(p, volume=volume, loop=loop)
+        elif stop:
+            self.stop_music()
 
     def play_music(self, path: str | Path, *, volume: float = 0.5, loop: bool = True) -> None:
-        if not self.enabled:
-            return
+        """
+        Non-blocking: the track is decoded off the main thread (or reused from the
+        recent-track cache) and crossfaded in once ready.
+        """
         p = Path(path)
-        if not p.exists():
+        if not self._init_done:
+            self._queued_music = (p, volume, loop)
+            self._queued_stop = False
+            return
+        if not self.enabled or self._music is None:
             return
-        if self._current_music == p:
+        if not p.exists():
             return
         try:
-            pygame.mixer.music.load(str(p))
-            pygame.mixer.music.set_volume(max(0.0, min(1.0, volume)))
-            pygame.mixer.music.play(-1 if loop else 0)
-            self._current_music = p
+            self._music.play(p, volume=volume, loop=loop)
         except Exception:
             pass
 
+    def prefetch_music(self, path: str | Path) -> None:
+        """Start decoding a track we expect to need soon (e.g. the next area's music)."""
+        p = Path(path)
+        if not self._init_done:
+            self._queued_prefetch.append(p)
+            return
+        if not self.enabled or self._music is None:
+            return
+        if p.exists():
+            self._music.prefetch(p)
+
     def stop_music(self) -> None:
-        if not self.enabled:
+        if not self._init_done:
+            self._queued_music = None
+            self._queued_stop = True
+            return
+        if not self.enabled or self._music is None:
             return
         try:
-            pygame.mixer.music.stop()
+            self._music.stop()
         except Exception:
             pass
-        self._current_music = None
+
+    def update(self) -> None:
+        """Call once per frame; finishes mixer startup and pending music switches."""
+        if not self._init_done:
+            if self._init_thread is None or self._init_thread.is_alive():
+                return
+            self._finish_init()
+        if self._music is None:
+            return
+        try:
+            self._music.update()
+        except Exception:
+            pass
+
+    def shutdown(self) -> None:
+        if self._music is not None:
+            self._music.shutdown()
 
     def play_sfx(self, path: str | Path, *, volume: float = 0.6) -> None:
         if not self.enabled:
             return
         p = Path(path)
-        if not p.exists():
-            return
         try:
-            snd = self._sfx_cache.get(p)
-            if snd is None:
-                snd = pygame.mixer.Sound(str(p))
-                self._sfx_cache[p] = snd
+            sounds = self._sfx_cache.get(p)
+            if sounds is None:
+                sounds = self._sfx_cache[p] = self._load_sfx(p)
+            if not sounds:
+                return
+            snd = sounds[0] if len(sounds) == 1 else self._sfx_rng.choice(sounds)
             snd.set_volume(max(0.0, min(1.0, volume)))
             snd.play()
         except Exception:
             pass
+
+    def _load_sfx(self, p: Path) -> list[pygame.mixer.Sound]:
+        # Real recordings play as they are. The generated placeholder WAVs (and missing
+        # files) are synthesized in memory instead, which is where hits and steps get
+        # their pitch variants; the file is only a fallback if the mixer format isn't supported.
+        if p.exists() and not is_placeholder_wav(p):
+            return [pygame.mixer.Sound(str(p))]
+        variants = placeholder_variants(p.stem, rng=self._sfx_rng)
+        if not variants and p.exists():
+            return [pygame.mixer.Sound(str(p))]
+        return variants
@@ -0,0 +1,278 @@
+"""
+Rotating autosaves that never touch the manual slots.
+
+The ring holds `size` entries under saves/autosave/, each a full snapshot (`autoN.sav`, the
+regular binary format) plus an append-only journal of deltas against it (`autoN.journal`).
+An autosave only appends the fields that changed since the previous one (a gold change, an
+item, a flag, a kill count), so frequent autosaves cost a few dozen bytes; which fields to
+copy and compare comes from the GameState per-field revisions, so the rest aren't touched. Once a journal
+passes `compact_after` records the next autosave writes a fresh snapshot into the next ring
+entry instead, which folds the journal away and leaves the older entries as history.
+
+Snapshots carry an increasing "autosave_seq" in their header to order the ring. Journal
+records are "<II" (length, crc32) + compact JSON; the first record names the hash of the
+snapshot it belongs to. Replay stops at the first torn or corrupt record, so a crash
+mid-append loses at most that autosave. All file work runs on the SaveService worker.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import os
+import struct
+import zlib
+from collections.abc import Callable, Collection
+from pathlib import Path
+from typing import Any
+
+from game import save_codec
+from game.save import SlotInfo, _apply_state, decode_save, read_info, save_meta, snapshot_state, write_save
+from game.save_codec import STR_INT_MAP, STR_OPT_STR_MAP, STR_SET
+from game.save_service import SaveService
+from game.state import GameState, STATE
+from game.state_schema import FIELD_KINDS, snapshot_fields
+
+
+AUTOSAVE_DIR = Path("saves/autosave")
+
+_RECORD = struct.Struct("<II")
+
+
+class AutosaveRing:
+    def __init__(
+        self,
+        saves: SaveService,
+        *,
+        directory: str | Path = AUTOSAVE_DIR,
+        size: int = 3,
+        compact_after: int = 64,
+    ) -> None:
+        self.saves = saves
+        self.directory = Path(directory)
+        self.size = max(1, int(size))
+        self.compact_after = max(1, int(compact_after))
+        self._index: int | None = None  # ring entry the journal is appending to
+        self._last: dict[str, Any] | None = None  # snapshot as of the previous autosave
+        self._source: GameState | None = None  # the state `_last` was taken from...
+        self._revision = 0  # ...and its revision at the time
+        self._records = 0
+        self._seq: int | None = None  # autosave_seq of the newest snapshot written or found
+
+    def snapshot_path(self, index: int) -> Path:
+        return self.directory / f"auto{index}.sav"
+
+    def journal_path(self, index: int) -> Path:
+        return self.directory / f"auto{index}.journal"
+
+    def restart(self) -> None:
+        """Next autosave starts a new ring entry (call after loading or resetting the game)."""
+        self._last = None
+        self._records = 0
+
+    def autosave(self, state: GameState = STATE, *, on_done: Callable[[bool], None] | None = None) -> None:
+        fresh = self._index is None or self._last is None or self._records >= self.compact_after
+        if not fresh and state is self._source and state.revision == self._revision:
+            if on_done is not None:
+                on_done(True)
+            return
+        if fresh or state is not self._source:
+            names = None
+            snap = snapshot_state(state)
+        else:
+            names = state.dirty_since(self._revision)
+            snap = snapshot_fields(state, names)
+        self._source, self._revision = state, state.revision
+        if fresh:
+            if self._index is None or self._seq is None:
+                # First autosave this session: continue after the newest entry on disk.
+                entries = self._entries()
+                self._seq = entries[0][0] if entries else 0
+                self._index = entries[0][1] if entries else self.size - 1
+            # Never overwrite the entry we'd load from: the new snapshot goes in the next one.
+            index = (self._index + 1) % self.size
+            self._seq += 1
+            self._index, self._last, self._records = index, snap, 0
+            self.saves.submit(
+                self._write_snapshot, index, snap, self._seq, self.saves.fsync, on_done=self._snapshot_done(on_done)
+            )
+            return
+
+        delta = diff_snapshots(self._last, snap, names)
+        # A new dict: the previous one may still be queued for the worker.
+        self._last = snap if names is None else {**self._last, **snap}
+        if not delta:
+            if on_done is not None:
+                on_done(True)
+            return
+        self._records += 1
+        self.saves.submit(self._append, self.journal_path(self._index), delta, self.saves.fsync, on_done=on_done)
+
+    def latest_index(self) -> int | None:
+        entries = self._entries()
+        return entries[0][1] if entries else None
+
+    def info(self) -> SlotInfo | None:
+        """
+        Header of the newest snapshot, brought up to date by its journal: the label fields are
+        replayed from the deltas (the journal is small; the payload isn't read) and the time
+        is the journal's last write.
+        """
+        index = self.latest_index()
+        if index is None:
+            return None
+        info = read_info(self.snapshot_path(index))
+        journal = self.journal_path(index)
+        if info is None or not journal.exists():
+            return info
+        fields: dict[str, Any] = {
+            "player_name": info.player_name,
+            "chapter": info.chapter,
+            "combat_level": info.combat_level,
+            "gold": info.gold,
+        }
+        for delta in read_journal(journal, base_hash=info.hash):
+            apply_delta(fields, {name: op for name, op in delta.items() if name in fields})
+        meta = save_meta(fields)
+        return dataclasses.replace(
+            info,
+            player_name=meta["player_name"],
+            chapter=meta["chapter"],
+            chapter_title=meta["chapter_title"],
+            combat_level=meta["combat_level"],
+            gold=meta["gold"],
+            saved_at=max(info.saved_at, journal.stat().st_mtime),
+        )
+
+    def load_latest(self, state: GameState = STATE) -> bool:
+        """Newest snapshot plus its journal. Falls back to older entries if one is unreadable."""
+        self.saves.flush()
+        for _, index, base_hash in self._entries():
+            try:
+                payload = decode_save(self.snapshot_path(index).read_bytes())
+            except (OSError, ValueError):
+                continue
+            fields = payload["state"]
+            for delta in read_journal(self.journal_path(index), base_hash=base_hash):
+                apply_delta(fields, delta)
+            _apply_state(state, payload)
+            self.restart()
+            return True
+        return False
+
+    def _entries(self) -> list[tuple[int, int, str]]:
+        """(autosave_seq, index, payload hash) per readable snapshot header, newest first."""
+        entries: list[tuple[int, int, str]] = []
+        for index in range(self.size):
+            try:
+                with self.snapshot_path(index).open("rb") as f:
+                    meta = save_codec.read_meta(f)
+            except (OSError, ValueError):
+                continue
+            if meta:
+                entries.append((int(meta.get("autosave_seq", 0)), index, str(meta.get("hash", ""))))
+        entries.sort(reverse=True)
+        return entries
+
+    def _snapshot_done(self, on_done: Callable[[bool], None] | None) -> Callable[[bool], None]:
+        # The ring already points at the new entry; if its snapshot never made it to disk,
+        # the next autosave must write a fresh one rather than journal against it.
+        def done(ok: bool) -> None:
+            if not ok:
+                self.restart()
+            if on_done is not None:
+                on_done(ok)
+
+        return done
+
+    def _write_snapshot(self, index: int, snap: dict[str, Any], seq: int, fsync: str) -> None:
+        path = self.snapshot_path(index)
+        # Drop the old entry's journal first: if the snapshot write fails, deltas queued
+        # behind it start a journal with no base record, which read_journal ignores,
+        # instead of landing on the old snapshot.
+        self.journal_path(index).unlink(missing_ok=True)
+        write_save(path, snap, fsync=fsync, meta={"autosave_seq": seq})
+        with path.open("rb") as f:
+            meta = save_codec.read_meta(f) or {}
+        journal = self.journal_path(index)
+        with journal.open("wb") as f:
+            f.write(_record({"base": meta.get("hash", "")}))
+            _sync(f, fsync)
+
+    @staticmethod
+    def _append(journal: Path, delta: dict[str, Any], fsync: str) -> None:
+        with journal.open("ab") as f:
+            f.write(_record(delta))
+            _sync(f, fsync)
+
+
+def diff_snapshots(old: dict[str, Any], new: dict[str, Any], names: Collection[str] | None = None) -> dict[str, Any]:
+    """
+    Field-level delta, JSON-ready (only over `names` if given; `new` may then hold just those):
+        scalar  ["=", value]
+        set     ["s", added, removed]
+        map     ["m", {key: value}, removed_keys]
+    """
+    delta: dict[str, Any] = {}
+    for name, kind in FIELD_KINDS:
+        if names is not None and name not in names:
+            continue
+        a, b = old.get(name), new.get(name)
+        if a == b:
+            continue
+        if kind == STR_SET:
+            delta[name] = ["s", sorted(b - a), sorted(a - b)]
+        elif kind in (STR_INT_MAP, STR_OPT_STR_MAP):
+            changed = {k: v for k, v in b.items() if k not in a or a[k] != v}
+            delta[name] = ["m", changed, [k for k in a if k not in b]]
+        else:
+            delta[name] = ["=", b]
+    return delta
+
+
+def apply_delta(fields: dict[str, Any], delta: dict[str, Any]) -> None:
+    for name, op in delta.items():
+        if op[0] == "=":
+            fields[name] = op[1]
+        elif op[0] == "s":
+            value = set(fields.get(name) or ())
+            value.update(op[1])
+            value.difference_update(op[2])
+            fields[name] = value
+        elif op[0] == "m":
+            value = dict(fields.get(name) or {})
+            value.update(op[1])
+            for k in op[2]:
+                value.pop(k, None)
+            fields[name] = value
+
+
+def read_journal(path: Path, *, base_hash: str) -> list[dict[str, Any]]:
+    """Deltas for the snapshot with `base_hash`; empty if the journal belongs to another one."""
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return []
+    records: list[dict[str, Any]] = []
+    pos = 0
+    while pos + _RECORD.size <= len(data):
+        length, crc = _RECORD.unpack_from(data, pos)
+        body = data[pos + _RECORD.size : pos + _RECORD.size + length]
+        if len(body) != length or zlib.crc32(body) != crc:
+            break  # torn tail from a crash mid-append
+        records.append(json.loads(body.decode("utf-8")))
+        pos += _RECORD.size + length
+    if not records or records[0].get("base") != base_hash:
+        return []
+    return records[1:]
+
+
+def _record(obj: dict[str, Any]) -> bytes:
+    body = json.dumps(obj, separators=(",", ":")).encode("utf-8")
+    return _RECORD.pack(len(body), zlib.crc32(body)) + body
+
+
+def _sync(f, fsync: str) -> None:
+    f.flush()
+    if fsync != "never":
+        os.fsync(f.fileno())
@@ -0,0 +1,314 @@
+"""
+Compiled content pack for data/items.json, enemies.json, missions.json and spawns.json.
+
+`compile_sources()` parses and validates the files (types, enum values, and references
+from missions and spawn tables to item/enemy ids) and normalizes every entry into the
+keyword arguments of its dataclass (ItemDef / EnemyDef / MissionDef / DungeonSpawns).
+The result is written with `marshal` to data/.cache/content.pack together with each
+source's mtime and size.
+
+At runtime `load_section()` only stats the sources: if they still match the pack's
+stamps, the pack is loaded in one read and the JSON is never opened. Otherwise the pack
+is recompiled and rewritten, best-effort. (An edit that keeps both size and mtime is
+missed; `tools/compile_data.py` always rebuilds.) A section is None when its file is
+missing or unparseable; the game modules then keep their built-in defaults, as before.
+Validation problems are reported by `tools/compile_data.py` and don't stop the game.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import marshal
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+# One per source in SOURCES order: (mtime_ns, size), or None if the file is missing.
+SourceStamps = tuple[tuple[int, int] | None, ...]
+
+DATA_DIR = Path("data")
+PACK_PATH = DATA_DIR / ".cache" / "content.pack"
+SOURCES = {"items": "items.json", "enemies": "enemies.json", "missions": "missions.json", "spawns": "spawns.json"}
+PACK_FORMAT = 2
+
+ITEM_SLOTS = ("weapon", "armor", "trinket")
+ITEM_STATS = ("attack", "defense", "max_hp")
+ENEMY_BEHAVIORS = ("melee", "ranged", "melee_patrol", "poison_melee")
+MISSION_BOARDS = ("guild", "ice_camp")
+OBJECTIVE_TYPES = ("collect_item", "defeat_enemy", "reach_floor", "rescue_miners")
+
+_PACK: dict[str, Any] | None = None
+
+
+def load_section(name: str) -> dict[str, dict[str, Any]] | None:
+    """Normalized `{id: dataclass kwargs}` for one source file, or None to use defaults."""
+    global _PACK
+    if _PACK is None:
+        _PACK = load_pack()
+    return _PACK["sections"].get(name)
+
+
+def load_pack(*, data_dir: Path = DATA_DIR, pack_path: Path = PACK_PATH) -> dict[str, Any]:
+    stamps = source_stamps(data_dir)
+    try:
+        pack = marshal.loads(pack_path.read_bytes())
+        if pack.get("format") == PACK_FORMAT and pack.get("sources") == stamps:
+            return pack
+    except (OSError, ValueError, EOFError, TypeError, AttributeError):
+        pass
+    pack, _ = build_pack(data_dir)
+    try:
+        write_pack(pack, pack_path)
+    except OSError:
+        pass  # read-only install: just use the freshly compiled data
+    return pack
+
+
+def build_pack(data_dir: Path = DATA_DIR) -> tuple[dict[str, Any], list[str]]:
+    """Compiles the sources in `data_dir` and stamps the pack with them; (pack, problems)."""
+    # Stat before reading: a file changed in between leaves an older stamp, so the next load recompiles.
+    stamps = source_stamps(data_dir)
+    pack, problems = compile_sources(read_sources(data_dir))
+    pack["sources"] = stamps
+    return pack, problems
+
+
+def source_stamps(data_dir: Path) -> SourceStamps:
+    stamps: list[tuple[int, int] | None] = []
+    for filename in SOURCES.values():
+        try:
+            st = os.stat(data_dir / filename)
+        except OSError:
+            stamps.append(None)
+            continue
+        stamps.append((st.st_mtime_ns, st.st_size))
+    return tuple(stamps)
+
+
+def source_hash(raw: dict[str, bytes | None]) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(str(PACK_FORMAT).encode("ascii"))
+    for name in sorted(raw):
+        data = raw[name]
+        h.update(name.encode("ascii") + b"\0")
+        h.update(b"-" if data is None else len(data).to_bytes(8, "little") + data)
+    return h.hexdigest()
+
+
+def compile_sources(raw: dict[str, bytes | None]) -> tuple[dict[str, Any], list[str]]:
+    """Returns (pack, problems). Entries with problems are still included where usable."""
+    problems: list[str] = []
+    parsed: dict[str, dict[str, Any] | None] = {}
+    for name, data in raw.items():
+        if data is None:
+            parsed[name] = None
+            continue
+        try:
+            doc = json.loads(data.decode("utf-8"))
+        except ValueError as e:
+            problems.append(f"{SOURCES[name]}: not valid JSON ({e})")
+            doc = None
+        if doc is not None and not isinstance(doc, dict):
+            problems.append(f"{SOURCES[name]}: top level must be an object keyed by id")
+            doc = None
+        parsed[name] = doc
+
+    sections: dict[str, dict[str, dict[str, Any]] | None] = {}
+    builders = (
+        ("items", _item_kwargs),
+        ("enemies", _enemy_kwargs),
+        ("missions", _mission_kwargs),
+        ("spawns", _spawns_kwargs),
+    )
+    for name, build in builders:
+        doc = parsed.get(name)
+        if doc is None:
+            sections[name] = None
+            continue
+        out: dict[str, dict[str, Any]] = {}
+        for entry_id, entry in doc.items():
+            where = f"{SOURCES[name]}: {entry_id}"
+            if not isinstance(entry, dict):
+                problems.append(f"{where}: entry must be an object")
+                continue
+            try:
+                out[entry_id] = build(entry_id, entry, problems, where)
+            except (TypeError, ValueError) as e:
+                problems.append(f"{where}: {e}")
+        sections[name] = out or None
+
+    _check_references(sections, problems)
+    pack = {"format": PACK_FORMAT, "hash": source_hash(raw), "sections": sections}
+    return pack, problems
+
+
+def write_pack(pack: dict[str, Any], pack_path: Path = PACK_PATH) -> None:
+    pack_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=pack_path.parent, prefix=f".{pack_path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(marshal.dumps(pack))
+        os.replace(tmp, pack_path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def read_sources(data_dir: Path) -> dict[str, bytes | None]:
+    raw: dict[str, bytes | None] = {}
+    for name, filename in SOURCES.items():
+        try:
+            raw[name] = (data_dir / filename).read_bytes()
+        except OSError:
+            raw[name] = None
+    return raw
+
+
+def _int_map(value: Any, where: str, problems: list[str], *, allowed: tuple[str, ...] | None = None) -> dict[str, int] | None:
+    if value is None:
+        return None
+    if not isinstance(value, dict):
+        problems.append(f"{where}: expected an object")
+        return None
+    out = {str(k): int(v) for k, v in value.items()}
+    if allowed is not None:
+        for k in out:
+            if k not in allowed:
+                problems.append(f"{where}: unknown key {k!r}")
+    return out
+
+
+def _item_kwargs(item_id: str, raw: dict[str, Any], problems: list[str], where: str) -> dict[str, Any]:
+    slot = raw.get("slot")
+    if slot is not None and slot not in ITEM_SLOTS:
+        problems.append(f"{where}: slot {slot!r} is not one of {ITEM_SLOTS}")
+    stats = raw.get("stats")
+    effects = raw.get("effects")
+    return {
+        "item_id": item_id,
+        "name": str(raw.get("name", item_id)),
+        "description": str(raw.get("description", "")),
+        "type": str(raw.get("type", "misc")),
+        "buy_price": int(raw.get("buy_price", 0)),
+        "sell_price": int(raw.get("sell_price", 0)),
+        "usable_in_dungeon": bool(raw.get("usable_in_dungeon", False)),
+        "slot": str(slot) if slot is not None else None,
+        # Same leniency as before: anything that isn't an object means "none".
+        "stats": _int_map(stats, f"{where}.stats", problems, allowed=ITEM_STATS) if isinstance(stats, dict) else None,
+        "effects": _int_map(effects, f"{where}.effects", problems) if isinstance(effects, dict) else None,
+    }
+
+
+def _enemy_kwargs(enemy_id: str, raw: dict[str, Any], problems: list[str], where: str) -> dict[str, Any]:
+    behavior = str(raw.get("behavior", "melee"))
+    if behavior not in ENEMY_BEHAVIORS:
+        problems.append(f"{where}: behavior {behavior!r} is not one of {ENEMY_BEHAVIORS}")
+    return {
+        "enemy_id": enemy_id,
+        "name": str(raw.get("name", enemy_id)),
+        "base_hp": int(raw.get("base_hp", 1)),
+        "hp_per_floor": int(raw.get("hp_per_floor", 0)),
+        "attack": int(raw.get("attack", 1)),
+        "defense": int(raw.get("defense", 0)),
+        "aggro_range": int(raw.get("aggro_range", 5)),
+        "move_interval": int(raw.get("move_interval", 2)),
+        "attack_interval": int(raw.get("attack_interval", 2)),
+        "behavior": behavior,
+        "ranged_range": int(raw.get("ranged_range", 0)),
+        "poison_turns": int(raw.get("poison_turns", 0)),
+        "poison_damage": int(raw.get("poison_damage", 0)),
+    }
+
+
+def _mission_kwargs(mission_id: str, raw: dict[str, Any], problems: list[str], where: str) -> dict[str, Any]:
+    board = str(raw.get("board", "guild"))
+    if board not in MISSION_BOARDS:
+        problems.append(f"{where}: board {board!r} is not one of {MISSION_BOARDS}")
+    objectives = list(raw.get("objectives", []) or [])
+    for i, obj in enumerate(objectives):
+        if not isinstance(obj, dict) or obj.get("type") not in OBJECTIVE_TYPES:
+            problems.append(f"{where}.objectives[{i}]: type must be one of {OBJECTIVE_TYPES}")
+    return {
+        "mission_id": mission_id,
+        "name": str(raw.get("name", mission_id)),
+        "description": str(raw.get("description", "")),
+        "mission_type": str(raw.get("mission_type", "misc")),
+        "min_chapter": int(raw.get("min_chapter", 1)),
+        "accept_lines": [str(line) for line in raw.get("accept_lines", []) or []],
+        "turn_in_lines": [str(line) for line in raw.get("turn_in_lines", []) or []],
+        "reward_gold": int(raw.get("reward_gold", 0)),
+        "reward_guild_xp": int(raw.get("reward_guild_xp", 0)),
+        "board": board,
+        "repeatable": bool(raw.get("repeatable", False)),
+        "reward_items": _int_map(raw.get("reward_items", {}) or {}, f"{where}.reward_items", problems) or {},
+        "consume_items": _int_map(raw.get("consume_items", {}) or {}, f"{where}.consume_items", problems) or {},
+        "objectives": [dict(obj) for obj in objectives if isinstance(obj, dict)],
+    }
+
+
+def _spawns_kwargs(dungeon_id: str, raw: dict[str, Any], problems: list[str], where: str) -> dict[str, Any]:
+    enemies: list[dict[str, Any]] = []
+    for i, entry in enumerate(raw.get("enemies", []) or []):
+        at = f"{where}.enemies[{i}]"
+        if not isinstance(entry, dict) or not entry.get("enemy_id"):
+            problems.append(f"{at}: expected an object with an enemy_id")
+            continue
+        e = {
+            "enemy_id": str(entry["enemy_id"]),
+            "weight": float(entry.get("weight", 1)),
+            "min_floor": int(entry.get("min_floor", 1)),
+            "max_floor": int(entry["max_floor"]) if entry.get("max_floor") is not None else None,
+            "cap": int(entry["cap"]) if entry.get("cap") is not None else None,
+        }
+        if e["weight"] <= 0:
+            problems.append(f"{at}: weight must be positive")
+        if e["max_floor"] is not None and e["max_floor"] < e["min_floor"]:
+            problems.append(f"{at}: max_floor is below min_floor")
+        enemies.append(e)
+    if not enemies:
+        problems.append(f"{where}: no enemy entries")
+    bosses: list[dict[str, Any]] = []
+    for i, entry in enumerate(raw.get("bosses", []) or []):
+        if not isinstance(entry, dict) or not entry.get("enemy_id"):
+            problems.append(f"{where}.bosses[{i}]: expected an object with an enemy_id")
+            continue
+        bosses.append({"enemy_id": str(entry["enemy_id"]), "min_distance": int(entry.get("min_distance", 8))})
+    return {
+        "dungeon_id": dungeon_id,
+        "enemies": enemies,
+        "bosses": bosses,
+        "relics": [str(item_id) for item_id in raw.get("relics", []) or []],
+    }
+
+
+def _check_references(sections: dict[str, dict[str, dict[str, Any]] | None], problems: list[str]) -> None:
+    items, enemies, missions = sections.get("items"), sections.get("enemies"), sections.get("missions")
+    for dungeon_id, d in (sections.get("spawns") or {}).items():
+        where = f"{SOURCES['spawns']}: {dungeon_id}"
+        for group in ("enemies", "bosses"):
+            for i, entry in enumerate(d[group]):
+                if enemies is not None and entry["enemy_id"] not in enemies:
+                    problems.append(f"{where}.{group}[{i}]: unknown enemy {entry['enemy_id']!r}")
+        for item_id in d["relics"]:
+            if items is not None and item_id not in items:
+                problems.append(f"{where}.relics: unknown item {item_id!r}")
+    if not missions:
+        return
+    for mission_id, m in missions.items():
+        where = f"{SOURCES['missions']}: {mission_id}"
+        if items is not None:
+            for field_name in ("reward_items", "consume_items"):
+                for item_id in m[field_name]:
+                    if item_id not in items:
+                        problems.append(f"{where}.{field_name}: unknown item {item_id!r}")
+        for i, obj in enumerate(m["objectives"]):
+            item_id, enemy_id = obj.get("item_id"), obj.get("enemy_id")
+            if obj.get("type") == "collect_item" and items is not None and item_id not in items:
+                problems.append(f"{where}.objectives[{i}]: unknown item {item_id!r}")
+            if obj.get("type") == "defeat_enemy" and enemies is not None and enemy_id not in enemies:
+                problems.append(f"{where}.objectives[{i}]: unknown enemy {enemy_id!r}")
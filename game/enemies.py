@@ -2,10 +2,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from random import Random
-from typing import Any
 
 from game.entities.enemy import Enemy
-from game.data_loader import load_json
+from game.data_pack import load_section
 
 
 @dataclass(frozen=True)
@@ -92,35 +91,10 @@ _DEFAULT_ENEMIES: dict[str, EnemyDef] = {
 }
 
 
-def _enemies_from_json(data: dict[str, Any]) -> dict[str, EnemyDef]:
-    enemies: dict[str, EnemyDef] = {}
-    for enemy_id, raw in data.items():
-        if not isinstance(raw, dict):
-            continue
-        enemies[enemy_id] = EnemyDef(
-            enemy_id=enemy_id,
-            name=str(raw.get("name", enemy_id)),
-            base_hp=int(raw.get("base_hp", 1)),
-            hp_per_floor=int(raw.get("hp_per_floor", 0)),
-            attack=int(raw.get("attack", 1)),
-            defense=int(raw.get("defense", 0)),
-            aggro_range=int(raw.get("aggro_range", 5)),
-            move_interval=int(raw.get("move_interval", 2)),
-            attack_interval=int(raw.get("attack_interval", 2)),
-            behavior=str(raw.get("behavior", "melee")),
-            ranged_range=int(raw.get("ranged_range", 0)),
-            poison_turns=int(raw.get("poison_turns", 0)),
-            poison_damage=int(raw.get("poison_damage", 0)),
-        )
-    return enemies
-
-
 ENEMIES: dict[str, EnemyDef] = _DEFAULT_ENEMIES
-_loaded = load_json("data/enemies.json")
-if isinstance(_loaded, dict):
-    parsed = _enemies_from_json(_loaded)
-    if parsed:
-        ENEMIES = parsed
+_loaded = load_section("enemies")
+if _loaded:
+    ENEMIES = {key: EnemyDef(**kwargs) for key, kwargs in _loaded.items()}
 
 
 def spawn_enemy(enemy_id: str, *, x: int, y: int, floor: int, combat_level: int = 1, rng: Random) -> Enemy:
@@ -149,101 +123,3 @@ def spawn_enemy(enemy_id: str, *, x: int, y: int, floor: int, combat_level: int
         _attack_phase=rng.randint(0, max(0, d.attack_interval - 1)),
     )
 
-
-def enemy_table_for_dungeon(dungeon_id: str, floor: int) -> list[str]:
-    if dungeon_id == "nephil_dunes":
-        if floor <= 2:
-            return ["giant_scout", "giant_warrior"]
-        if floor <= 4:
-            return ["giant_scout", "giant_warrior", "giant_shaman"]
-        return ["giant_warrior", "giant_shaman", "giant_brute"]
-    if dungeon_id == "nephil_oasis":
-        if floor <= 2:
-            return ["giant_scout", "giant_shaman"]
-        if floor <= 4:
-            return ["giant_warrior", "giant_shaman", "giant_brute"]
-        return ["giant_warrior", "giant_shaman", "giant_brute"]
-    if dungeon_id == "nephil_tomb":
-        if floor <= 2:
-            return ["giant_warrior", "giant_shaman"]
-        if floor <= 4:
-            return ["giant_warrior", "giant_shaman", "giant_brute"]
-        return ["giant_warrior", "giant_shaman", "giant_brute"]
-    if dungeon_id == "collapsed_mines":
-        if floor <= 2:
-            return ["bat", "cult_saboteur"]
-        if floor <= 4:
-            return ["cult_saboteur", "cult_initiate", "raider"]
-        return ["cult_saboteur", "cult_initiate", "guardian"]
-    if dungeon_id == "deep_shaft":
-        if floor <= 2:
-            return ["cult_saboteur", "cult_initiate"]
-        if floor <= 4:
-            return ["cult_saboteur", "cult_initiate", "guardian"]
-        return ["cult_saboteur", "cult_initiate", "giant_scout"]
-    if dungeon_id == "children_hideout":
-        if floor <= 2:
-            return ["cult_saboteur", "cult_initiate"]
-        if floor <= 4:
-            return ["cult_saboteur", "cult_initiate", "raider"]
-        return ["cult_saboteur", "cult_initiate", "giant_scout"]
-    if dungeon_id == "babel_tower":
-        if floor <= 2:
-            return ["raider", "babel_scribe"]
-        if floor <= 4:
-            return ["babel_scribe", "babel_sentinel", "archer"]
-        return ["babel_scribe", "babel_sentinel", "guardian"]
-    if dungeon_id == "children_vault":
-        if floor <= 2:
-            return ["cult_saboteur", "cult_initiate"]
-        if floor <= 4:
-            return ["cult_saboteur", "cult_initiate", "children_enforcer"]
-        return ["cult_initiate", "children_enforcer", "giant_scout"]
-    if dungeon_id == "snowbound_path":
-        if floor <= 2:
-            return ["ice_wolf", "frost_wraith"]
-        if floor <= 4:
-            return ["ice_wolf", "frost_wraith", "ice_golem"]
-        return ["frost_wraith", "ice_golem"]
-    if dungeon_id == "ice_cave":
-        if floor <= 2:
-            return ["ice_wolf", "bat"]
-        if floor <= 4:
-            return ["ice_wolf", "frost_wraith", "bat"]
-        return ["frost_wraith", "ice_golem", "bat"]
-    if dungeon_id == "ice_cave_2":
-        if floor <= 2:
-            return ["frost_wraith", "ice_wolf"]
-        if floor <= 4:
-            return ["frost_wraith", "ice_golem", "ice_wolf"]
-        return ["ice_golem", "frost_wraith"]
-    if dungeon_id == "mt_arot":
-        if floor <= 2:
-            return ["frost_wraith", "ice_wolf"]
-        if floor <= 4:
-            return ["ice_wolf", "frost_wraith", "ice_golem"]
-        return ["ice_golem", "frost_wraith"]
-    if dungeon_id == "tropic_volcano":
-        if floor <= 2:
-            return ["ash_lizard", "raider"]
-        if floor <= 4:
-            return ["ash_lizard", "magma_wisp", "raider"]
-        return ["ash_lizard", "magma_wisp", "cult_initiate"]
-    if dungeon_id == "core_descent":
-        if floor <= 2:
-            return ["children_enforcer", "cult_initiate"]
-        if floor <= 4:
-            return ["children_enforcer", "magma_wisp", "cult_initiate"]
-        return ["children_enforcer", "magma_wisp", "guardian"]
-    if dungeon_id == "jungle_cavern":
-        if floor <= 2:
-            return ["snake", "bat"]
-        if floor <= 4:
-            return ["snake", "bat", "raider"]
-        return ["snake", "bat", "raider", "archer", "guardian"]
-    # temple_ruins default
-    if floor <= 2:
-        return ["raider", "bat"]
-    if floor <= 4:
-        return ["raider", "bat", "archer"]
-    return ["raider", "bat", "archer", "guardian"]
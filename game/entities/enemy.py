@@ -14,14 +14,15 @@ class Enemy:
     attack: int
     defense: int = 0
     aggro_range: int = 5
-    aggro_turns: int = 0
+    aggro_until: int = 0  # chases the player on turns before this one
     move_interval: int = 2
     attack_interval: int = 1
     behavior: str = "melee"
     ranged_range: int = 0
     poison_turns: int = 0
     poison_damage: int = 0
-    stunned_turns: int = 0
+    stunned_until: int = 0  # skips turns before this one
+    awake_until: int = 0  # woken by noise: not parked as dormant before this turn
     patrol_dx: int = 1
     _move_phase: int = 0
     _attack_phase: int = 0
@@ -34,3 +35,13 @@ class Enemy:
 
     def should_attack(self, turn: int) -> bool:
         return (turn + self._attack_phase) % max(1, self.attack_interval) == 0
+
+    def next_turn(self, turn: int, *, attacks: bool = True) -> int:
+        """First turn after `turn` on which the enemy may move (or, with `attacks`, attack)."""
+        t = turn + 1
+        interval = self.move_interval if self.move_interval > 1 else 1
+        tick = t + (-(t + self._move_phase)) % interval
+        if attacks and tick > t:
+            interval = self.attack_interval if self.attack_interval > 1 else 1
+            tick = min(tick, t + (-(t + self._attack_phase)) % interval)
+        return tick
@@ -0,0 +1,91 @@
+"""
+In-process event bus plus the GameState change events published on it.
+
+Handlers run synchronously inside the mutation that published the event, so keep them
+cheap (set a flag, bump a counter) and don't mutate GameState from them. Subscribing to a
+base class (e.g. `StateEvent`) receives every subclass too.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+
+class EventBus:
+    def __init__(self) -> None:
+        self._handlers: dict[type, list[Callable[[Any], None]]] = {}
+        self._dispatch: dict[type, tuple[Callable[[Any], None], ...]] = {}
+
+    def subscribe(self, event_type: type, handler: Callable[[Any], None]) -> Callable[[], None]:
+        """Returns a function that removes the handler again."""
+        self._handlers.setdefault(event_type, []).append(handler)
+        self._dispatch.clear()
+
+        def unsubscribe() -> None:
+            handlers = self._handlers.get(event_type, [])
+            if handler in handlers:
+                handlers.remove(handler)
+                self._dispatch.clear()
+
+        return unsubscribe
+
+    def publish(self, event: object) -> None:
+        handlers = self._dispatch.get(type(event))
+        if handlers is None:
+            # Resolve once per event type: handlers for the type and all its bases.
+            handlers = tuple(h for cls in type(event).__mro__ for h in self._handlers.get(cls, ()))
+            self._dispatch[type(event)] = handlers
+        for handler in handlers:
+            handler(event)
+
+
+@dataclass(frozen=True)
+class StateEvent:
+    pass
+
+
+@dataclass(frozen=True)
+class FieldChanged(StateEvent):
+    """A GameState field was assigned a different value (gold, hp, active_mission, ...)."""
+
+    field: str
+    old: Any
+    new: Any
+
+
+@dataclass(frozen=True)
+class FlagChanged(StateEvent):
+    flag: str
+    on: bool
+
+
+@dataclass(frozen=True)
+class ItemChanged(StateEvent):
+    item_id: str
+    delta: int
+    count: int
+
+
+@dataclass(frozen=True)
+class KillRecorded(StateEvent):
+    enemy_id: str
+    count: int
+
+
+@dataclass(frozen=True)
+class EquipmentChanged(StateEvent):
+    slot: str
+    item_id: str | None
+
+
+@dataclass(frozen=True)
+class MissionChanged(StateEvent):
+    mission_id: str
+    status: str  # "completed" | "claimed" | "reopened"
+
+
+@dataclass(frozen=True)
+class StateReplaced(StateEvent):
+    """The whole state was loaded or reset; consumers should rebuild from scratch."""
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
 
-from game.data_loader import load_json
+from game.data_pack import load_section
 
 
 @dataclass(frozen=True)
@@ -80,32 +79,10 @@ _DEFAULT_ITEMS: dict[str, ItemDef] = {
 }
 
 
-def _items_from_json(data: dict[str, Any]) -> dict[str, ItemDef]:
-    items: dict[str, ItemDef] = {}
-    for item_id, raw in data.items():
-        if not isinstance(raw, dict):
-            continue
-        items[item_id] = ItemDef(
-            item_id=item_id,
-            name=str(raw.get("name", item_id)),
-            description=str(raw.get("description", "")),
-            type=str(raw.get("type", "misc")),
-            buy_price=int(raw.get("buy_price", 0)),
-            sell_price=int(raw.get("sell_price", 0)),
-            usable_in_dungeon=bool(raw.get("usable_in_dungeon", False)),
-            slot=(str(raw["slot"]) if "slot" in raw and raw["slot"] is not None else None),
-            stats=(raw.get("stats") if isinstance(raw.get("stats"), dict) else None),
-            effects=(raw.get("effects") if isinstance(raw.get("effects"), dict) else None),
-        )
-    return items
-
-
 ITEMS: dict[str, ItemDef] = _DEFAULT_ITEMS
-_loaded = load_json("data/items.json")
-if isinstance(_loaded, dict):
-    parsed = _items_from_json(_loaded)
-    if parsed:
-        ITEMS = parsed
+_loaded = load_section("items")
+if _loaded:
+    ITEMS = {key: ItemDef(**kwargs) for key, kwargs in _loaded.items()}
 
 
 def get_item(item_id: str) -> ItemDef:
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+import pygame
+
+
+class MusicManager:
+    """
+    Scene music without the load hitch.
+    - Tracks are decoded into `pygame.mixer.Sound`s on a worker thread.
+    - The last few tracks stay decoded (LRU), so Town <-> Outskirts <-> Dungeon swaps are instant.
+    - Switching tracks crossfades between two reserved mixer channels.
+    Call `update()` once per frame to pick up finished decodes.
+    """
+
+    def __init__(self, *, cache_size: int = 3, fade_ms: int = 600) -> None:
+        self.cache_size = max(1, cache_size)
+        self.fade_ms = max(0, fade_ms)
+        self._cache: OrderedDict[Path, pygame.mixer.Sound] = OrderedDict()
+        self._loading: dict[Path, Future] = {}
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="music-decode")
+
+        # Two dedicated channels so SFX never steal the music voice.
+        pygame.mixer.set_reserved(2)
+        self._channels = (pygame.mixer.Channel(0), pygame.mixer.Channel(1))
+        self._active = 0
+
+        self._current: Path | None = None
+        self._wanted: tuple[Path, float, bool] | None = None
+        self._streaming = False
+
+    @property
+    def current(self) -> Path | None:
+        return self._current
+
+    def play(self, path: Path, *, volume: float = 0.5, loop: bool = True) -> None:
+        volume = max(0.0, min(1.0, volume))
+        if self._current == path:
+            # Also cancels a pending switch away from the track that is still playing.
+            self._wanted = None
+            if not self._streaming:
+                self._channels[self._active].set_volume(volume)
+            return
+        self._wanted = (path, volume, loop)
+        if path not in self._cache:
+            self.prefetch(path)
+        self.update()
+
+    def prefetch(self, path: Path) -> None:
+        if path in self._cache or path in self._loading:
+            return
+        self._loading[path] = self._executor.submit(pygame.mixer.Sound, str(path))
+
+    def update(self) -> None:
+        for path, future in list(self._loading.items()):
+            if not future.done():
+                continue
+            del self._loading[path]
+            try:
+                self._remember(path, future.result())
+            except Exception:
+                # Formats SDL_mixer can only stream (e.g. some MIDI/MP3 builds) fall back below.
+                if self._wanted is not None and self._wanted[0] == path:
+                    self._stream(*self._wanted)
+
+        if self._wanted is None:
+            return
+        path, volume, loop = self._wanted
+        sound = self._cache.get(path)
+        if sound is None:
+            return
+        self._cache.move_to_end(path)
+        self._crossfade(path, sound, volume=volume, loop=loop)
+
+    def stop(self) -> None:
+        self._wanted = None
+        self._current = None
+        for channel in self._channels:
+            self._fade_out(channel)
+        if self._streaming:
+            pygame.mixer.music.stop()
+            self._streaming = False
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _remember(self, path: Path, sound: pygame.mixer.Sound) -> None:
+        self._cache[path] = sound
+        self._cache.move_to_end(path)
+        while len(self._cache) > self.cache_size:
+            victim = next((p for p in self._cache if p != self._current), None)
+            if victim is None:
+                break
+            del self._cache[victim]
+
+    def _fade_out(self, channel: pygame.mixer.Channel) -> None:
+        if self.fade_ms:
+            channel.fadeout(self.fade_ms)
+        else:
+            channel.stop()
+
+    def _crossfade(self, path: Path, sound: pygame.mixer.Sound, *, volume: float, loop: bool) -> None:
+        if self._streaming:
+            pygame.mixer.music.fadeout(self.fade_ms)
+            self._streaming = False
+        old = self._channels[self._active]
+        if self._current is not None:
+            self._fade_out(old)
+        self._active = 1 - self._active
+        new = self._channels[self._active]
+        new.set_volume(volume)
+        new.play(sound, loops=-1 if loop else 0, fade_ms=self.fade_ms)
+        self._current = path
+        self._wanted = None
+
+    def _stream(self, path: Path, volume: float, loop: bool) -> None:
+        for channel in self._channels:
+            self._fade_out(channel)
+        try:
+            pygame.mixer.music.load(str(path))
+            pygame.mixer.music.set_volume(volume)
+            pygame.mixer.music.play(-1 if loop else 0, fade_ms=self.fade_ms)
+            self._streaming = True
+            self._current = path
+        except Exception:
+            pass
+        self._wanted = None
@@ -0,0 +1,167 @@
+"""
+Per-phase timing spans for frames and dungeon turns.
+
+`Profiler.enable(targets)` wraps each named method in a `perf_counter_ns` span. A target is
+a class (every instance is timed) or a single object. `disable()` puts the original
+methods back. Nothing is wrapped while the profiler is off, so the game runs exactly the
+code it would without it; collected stats survive a disable and can still be exported.
+
+Each span keeps a rolling window of recent samples for p50/p95 (the overlay reads these),
+plus lifetime count, total, max and a power-of-two histogram (bucket i holds samples
+shorter than 2**i ns) for the exports. Pure Python, no pygame: headless tools use it too.
+"""
+
+from __future__ import annotations
+
+import csv
+import functools
+import json
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+PROFILE_DIR = Path("saves/profile")
+
+# (object or class, method name, span name)
+Target = tuple[Any, str, str]
+
+_MISSING = object()
+
+
+class SpanStats:
+    __slots__ = ("recent", "count", "total_ns", "max_ns", "buckets")
+
+    def __init__(self, window: int) -> None:
+        self.recent: deque[int] = deque(maxlen=window)
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.buckets = [0] * 64
+
+    def add(self, ns: int) -> None:
+        self.recent.append(ns)
+        self.count += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+        self.buckets[min(63, ns.bit_length())] += 1
+
+    def percentiles(self, *qs: float) -> list[int]:
+        """Percentiles (0-100) of the rolling window, in ns; zeros if it's empty."""
+        ordered = sorted(self.recent)
+        if not ordered:
+            return [0 for _ in qs]
+        last = len(ordered) - 1
+        return [ordered[min(last, int(round(q / 100 * last)))] for q in qs]
+
+    def summary(self) -> dict[str, Any]:
+        p50, p95 = self.percentiles(50, 95)
+        return {
+            "count": self.count,
+            "total_ms": self.total_ns / 1e6,
+            "mean_us": self.total_ns / self.count / 1e3 if self.count else 0.0,
+            "p50_us": p50 / 1e3,
+            "p95_us": p95 / 1e3,
+            "window_max_us": max(self.recent, default=0) / 1e3,
+            "max_us": self.max_ns / 1e3,
+        }
+
+
+class Profiler:
+    def __init__(self, *, window: int = 600) -> None:
+        self.window = window
+        self.enabled = False
+        self.stats: dict[str, SpanStats] = {}
+        self._patched: list[tuple[Any, str, Any]] = []  # (target, attr, what its own __dict__ held)
+
+    def enable(self, targets: Iterable[Target]) -> None:
+        """Wraps every target's method in a span (no-op if already enabled)."""
+        if self.enabled:
+            return
+        self.enabled = True
+        for target, attr, name in targets:
+            own = vars(target).get(attr, _MISSING)
+            setattr(target, attr, self._timed(getattr(target, attr), self.span(name)))
+            self._patched.append((target, attr, own))
+
+    def disable(self) -> None:
+        """Restores the original methods; stats are kept."""
+        for target, attr, own in reversed(self._patched):
+            if own is _MISSING:
+                delattr(target, attr)
+            else:
+                setattr(target, attr, own)
+        self._patched.clear()
+        self.enabled = False
+
+    def span(self, name: str) -> SpanStats:
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = SpanStats(self.window)
+        return stats
+
+    def reset(self) -> None:
+        self.stats.clear()
+
+    def rows(self) -> list[tuple[str, dict[str, Any]]]:
+        return [(name, stats.summary()) for name, stats in sorted(self.stats.items())]
+
+    def export(self, directory: str | Path = PROFILE_DIR) -> tuple[Path, Path]:
+        """Writes `profile-<time>.csv` (one row per span) and `.json` (with histograms)."""
+        d = Path(directory)
+        d.mkdir(parents=True, exist_ok=True)
+        stem = d / time.strftime("profile-%Y%m%d-%H%M%S")
+        rows = self.rows()
+        csv_path, json_path = stem.with_suffix(".csv"), stem.with_suffix(".json")
+        with csv_path.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["span", "count", "total_ms", "mean_us", "p50_us", "p95_us", "window_max_us", "max_us"])
+            for name, row in rows:
+                writer.writerow([name] + [_round(v) for v in row.values()])
+        report = {
+            name: dict(
+                {k: _round(v) for k, v in row.items()},
+                # Upper bound of each non-empty bucket, in us.
+                histogram={f"<{(1 << i) / 1e3:g}": n for i, n in enumerate(self.stats[name].buckets) if n},
+            )
+            for name, row in rows
+        }
+        json_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        return csv_path, json_path
+
+    @staticmethod
+    def _timed(fn: Callable[..., Any], stats: SpanStats) -> Callable[..., Any]:
+        clock = time.perf_counter_ns
+        add = stats.add
+
+        @functools.wraps(fn)
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                add(clock() - start)
+
+        return timed
+
+
+def _round(value: Any) -> Any:
+    return round(value, 3) if isinstance(value, float) else value
+
+
+PROFILER = Profiler()
+
+
+def sim_targets() -> list[Target]:
+    """Dungeon turn phases. DungeonSim is imported here so app startup doesn't load the rules."""
+    from game.world.dungeon_sim import DungeonSim
+
+    return [
+        (DungeonSim, "step", "turn.step"),
+        (DungeonSim, "_enemy_turn", "turn.enemy_turn"),
+        (DungeonSim, "_reveal", "turn.reveal"),
+        (DungeonSim, "_populate_floor", "floor.populate"),
+        (DungeonSim, "_generate_floor", "floor.generate"),
+    ]
@@ -1,118 +1,235 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict
+import os
+import tempfile
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from game import save_codec, state_schema
+from game.events import StateReplaced
 from game.state import GameState, STATE
 
 
-SAVE_VERSION = 6
-DEFAULT_SAVE_PATH = Path("saves/save1.json")
+SAVE_VERSION = save_codec.SCHEMA_VERSION
+DEFAULT_SAVE_PATH = Path("saves/save1.sav")
 
+# Slots used to be pretty-printed JSON; they're still read if no binary save exists.
+LEGACY_SUFFIX = ".json"
 
-def save_state(path: str | Path = DEFAULT_SAVE_PATH, state: GameState = STATE) -> None:
+# The binary layout is declared by hand (it's versioned), so a new GameState field has to be
+# appended to save_codec.SCHEMA too; catch that at import, not at save time.
+_unsaved = sorted(set(state_schema.FIELD_KINDS) - set(save_codec.SCHEMA))
+if _unsaved:
+    raise RuntimeError(f"GameState fields missing from save_codec.SCHEMA: {_unsaved}")
+
+
+@dataclass(frozen=True)
+class SlotInfo:
+    """What the slot menu shows, read from a save's header without loading it."""
+
+    slot: int
+    path: Path
+    player_name: str
+    chapter: int
+    chapter_title: str
+    combat_level: int
+    gold: int
+    saved_at: float  # unix time
+    hash: str
+
+
+# fsync policies for write_save: "never" (fastest), "file" (data is on disk before the
+# rename), "dir" (also fsync the directory so the rename itself survives a power cut).
+FSYNC_POLICIES = ("never", "file", "dir")
+
+
+def save_state(path: str | Path = DEFAULT_SAVE_PATH, state: GameState = STATE, *, fsync: str = "file") -> None:
+    write_save(path, snapshot_state(state), fsync=fsync)
+
+
+def snapshot_state(state: GameState = STATE) -> dict[str, Any]:
+    """
+    Cheap main-thread copy of every field: scalars as-is, containers shallow-copied
+    (their contents are immutable). Safe to hand to another thread.
+    """
+    return state_schema.snapshot(state)
+
+
+def write_save(path: str | Path, snapshot: dict[str, Any], *, fsync: str = "file", meta: dict[str, Any] | None = None) -> None:
+    """
+    Serializes a snapshot and atomically replaces the save at `path` (temp file + os.replace),
+    so a crash mid-write leaves the previous save intact. A `.json` path gets the readable
+    JSON export; anything else gets the binary format from `game.save_codec`.
+    """
+    if fsync not in FSYNC_POLICIES:
+        raise ValueError(f"unknown fsync policy: {fsync}")
     p = Path(path)
     p.parent.mkdir(parents=True, exist_ok=True)
-    payload = _serialize_state(state)
-    p.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    data = encode_save(snapshot, as_json=p.suffix == LEGACY_SUFFIX, meta=meta)
+
+    fd, tmp = tempfile.mkstemp(dir=p.parent, prefix=f".{p.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            if fsync != "never":
+                os.fsync(f.fileno())
+        os.replace(tmp, p)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+    if fsync == "dir" and hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(p.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def encode_save(snapshot: dict[str, Any], *, as_json: bool = False, meta: dict[str, Any] | None = None) -> bytes:
+    """`meta` adds (or overrides) header entries on top of `save_meta(snapshot)`."""
+    meta = dict(save_meta(snapshot), **(meta or {}))
+    if as_json:
+        payload = _payload(snapshot)
+        state_json = json.dumps(payload["state"], sort_keys=True, separators=(",", ":")).encode("utf-8")
+        payload["meta"] = dict(meta, hash=save_codec.payload_hash(state_json))
+        return json.dumps(payload, indent=2, sort_keys=True).encode("utf-8")
+    return save_codec.encode(snapshot, meta=meta)
+
+
+def save_meta(snapshot: dict[str, Any]) -> dict[str, Any]:
+    from game.story.chapters import chapter_title
+
+    chapter = int(snapshot.get("chapter", 1))
+    return {
+        "player_name": str(snapshot.get("player_name", "")),
+        "chapter": chapter,
+        "chapter_title": chapter_title(chapter),
+        "combat_level": int(snapshot.get("combat_level", 1)),
+        "gold": int(snapshot.get("gold", 0)),
+        "saved_at": round(time.time(), 3),
+    }
+
+
+def decode_save(data: bytes) -> dict[str, Any]:
+    """Either format -> a `{"version", "state", "meta"}` payload."""
+    if save_codec.is_binary_save(data):
+        return save_codec.decode(data)
+    return json.loads(data.decode("utf-8"))
 
 
 def load_state(path: str | Path = DEFAULT_SAVE_PATH, state: GameState = STATE) -> bool:
     p = Path(path)
     if not p.exists():
         return False
-    payload = json.loads(p.read_text(encoding="utf-8"))
-    _apply_state(state, payload)
+    _apply_state(state, decode_save(p.read_bytes()))
     return True
 
 
 def reset_state(state: GameState = STATE) -> None:
-    state.flags.clear()
-    state.player_name = ""
-    state.gold = 50
-    state.max_hp = 20
-    state.hp = 20
-    state.base_attack = 4
-    state.base_defense = 0
-    state.combat_level = 1
-    state.combat_xp = 0
-    state.guild_rank = 1
-    state.guild_xp = 0
-    state.chapter = 1
-    state.mission_board = "guild"
-    state.inventory.clear()
-    state.equipment = {"weapon": None, "armor": None, "trinket": None}
-    state.completed_missions.clear()
-    state.claimed_missions.clear()
-    state.active_mission = None
-    state.kill_log.clear()
-    state.mission_kill_baseline.clear()
-    state.rescued_miners_total = 0
-    state.missions_turned_in_total = 0
-    state.relics_turned_in_total = 0
-    state.rival_missions = 0
-    state.rival_relics = 0
-    state.rival_rescues = 0
-    state.guard_turns = 0
-    state.poison_turns = 0
-    state.poison_damage = 0
+    state_schema.reset(state)
+    # Containers were cleared in place, which assignment tracking doesn't see.
+    for name, _ in state_schema.FIELD_KINDS:
+        state.touch(name)
+    state.invalidate_stats()
+    state.publish(StateReplaced())
+
+
+def slot_path(slot: int) -> Path:
+    return Path(f"saves/save{slot}.sav")
+
+
+def slot_exists(slot: int) -> bool:
+    p = slot_path(slot)
+    return p.exists() or p.with_suffix(LEGACY_SUFFIX).exists()
+
+
+def slot_info(slot: int) -> SlotInfo | None:
+    p = slot_path(slot)
+    if not p.exists():
+        p = p.with_suffix(LEGACY_SUFFIX)
+    return read_info(p, slot=slot)
+
+
+def read_info(path: str | Path, *, slot: int = 0) -> SlotInfo | None:
+    """
+    Header-only read for binary saves. Legacy JSON saves (and binary saves without a meta
+    block) are parsed in full. None if the file is missing or unreadable.
+    """
+    p = Path(path)
+    if not p.exists():
+        return None
+    try:
+        with p.open("rb") as f:
+            meta = save_codec.read_meta(f)
+        if not meta:
+            payload = decode_save(p.read_bytes())
+            meta = payload.get("meta")
+            if not meta:
+                scratch = GameState()
+                _apply_state(scratch, payload)
+                meta = dict(save_meta(snapshot_state(scratch)), saved_at=p.stat().st_mtime)
+        return SlotInfo(
+            slot=slot,
+            path=p,
+            player_name=str(meta.get("player_name", "")),
+            chapter=int(meta.get("chapter", 1)),
+            chapter_title=str(meta.get("chapter_title", "")),
+            combat_level=int(meta.get("combat_level", 1)),
+            gold=int(meta.get("gold", 0)),
+            saved_at=float(meta.get("saved_at") or p.stat().st_mtime),
+            hash=str(meta.get("hash", "")),
+        )
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def list_slots(slots: Iterable[int] = (1, 2, 3)) -> dict[int, SlotInfo | None]:
+    return {slot: slot_info(slot) for slot in slots}
 
 
 def save_slot(slot: int, state: GameState = STATE) -> None:
-    save_state(Path(f"saves/save{slot}.json"), state=state)
+    save_state(slot_path(slot), state=state)
 
 
 def load_slot(slot: int, state: GameState = STATE) -> bool:
-    return load_state(Path(f"saves/save{slot}.json"), state=state)
+    p = slot_path(slot)
+    if not p.exists():
+        p = p.with_suffix(LEGACY_SUFFIX)
+    return load_state(p, state=state)
 
 
 def _serialize_state(state: GameState) -> dict[str, Any]:
-    d = asdict(state)
-    d["flags"] = sorted(list(state.flags))
-    d["completed_missions"] = sorted(list(state.completed_missions))
-    d["claimed_missions"] = sorted(list(state.claimed_missions))
-    return {"version": SAVE_VERSION, "state": d}
+    return _payload(snapshot_state(state))
+
+
+def _payload(snapshot: dict[str, Any]) -> dict[str, Any]:
+    return {"version": SAVE_VERSION, "state": state_schema.json_fields(snapshot)}
 
 
 def _apply_state(state: GameState, payload: dict[str, Any]) -> None:
-    version = int(payload.get("version", 0))
-    if version != SAVE_VERSION:
-        # Simple strategy for now: attempt best-effort load of common fields.
-        pass
-
-    data = payload.get("state", {})
-    state.flags = set(data.get("flags", []))
-    state.player_name = str(data.get("player_name", ""))[:24]
-    state.gold = int(data.get("gold", 50))
-    state.max_hp = int(data.get("max_hp", 20))
-    state.hp = int(data.get("hp", state.max_hp))
-    state.base_attack = int(data.get("base_attack", 4))
-    state.base_defense = int(data.get("base_defense", 0))
-    state.combat_level = int(data.get("combat_level", 1))
-    state.combat_xp = int(data.get("combat_xp", 0))
-    state.guild_rank = int(data.get("guild_rank", 1))
-    state.guild_xp = int(data.get("guild_xp", 0))
-    state.chapter = int(data.get("chapter", max(1, min(10, state.guild_rank))))
-    state.mission_board = str(data.get("mission_board", "guild"))
-    state.inventory = {str(k): int(v) for k, v in (data.get("inventory", {}) or {}).items()}
-    equip = data.get("equipment", {}) or {}
-    state.equipment = {"weapon": equip.get("weapon", None), "armor": equip.get("armor", None), "trinket": equip.get("trinket", None)}
-    state.completed_missions = set(data.get("completed_missions", []))
-    state.claimed_missions = set(data.get("claimed_missions", []))
-    state.active_mission = data.get("active_mission", None)
-    state.kill_log = {str(k): int(v) for k, v in (data.get("kill_log", {}) or {}).items()}
-    state.mission_kill_baseline = {str(k): int(v) for k, v in (data.get("mission_kill_baseline", {}) or {}).items()}
-    state.rescued_miners_total = int(data.get("rescued_miners_total", 0))
-    state.missions_turned_in_total = int(data.get("missions_turned_in_total", 0))
-    state.relics_turned_in_total = int(data.get("relics_turned_in_total", 0))
-    state.rival_missions = int(data.get("rival_missions", 0))
-    state.rival_relics = int(data.get("rival_relics", 0))
-    state.rival_rescues = int(data.get("rival_rescues", 0))
-    state.guard_turns = int(data.get("guard_turns", 0))
-    state.poison_turns = int(data.get("poison_turns", 0))
-    state.poison_damage = int(data.get("poison_damage", 0))
+    # Older JSON saves load best-effort, with missing fields falling back to their defaults.
+    data = payload.get("state", {}) or {}
+    if payload.get("typed"):
+        state_schema.apply_decoded(state, data)
+    else:
+        state_schema.apply_fields(state, data)
+    state.invalidate_stats()
+
+    # Defaults that depend on other fields.
+    if "hp" not in data:
+        state.hp = state.max_hp
+    if "chapter" not in data:
+        state.chapter = max(1, min(10, state.guild_rank))
 
     # Clamp after load (handles max_hp bonus items, older saves, etc.)
     state.hp = max(0, min(state.hp, state.max_hp_total()))
+    state.publish(StateReplaced())
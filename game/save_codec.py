@@ -0,0 +1,289 @@
+"""
+Compact binary save format.
+
+Layout (little-endian):
+    header    "<4sHHI"  magic b"CCDS", schema version, flags (bit 0: zlib, bit 1: meta), payload length
+    meta      only with bit 1: "<H" length + UTF-8 JSON object (slot menu info, payload hash)
+    payload   sections, each "<HI" (field index, byte length) followed by the field's bytes
+
+The meta block sits before the payload so `read_meta` can list slots by reading a few
+hundred bytes per file.
+
+Field indexes refer to SCHEMA. Sections with an unknown index are skipped, so new fields
+can be appended to the schema without breaking older readers.
+
+Saves are zlib-compressed (level 1) by default: a late-campaign save shrinks about 4.5x,
+which keeps autosave snapshots and slot writes small. Inflating costs well under a
+millisecond, and decoded fields are applied without a coercion pass (`"typed"`), so a
+compressed load still beats a JSON one (tools/bench_save.py).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import struct
+import zlib
+from collections.abc import Callable
+from typing import Any, BinaryIO
+
+
+MAGIC = b"CCDS"
+FLAG_ZLIB = 1
+FLAG_META = 2
+
+_HEADER = struct.Struct("<4sHHI")
+_META_LEN = struct.Struct("<H")
+_SECTION = struct.Struct("<HI")
+_COUNTS = struct.Struct("<II")
+_INT = struct.Struct("<q")
+
+# Field kinds.
+INT = "int"
+STR = "str"
+OPT_STR = "opt_str"
+STR_SET = "str_set"  # set/list of non-empty ids, stored sorted and NUL-joined
+STR_INT_MAP = "str_int_map"  # id -> count
+STR_OPT_STR_MAP = "str_opt_str_map"  # equipment slot -> item id | None
+
+Schema = tuple[tuple[str, str], ...]
+
+# The binary format started at save version 6; there is no older binary layout. Only append
+# to the schema. A field changing meaning or type needs a new version, its old layout kept
+# here and a conversion in `decode`.
+SCHEMA_VERSION = 6
+SCHEMA: Schema = (
+    ("flags", STR_SET),
+    ("player_name", STR),
+    ("gold", INT),
+    ("max_hp", INT),
+    ("hp", INT),
+    ("base_attack", INT),
+    ("base_defense", INT),
+    ("combat_level", INT),
+    ("combat_xp", INT),
+    ("guild_rank", INT),
+    ("guild_xp", INT),
+    ("chapter", INT),
+    ("mission_board", STR),
+    ("inventory", STR_INT_MAP),
+    ("equipment", STR_OPT_STR_MAP),
+    ("completed_missions", STR_SET),
+    ("claimed_missions", STR_SET),
+    ("active_mission", OPT_STR),
+    ("kill_log", STR_INT_MAP),
+    ("mission_kill_baseline", STR_INT_MAP),
+    ("rescued_miners_total", INT),
+    ("missions_turned_in_total", INT),
+    ("relics_turned_in_total", INT),
+    ("rival_missions", INT),
+    ("rival_relics", INT),
+    ("rival_rescues", INT),
+    ("guard_turns", INT),
+    ("poison_turns", INT),
+    ("poison_damage", INT),
+)
+
+
+def is_binary_save(data: bytes) -> bool:
+    return data[:4] == MAGIC
+
+
+def payload_hash(payload: bytes) -> str:
+    return hashlib.blake2b(payload, digest_size=8).hexdigest()
+
+
+def encode(fields: dict[str, Any], *, compress: bool = True, meta: dict[str, Any] | None = None) -> bytes:
+    """`meta` (JSON-able) is stored ahead of the payload together with the payload's hash."""
+    parts: list[bytes] = []
+    for index, (name, kind) in enumerate(SCHEMA):
+        if name not in fields:
+            continue
+        blob = _ENCODERS[kind](fields[name])
+        parts.append(_SECTION.pack(index, len(blob)))
+        parts.append(blob)
+    payload = b"".join(parts)
+    flags = 0
+    if compress:
+        payload = zlib.compress(payload, 1)
+        flags |= FLAG_ZLIB
+    meta_block = b""
+    if meta is not None:
+        flags |= FLAG_META
+        meta_json = json.dumps(dict(meta, hash=payload_hash(payload)), separators=(",", ":")).encode("utf-8")
+        meta_block = _META_LEN.pack(len(meta_json)) + meta_json
+    return _HEADER.pack(MAGIC, SCHEMA_VERSION, flags, len(payload)) + meta_block + payload
+
+
+def read_meta(f: BinaryIO) -> dict[str, Any] | None:
+    """
+    Reads just the header (and meta block) from an open binary file. Returns None if it
+    isn't a binary save, `{}` if it was written without meta.
+    """
+    head = f.read(_HEADER.size)
+    if len(head) < _HEADER.size or head[:4] != MAGIC:
+        return None
+    _, _, flags, _ = _HEADER.unpack(head)
+    if not flags & FLAG_META:
+        return {}
+    size_bytes = f.read(_META_LEN.size)
+    if len(size_bytes) < _META_LEN.size:
+        raise ValueError("truncated save meta")
+    (size,) = _META_LEN.unpack(size_bytes)
+    block = f.read(size)
+    if len(block) < size:
+        raise ValueError("truncated save meta")
+    return _meta_object(block)
+
+
+def decode(data: bytes) -> dict[str, Any]:
+    """
+    Returns a `{"version", "state", "meta"}` payload (same shape as the JSON save).
+    Anything malformed raises ValueError. `"typed": True` marks the fields as already
+    holding GameState's types in fresh containers (see state_schema.apply_decoded).
+    """
+    try:
+        return _decode(data)
+    except (struct.error, zlib.error) as e:
+        raise ValueError(f"corrupt save: {e}") from None
+
+
+def _decode(data: bytes) -> dict[str, Any]:
+    if len(data) < _HEADER.size:
+        raise ValueError("truncated save header")
+    magic, version, flags, length = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError("not a binary save")
+    if version != SCHEMA_VERSION:
+        raise ValueError(f"unsupported save version {version}")
+    start = _HEADER.size
+    meta: dict[str, Any] = {}
+    if flags & FLAG_META:
+        (size,) = _META_LEN.unpack_from(data, start)
+        block = data[start + _META_LEN.size : start + _META_LEN.size + size]
+        if len(block) != size:
+            raise ValueError("truncated save meta")
+        meta = _meta_object(block)
+        start += _META_LEN.size + size
+    payload = data[start : start + length]
+    if len(payload) != length:
+        raise ValueError("truncated save payload")
+    if "hash" in meta and payload_hash(payload) != meta["hash"]:
+        raise ValueError("save payload is corrupt (hash mismatch)")
+    if flags & FLAG_ZLIB:
+        payload = zlib.decompress(payload)
+
+    schema = SCHEMA
+    fields: dict[str, Any] = {}
+    view = memoryview(payload)
+    pos = 0
+    while pos < len(payload):
+        index, size = _SECTION.unpack_from(payload, pos)
+        pos += _SECTION.size
+        if pos + size > len(payload):
+            raise ValueError("truncated save section")
+        if index < len(schema):
+            name, kind = schema[index]
+            fields[name] = _DECODERS[kind](view[pos : pos + size])
+        pos += size
+    return {"version": version, "state": fields, "meta": meta, "typed": True}
+
+
+def _meta_object(block: bytes) -> dict[str, Any]:
+    meta = json.loads(block.decode("utf-8"))
+    if not isinstance(meta, dict):
+        raise ValueError("save meta is not an object")
+    return meta
+
+
+def _join(strings, *, allow_empty: bool = False) -> bytes:
+    # An empty blob decodes as no strings, so [""] would come back as []: ids must be non-empty.
+    if not allow_empty and not all(strings):
+        raise ValueError("save ids may not be empty")
+    joined = "\0".join(strings)
+    if joined.count("\0") != max(0, len(strings) - 1):
+        raise ValueError("save ids may not contain NUL")
+    return joined.encode("utf-8")
+
+
+def _split(blob: memoryview) -> list[str]:
+    return bytes(blob).decode("utf-8").split("\0") if len(blob) else []
+
+
+def _enc_int(value: Any) -> bytes:
+    return _INT.pack(int(value))
+
+
+def _dec_int(blob: memoryview) -> int:
+    return _INT.unpack(blob)[0]
+
+
+def _enc_str(value: Any) -> bytes:
+    return str(value).encode("utf-8")
+
+
+def _dec_str(blob: memoryview) -> str:
+    return bytes(blob).decode("utf-8")
+
+
+def _enc_opt_str(value: Any) -> bytes:
+    return b"" if value is None else b"\x01" + str(value).encode("utf-8")
+
+
+def _dec_opt_str(blob: memoryview) -> str | None:
+    return bytes(blob[1:]).decode("utf-8") if len(blob) else None
+
+
+def _enc_str_set(value: Any) -> bytes:
+    return _join(sorted(value))
+
+
+def _dec_str_set(blob: memoryview) -> set[str]:
+    return set(_split(blob))
+
+
+def _enc_str_int_map(value: dict[str, int]) -> bytes:
+    keys = _join(list(value))
+    return _COUNTS.pack(len(value), len(keys)) + keys + struct.pack(f"<{len(value)}q", *map(int, value.values()))
+
+
+def _dec_str_int_map(blob: memoryview) -> dict[str, int]:
+    count, keys_len = _COUNTS.unpack_from(blob, 0)
+    start = _COUNTS.size
+    keys = _split(blob[start : start + keys_len])
+    values = struct.unpack_from(f"<{count}q", blob, start + keys_len)
+    return dict(zip(keys, values))
+
+
+def _enc_str_opt_str_map(value: dict[str, str | None]) -> bytes:
+    # Alternating key, value; an empty value stands for None (item ids are never empty). Always
+    # an even number of strings, so empty values round-trip.
+    flat: list[str] = []
+    for k, v in value.items():
+        flat.append(k)
+        flat.append(v or "")
+    return _join(flat, allow_empty=True)
+
+
+def _dec_str_opt_str_map(blob: memoryview) -> dict[str, str | None]:
+    parts = _split(blob)
+    return {k: (v or None) for k, v in zip(parts[0::2], parts[1::2])}
+
+
+_ENCODERS: dict[str, Callable[[Any], bytes]] = {
+    INT: _enc_int,
+    STR: _enc_str,
+    OPT_STR: _enc_opt_str,
+    STR_SET: _enc_str_set,
+    STR_INT_MAP: _enc_str_int_map,
+    STR_OPT_STR_MAP: _enc_str_opt_str_map,
+}
+
+_DECODERS: dict[str, Callable[[memoryview], Any]] = {
+    INT: _dec_int,
+    STR: _dec_str,
+    OPT_STR: _dec_opt_str,
+    STR_SET: _dec_str_set,
+    STR_INT_MAP: _dec_str_int_map,
+    STR_OPT_STR_MAP: _dec_str_opt_str_map,
+}
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+
+from game.save import slot_path, snapshot_state, write_save
+from game.state import GameState, STATE
+
+
+class SaveService:
+    """
+    Saves without a frame hitch: `save()` snapshots GameState on the calling (main) thread,
+    then encoding and the atomic write run on a single worker thread, in request order.
+    Completion callbacks are delivered back on the main thread from `update()`.
+    """
+
+    def __init__(self, *, fsync: str = "file") -> None:
+        self.fsync = fsync
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="save")
+        self._pending: list[tuple[Future, Callable[[bool], None] | None]] = []
+
+    def save(
+        self,
+        path: str | Path,
+        state: GameState = STATE,
+        *,
+        on_done: Callable[[bool], None] | None = None,
+    ) -> Future:
+        snapshot = snapshot_state(state)
+        return self.submit(write_save, path, snapshot, fsync=self.fsync, on_done=on_done)
+
+    def submit(self, fn: Callable[..., object], *args, on_done: Callable[[bool], None] | None = None, **kwargs) -> Future:
+        """Runs `fn` on the save worker, ordered with every other queued save."""
+        future = self._executor.submit(fn, *args, **kwargs)
+        self._pending.append((future, on_done))
+        return future
+
+    def save_slot(self, slot: int, state: GameState = STATE, *, on_done: Callable[[bool], None] | None = None) -> Future:
+        return self.save(slot_path(slot), state, on_done=on_done)
+
+    @property
+    def busy(self) -> bool:
+        return any(not f.done() for f, _ in self._pending)
+
+    def update(self) -> None:
+        """Call once per frame: runs callbacks for saves that finished."""
+        still_pending: list[tuple[Future, Callable[[bool], None] | None]] = []
+        finished: list[tuple[Callable[[bool], None], bool]] = []
+        for future, on_done in self._pending:
+            if not future.done():
+                still_pending.append((future, on_done))
+            elif on_done is not None:
+                finished.append((on_done, future.exception() is None))
+        # Swap first: a callback may queue another save.
+        self._pending = still_pending
+        for on_done, ok in finished:
+            on_done(ok)
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Blocks until queued saves are on disk (call before loading a slot or quitting)."""
+        wait([f for f, _ in self._pending], timeout=timeout)
+        self.update()
+
+    def shutdown(self) -> None:
+        self.flush()
+        self._executor.shutdown(wait=True)
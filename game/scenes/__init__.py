@@ -1,4 +1,5 @@
 from game.scenes.base import Scene
+from game.scenes.registry import SceneRef, make_scene, resolve_scene, scene_class
 
-__all__ = ["Scene"]
+__all__ = ["Scene", "SceneRef", "make_scene", "resolve_scene", "scene_class"]
 
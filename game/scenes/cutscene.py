@@ -7,6 +7,7 @@ import pygame
 from game.assets_manifest import PATHS
 from game.constants import COLOR_BG, COLOR_TEXT
 from game.scenes.base import Scene
+from game.scenes.registry import SceneRef, resolve_scene
 from game.state import STATE
 
 
@@ -44,7 +45,7 @@ class CutsceneScene(Scene):
         app,
         *,
         pages: list[CutscenePage],
-        next_scene: Scene,
+        next_scene: SceneRef,
         music: str = "title.ogg",
     ) -> None:
         super().__init__(app)
@@ -68,13 +69,13 @@ class CutsceneScene(Scene):
 
         if event.key == pygame.K_ESCAPE:
             self.app.audio.play_sfx(PATHS.sfx / "ui_close.wav", volume=0.35)
-            return self.next_scene
+            return resolve_scene(self.app, self.next_scene)
 
         if event.key in (pygame.K_RETURN, pygame.K_KP_ENTER, pygame.K_SPACE, pygame.K_e):
             self.index += 1
             self.app.audio.play_sfx(PATHS.sfx / "confirm.wav", volume=0.30)
             if self.index >= len(self.pages):
-                return self.next_scene
+                return resolve_scene(self.app, self.next_scene)
         return None
 
     def update(self, dt: float) -> Scene | None:
@@ -1,5 +1,3 @@
-import random
-
 import pygame
 
 from game.anim import DirectionalStepAnimator
@@ -24,18 +22,41 @@ from game.constants import (
     TILE_SIZE,
 )
 from game.assets import load_sprite_variants, pick_variant, try_load_sprite
-from game.enemies import enemy_table_for_dungeon, spawn_enemy
-from game.entities.enemy import Enemy
-from game.entities.pickup import Pickup
-from game.entities.player import GridPlayer
-from game.items import ITEMS, get_item
+from game.items import get_item
 from game.scenes.base import Scene
 from game.state import STATE
 from game.story.missions import MISSIONS
-from game.story.quest_manager import is_mission_complete, mission_objective_text
-from game.world.dungeon_gen import generate_dungeon
+from game.story.quest_manager import mission_objective_text
 from game.world.dungeon_run import DungeonRun
-from game.save import save_slot
+from game.world.replay import RunRecording, save_run
+from game.world.dungeon_sim import (
+    SKILLS,
+    Action,
+    ActionFailed,
+    CombatLevelUp,
+    DungeonEscaped,
+    DungeonSim,
+    FloorChanged,
+    Guarding,
+    ItemGained,
+    ItemUsed,
+    MissionCompleted,
+    Move,
+    PlayerAttacked,
+    PlayerDied,
+    PlayerHit,
+    PlayerStepped,
+    Regenerate,
+    RescuesCommitted,
+    Rescued,
+    SimEvent,
+    UseItem,
+    UseSkill,
+    UseStairs,
+)
+
+# GameState fields the mission HUD line depends on.
+_MISSION_HUD_FIELDS = ("active_mission", "rescued_miners_total")
 
 
 class DungeonScene(Scene):
@@ -45,16 +66,13 @@ class DungeonScene(Scene):
         self.run = run
         self.return_to = return_to
         self.app.audio.play_music(PATHS.music / "dungeon.ogg", volume=0.45)
-        self.rng = random.Random(self.run.seed_for_floor(self.run.floor))
-
-        self.grid: list[list[int]] = []
-        self.player: GridPlayer
-        self.enemies: list[Enemy] = []
-        self.pickups: list[Pickup] = []
-
-        self.grid = self._generate_floor()
-        self.player = self._spawn_player()
-        self._populate_floor()
+        # All the rules live in the sim; this scene turns keys into actions and renders.
+        # Every action is recorded too, so a finished run can be replayed (tools/replay.py).
+        self.recording = RunRecording.start(run)
+        self.sim = DungeonSim(run)
+        self.recording.begin(self.sim)
+        # Revision-keyed (see GameState.field_revision): rebuilt only when the mission changes.
+        self._mission_hud: tuple[tuple, str] | None = None
 
         self.player_idle = {
             "down": try_load_sprite(PATHS.sprites / "player_down.png", size=(TILE_SIZE, TILE_SIZE)),
@@ -128,158 +146,27 @@ class DungeonScene(Scene):
             TILE_DUNGEON_EXIT: try_load_sprite(PATHS.tiles / "exit.png", size=(TILE_SIZE, TILE_SIZE)),
         }
         self.visual_seed = self.run.seed_for_floor(self.run.floor) % 100000
-        self.message = ""
         self.inventory_open = False
         self.inventory_index = 0
         self.pending_scene: Scene | None = None
-        self.turn = 0
         self.minimap_open = True
-        self.seen = [[False for _ in range(GRID_WIDTH)] for _ in range(GRID_HEIGHT)]
-        self.kills = 0
-        self.gold_gained = 0
-        self.items_gained: dict[str, int] = {}
         self.skills_open = False
         self.skill_index = 0
-        self.rescued_in_run = 0
-        self.rescued_head_miner = False
-        self.rescued_rival = False
-        self._rescues_committed = False
-        self._reveal()
-
-    def _generate_floor(self) -> list[list[int]]:
-        self.rng = random.Random(self.run.seed_for_floor(self.run.floor))
-        self.visual_seed = self.run.seed_for_floor(self.run.floor) % 100000
-        grid = generate_dungeon(
-            GRID_WIDTH,
-            GRID_HEIGHT,
-            seed=self.run.seed_for_floor(self.run.floor),
-            place_stairs_up=self.run.floor > 1,
-            place_stairs_down=self.run.floor < self.run.max_floor,
-        )
-        if self.run.floor >= self.run.max_floor:
-            pos = _find_tile(grid, TILE_FLOOR)
-            if pos is not None:
-                x, y = pos
-                grid[y][x] = TILE_DUNGEON_EXIT
-        return grid
-
-    def _spawn_player(self) -> GridPlayer:
-        if self.run.floor > 1:
-            pos = _find_tile(self.grid, TILE_STAIRS_UP)
-            if pos is not None:
-                return GridPlayer(*pos)
-        pos = _find_tile(self.grid, TILE_FLOOR)
-        if pos is not None:
-            return GridPlayer(*pos)
-        return GridPlayer.spawn_on_floor(self.grid)
 
-    def _populate_floor(self) -> None:
-        self.enemies.clear()
-        self.pickups.clear()
+    # Read-only views of the sim for drawing.
+    grid = property(lambda self: self.sim.grid)
+    player = property(lambda self: self.sim.player)
+    enemies = property(lambda self: self.sim.enemies)
+    pickups = property(lambda self: self.sim.pickups)
+    seen = property(lambda self: self.sim.seen)
 
-        # Enemies and pickups are seeded per floor to stay stable until regen.
-        floor_cells = _all_floor_like(self.grid)
-        self.rng.shuffle(floor_cells)
-
-        enemy_count = max(1, 2 + self.run.floor // 2)
-        difficulty_floor = self.run.floor + max(0, STATE.combat_level - 1) // 3
-        table = enemy_table_for_dungeon(self.run.dungeon_id, difficulty_floor)
-        for _ in range(enemy_count):
-            if not floor_cells:
-                break
-            x, y = floor_cells.pop()
-            if (x, y) == (self.player.x, self.player.y):
-                continue
-            if self.grid[y][x] in (TILE_STAIRS_DOWN, TILE_STAIRS_UP):
-                continue
-            enemy_id = self.rng.choice(table)
-            self.enemies.append(spawn_enemy(enemy_id, x=x, y=y, floor=self.run.floor, combat_level=STATE.combat_level, rng=self.rng))
-
-        # Boss: place the Mummified King on the final floor of the Nephil tomb.
-        if self.run.dungeon_id == "nephil_tomb" and self.run.floor >= self.run.max_floor:
-            boss_id = "mummy_king"
-            if not any(e.enemy_id == boss_id for e in self.enemies):
-                candidates = [c for c in floor_cells if abs(c[0] - self.player.x) + abs(c[1] - self.player.y) >= 8]
-                x, y = (candidates[0] if candidates else (floor_cells[0] if floor_cells else (self.player.x + 2, self.player.y)))
-                # Remove from available cells if present
-                if (x, y) in floor_cells:
-                    floor_cells.remove((x, y))
-                self.enemies.append(spawn_enemy(boss_id, x=x, y=y, floor=self.run.floor, combat_level=STATE.combat_level, rng=self.rng))
-
-        # Chapter 7–9 bosses (story beats on final floors).
-        if self.run.floor >= self.run.max_floor:
-            boss_by_dungeon = {
-                "mt_arot": "ice_colossus",
-                "tropic_volcano": "children_warmaster",
-                "core_descent": "children_high_priest",
-            }
-            boss_id = boss_by_dungeon.get(self.run.dungeon_id)
-            if boss_id and not any(e.enemy_id == boss_id for e in self.enemies):
-                candidates = [c for c in floor_cells if abs(c[0] - self.player.x) + abs(c[1] - self.player.y) >= 8]
-                x, y = (candidates[0] if candidates else (floor_cells[0] if floor_cells else (self.player.x + 2, self.player.y)))
-                if (x, y) in floor_cells:
-                    floor_cells.remove((x, y))
-                self.enemies.append(spawn_enemy(boss_id, x=x, y=y, floor=self.run.floor, combat_level=STATE.combat_level, rng=self.rng))
-
-        # A couple simple pickups
-        for _ in range(2):
-            if not floor_cells:
-                break
-            x, y = floor_cells.pop()
-            if self.grid[y][x] in (TILE_STAIRS_DOWN, TILE_STAIRS_UP):
-                continue
-            self.pickups.append(Pickup(item_id="potion_small", x=x, y=y))
+    @property
+    def message(self) -> str:
+        return self.sim.message
 
-        # Rare-ish relic shard
-        if self.rng.random() < 0.35 and floor_cells:
-            x, y = floor_cells.pop()
-            self.pickups.append(Pickup(item_id="relic_shard", x=x, y=y))
-
-        # Chapter 3: miners trapped in collapsed mines / deep shaft.
-        if self.run.dungeon_id in ("collapsed_mines", "deep_shaft") and floor_cells:
-            miner_count = 2 + (self.run.floor // 2)
-            for _ in range(miner_count):
-                if not floor_cells:
-                    break
-                x, y = floor_cells.pop()
-                self.pickups.append(Pickup(item_id="trapped_miner", x=x, y=y))
-            if self.run.dungeon_id == "deep_shaft" and self.run.floor >= self.run.max_floor and floor_cells:
-                x, y = floor_cells.pop()
-                self.pickups.append(Pickup(item_id="head_miner", x=x, y=y))
-
-        # Chapter 4: hostage rescue (rival held by the Children).
-        if self.run.dungeon_id == "children_hideout" and self.run.floor >= self.run.max_floor and floor_cells:
-            x, y = floor_cells.pop()
-            self.pickups.append(Pickup(item_id="rival_hostage", x=x, y=y))
-
-        # Mission items (rescue/collect style): ensure at least a chance to find them during a run.
-        mission_id = STATE.active_mission
-        mission = MISSIONS.get(mission_id) if mission_id else None
-        if mission is not None:
-            for obj in mission.objectives:
-                if str(obj.get("type", "")) != "collect_item":
-                    continue
-                item_id = str(obj.get("item_id", ""))
-                if not item_id or item_id == "relic_shard":
-                    continue
-                # Boss-granted story items (kept off the random floor-spawn system).
-                if item_id in ("arrowhead_map", "arrowhead_tip"):
-                    continue
-                if STATE.item_count(item_id) > 0:
-                    continue
-                if not floor_cells:
-                    break
-                # For the Nephil crown, prefer placing it on the final floor.
-                if item_id == "nephil_relic_crown" and (self.run.dungeon_id != "nephil_tomb" or self.run.floor < self.run.max_floor):
-                    continue
-                # For Nimrod's Bow, place only at the bottom of the Tower/Vault.
-                if item_id == "nimrods_bow" and (
-                    (self.run.dungeon_id not in ("babel_tower", "children_vault")) or self.run.floor < self.run.max_floor
-                ):
-                    continue
-                if self.rng.random() < 0.75:
-                    x, y = floor_cells.pop()
-                    self.pickups.append(Pickup(item_id=item_id, x=x, y=y))
+    @message.setter
+    def message(self, text: str) -> None:
+        self.sim.message = text
 
     def handle_event(self, event: pygame.event.Event) -> Scene | None:
         if self.pending_scene is not None:
@@ -340,27 +227,73 @@ class DungeonScene(Scene):
             elif event.key in (pygame.K_DOWN, pygame.K_s):
                 dy = 1
             elif event.key == pygame.K_r:
-                self.grid = self._generate_floor()
-                self.player = self._spawn_player()
-                self._populate_floor()
-                self.seen = [[False for _ in range(GRID_WIDTH)] for _ in range(GRID_HEIGHT)]
-                self._reveal()
-                return None
+                return self._act(Regenerate())
             elif event.key == pygame.K_e:
-                next_scene = self._try_use_stairs()
-                if next_scene is None:
-                    self._enemy_turn()
-                    self._reveal()
-                return next_scene
+                return self._act(UseStairs())
 
             if dx != 0 or dy != 0:
-                acted = self._try_player_step(dx, dy)
-                if acted:
-                    self._enemy_turn()
-                    self._reveal()
+                return self._act(Move(dx, dy))
 
         return None
 
+    def _act(self, action: Action) -> Scene | None:
+        events = self.sim.step(action)
+        self.recording.record(action, self.sim)
+        return self._handle_sim_events(events)
+
+    def _handle_sim_events(self, events: list[SimEvent]) -> Scene | None:
+        """Sounds, toasts, autosaves and scene changes for what the sim reported."""
+        sfx = self.app.audio.play_sfx
+        for event in events:
+            if isinstance(event, ActionFailed):
+                sfx(PATHS.sfx / "error.wav", volume=0.40)
+            elif isinstance(event, PlayerStepped):
+                if self.player_anim is not None:
+                    self.player_anim.on_step(event.dx, event.dy)
+                sfx(PATHS.sfx / "step.wav", volume=0.18)
+            elif isinstance(event, PlayerAttacked):
+                if event.source == "throw_rock":
+                    sfx(PATHS.sfx / "shoot.wav", volume=0.4)
+                else:
+                    sfx(PATHS.sfx / "hit.wav", volume=0.55)
+            elif isinstance(event, PlayerHit):
+                if event.ranged:
+                    sfx(PATHS.sfx / "shoot.wav", volume=0.45)
+                else:
+                    sfx(PATHS.sfx / "hit.wav", volume=0.5)
+            elif isinstance(event, CombatLevelUp):
+                self.app.toast(f"Combat level up! Lv {event.level}")
+                sfx(PATHS.sfx / "confirm.wav", volume=0.35)
+            elif isinstance(event, ItemGained):
+                if event.source != "drop":
+                    sfx(PATHS.sfx / "pickup.wav", volume=0.45)
+            elif isinstance(event, ItemUsed):
+                if event.effect == "heal_hp":
+                    sfx(PATHS.sfx / "heal.wav", volume=0.35)
+                elif event.effect == "cure_poison":
+                    sfx(PATHS.sfx / "confirm.wav", volume=0.35)
+            elif isinstance(event, (Rescued, Guarding)):
+                sfx(PATHS.sfx / "confirm.wav", volume=0.35)
+            elif isinstance(event, RescuesCommitted):
+                self.app.toast(f"Escorted {event.miners} miner(s) to safety.")
+            elif isinstance(event, FloorChanged):
+                self.visual_seed = self.run.seed_for_floor(self.run.floor) % 100000
+                if event.descended and self.sim.outcome is None:
+                    self.app.autosave(toast=None)
+            elif isinstance(event, MissionCompleted):
+                sfx(PATHS.sfx / "mission.wav", volume=0.45)
+                self.pending_scene = self._summary_scene(reason="Mission complete")
+            elif isinstance(event, DungeonEscaped):
+                self.app.autosave()
+                sfx(PATHS.sfx / "door.wav", volume=0.45)
+                self.pending_scene = self._summary_scene(reason="Reached the bottom")
+            elif isinstance(event, PlayerDied):
+                from game.scenes.home import HomeBaseScene
+
+                self._save_recording()
+                self.pending_scene = HomeBaseScene(self.app)
+        return self.pending_scene
+
     def update(self, dt: float) -> Scene | None:
         if self.pending_scene is not None:
             return self.pending_scene
@@ -465,7 +398,7 @@ class DungeonScene(Scene):
                 surface.blit(self.enemy_sprite, (ex, ey))
             else:
                 pygame.draw.rect(surface, COLOR_ENEMY, pygame.Rect(ex, ey, TILE_SIZE, TILE_SIZE))
-            if enemy.aggro_turns > 0:
+            if enemy.aggro_until > self.sim.turn:
                 pygame.draw.circle(surface, (255, 255, 255), (ex + TILE_SIZE // 2, ey + 6), 4)
 
         px = self.player.x * TILE_SIZE
@@ -488,7 +421,7 @@ class DungeonScene(Scene):
 
         hud = self.font.render(
             f"{self.run.dungeon_name} - Floor {self.run.floor}/{self.run.max_floor} | "
-            f"HP {STATE.hp}/{STATE.max_hp_total()}  Gold {STATE.gold} | "
+            f"HP {STATE.hp}/{STATE.stats.max_hp}  Gold {STATE.gold} | "
             "Move: WASD/arrows  E: stairs  I: inventory  M: map  R: regen",
             True,
             COLOR_TEXT,
@@ -511,308 +444,6 @@ class DungeonScene(Scene):
         if self.skills_open:
             self._draw_skills(surface)
 
-    def _try_use_stairs(self) -> Scene | None:
-        tile = self.grid[self.player.y][self.player.x]
-
-        if tile == TILE_DUNGEON_EXIT:
-            if self.run.dungeon_id == "nephil_tomb" and any(e.is_alive() and e.enemy_id == "mummy_king" for e in self.enemies):
-                self.message = "A cursed weight seals the exit. Defeat the Mummified King."
-                self.app.audio.play_sfx(PATHS.sfx / "error.wav", volume=0.40)
-                return None
-            if self.run.dungeon_id == "mt_arot" and any(e.is_alive() and e.enemy_id == "ice_colossus" for e in self.enemies):
-                self.message = "The mountain groans. The Colossus still stands."
-                self.app.audio.play_sfx(PATHS.sfx / "error.wav", volume=0.40)
-                return None
-            if self.run.dungeon_id == "tropic_volcano" and any(e.is_alive() and e.enemy_id == "children_warmaster" for e in self.enemies):
-                self.message = "Heat and steel block the way. Defeat the Warmaster."
-                self.app.audio.play_sfx(PATHS.sfx / "error.wav", volume=0.40)
-                return None
-            if self.run.dungeon_id == "core_descent" and any(e.is_alive() and e.enemy_id == "children_high_priest" for e in self.enemies):
-                self.message = "A chant pins you in place. End the High Priest."
-                self.app.audio.play_sfx(PATHS.sfx / "error.wav", volume=0.40)
-                return None
-            self._commit_rescues()
-            if self._check_missions_progress():
-                return self.pending_scene
-            self.message = "You escape the dungeon!"
-            save_slot(1)
-            self.app.toast("Autosaved (slot 1)")
-            self.app.audio.play_sfx(PATHS.sfx / "door.wav", volume=0.45)
-            return self._summary_scene(reason="Reached the bottom")
-
-        if tile == TILE_STAIRS_DOWN:
-            if self.run.floor >= self.run.max_floor:
-                self.message = "This is as deep as it goes (for now)."
-                self.app.audio.play_sfx(PATHS.sfx / "error.wav", volume=0.40)
-                return None
-            self.run.floor += 1
-            self.grid = self._generate_floor()
-            pos = _find_tile(self.grid, TILE_STAIRS_UP)
-            self.player = GridPlayer(*(pos if pos is not None else (1, 1)))
-            self._populate_floor()
-            self.seen = [[False for _ in range(GRID_WIDTH)] for _ in range(GRID_HEIGHT)]
-            self._reveal()
-            if self._check_missions_progress():
-                return self.pending_scene
-            self.message = ""
-            return None
-
-        if tile == TILE_STAIRS_UP:
-            if self.run.floor <= 1:
-                self.message = "No turning back now."
-                self.app.audio.play_sfx(PATHS.sfx / "error.wav", volume=0.40)
-                return None
-            self.run.floor -= 1
-            self.grid = self._generate_floor()
-            pos = _find_tile(self.grid, TILE_STAIRS_DOWN) or _find_tile(self.grid, TILE_FLOOR)
-            self.player = GridPlayer(*(pos if pos is not None else (1, 1)))
-            self._populate_floor()
-            self.seen = [[False for _ in range(GRID_WIDTH)] for _ in range(GRID_HEIGHT)]
-            self._reveal()
-            self.message = ""
-            return None
-
-        self.message = "No stairs here."
-        self.app.audio.play_sfx(PATHS.sfx / "error.wav", volume=0.40)
-        return None
-
-    def _try_player_step(self, dx: int, dy: int) -> bool:
-        nx = self.player.x + dx
-        ny = self.player.y + dy
-        if ny < 0 or ny >= len(self.grid) or nx < 0 or nx >= len(self.grid[0]):
-            return False
-        if self.grid[ny][nx] == TILE_WALL:
-            return False
-
-        enemy = self._enemy_at(nx, ny)
-        if enemy is not None and enemy.is_alive():
-            self._player_attack(enemy)
-            return True
-
-        prev = (self.player.x, self.player.y)
-        self.player.try_move(dx, dy, self.grid, walls={TILE_WALL})
-        if (self.player.x, self.player.y) != prev:
-            if self.player_anim is not None:
-                self.player_anim.on_step(dx, dy)
-            self.app.audio.play_sfx(PATHS.sfx / "step.wav", volume=0.18)
-        self._pickup_if_present()
-        self.message = ""
-        return True
-
-    def _enemy_turn(self) -> None:
-        if STATE.hp <= 0:
-            return
-
-        if STATE.poison_turns > 0:
-            STATE.hp = max(0, STATE.hp - STATE.poison_damage)
-            STATE.poison_turns -= 1
-            if STATE.hp <= 0:
-                self.message = "Poison drops you... (Returned to Home Base)"
-                self._handle_player_death()
-                return
-
-        self.turn += 1
-        for enemy in self.enemies:
-            if not enemy.is_alive():
-                continue
-
-            if enemy.stunned_turns > 0:
-                enemy.stunned_turns -= 1
-                continue
-
-            self._update_aggro(enemy)
-            if enemy.aggro_turns <= 0:
-                # Idle wander sometimes
-                if enemy.behavior.endswith("patrol") and enemy.should_move(self.turn):
-                    self._enemy_patrol(enemy)
-                elif enemy.should_move(self.turn) and self.rng.random() < 0.35:
-                    self._enemy_wander(enemy)
-                continue
-
-            if enemy.behavior == "ranged":
-                if self._enemy_try_ranged(enemy):
-                    continue
-
-            if abs(enemy.x - self.player.x) + abs(enemy.y - self.player.y) == 1 and enemy.should_attack(self.turn):
-                damage = max(1, enemy.attack - STATE.defense())
-                if STATE.guard_turns > 0:
-                    damage = max(1, damage // 2)
-                    STATE.guard_turns = max(0, STATE.guard_turns - 1)
-                STATE.hp = max(0, STATE.hp - damage)
-                self.message = f"{enemy.name} hits you for {damage}."
-                self.app.audio.play_sfx(PATHS.sfx / "hit.wav", volume=0.5)
-                if enemy.behavior == "poison_melee" and enemy.poison_turns > 0:
-                    STATE.poison_turns = max(STATE.poison_turns, enemy.poison_turns)
-                    STATE.poison_damage = max(STATE.poison_damage, enemy.poison_damage)
-                    self.message += " You feel poison spreading."
-                if STATE.hp <= 0:
-                    self.message = "You collapse... (Returned to Home Base)"
-                    self._handle_player_death()
-                continue
-
-            if enemy.should_move(self.turn):
-                self._enemy_step_toward(enemy)
-
-    def _enemy_step_toward(self, enemy: Enemy) -> None:
-        dx = 1 if self.player.x > enemy.x else (-1 if self.player.x < enemy.x else 0)
-        dy = 1 if self.player.y > enemy.y else (-1 if self.player.y < enemy.y else 0)
-
-        candidates = []
-        if dx != 0:
-            candidates.append((enemy.x + dx, enemy.y))
-        if dy != 0:
-            candidates.append((enemy.x, enemy.y + dy))
-        self.rng.shuffle(candidates)
-
-        for nx, ny in candidates:
-            if self.grid[ny][nx] == TILE_WALL:
-                continue
-            if (nx, ny) == (self.player.x, self.player.y):
-                continue
-            if self._enemy_at(nx, ny) is not None:
-                continue
-            enemy.x, enemy.y = nx, ny
-            break
-
-    def _enemy_wander(self, enemy: Enemy) -> None:
-        dirs = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-        self.rng.shuffle(dirs)
-        for dx, dy in dirs:
-            nx, ny = enemy.x + dx, enemy.y + dy
-            if self.grid[ny][nx] == TILE_WALL:
-                continue
-            if (nx, ny) == (self.player.x, self.player.y):
-                continue
-            if self._enemy_at(nx, ny) is not None:
-                continue
-            enemy.x, enemy.y = nx, ny
-            break
-
-    def _enemy_patrol(self, enemy: Enemy) -> None:
-        nx = enemy.x + enemy.patrol_dx
-        ny = enemy.y
-        if self.grid[ny][nx] == TILE_WALL or self._enemy_at(nx, ny) is not None or (nx, ny) == (self.player.x, self.player.y):
-            enemy.patrol_dx *= -1
-            return
-        enemy.x = nx
-
-    def _player_attack(self, enemy: Enemy) -> None:
-        damage = max(1, STATE.attack() - getattr(enemy, "defense", 0))
-        enemy.hp = max(0, enemy.hp - damage)
-        if enemy.hp <= 0:
-            STATE.record_kill(enemy.enemy_id)
-            self._grant_boss_relic_if_needed(enemy.enemy_id)
-            levels = STATE.add_combat_xp(6 + self.run.floor)
-            if levels:
-                self.app.toast(f"Combat level up! Lv {STATE.combat_level}")
-                self.app.audio.play_sfx(PATHS.sfx / "confirm.wav", volume=0.35)
-            self.message = f"You defeat {enemy.name}!"
-            self.app.audio.play_sfx(PATHS.sfx / "hit.wav", volume=0.55)
-            gained = 5 + self.run.floor
-            STATE.gold += gained
-            self.gold_gained += gained
-            self.kills += 1
-            if self.rng.random() < 0.25:
-                STATE.add_item("potion_small", 1)
-                self.items_gained["potion_small"] = self.items_gained.get("potion_small", 0) + 1
-                self.message += " Found a Small Potion."
-            self._check_missions_progress()
-        else:
-            self.message = f"You hit {enemy.name} for {damage}."
-            self.app.audio.play_sfx(PATHS.sfx / "hit.wav", volume=0.55)
-
-    def _pickup_if_present(self) -> None:
-        for idx, pickup in enumerate(list(self.pickups)):
-            if pickup.x == self.player.x and pickup.y == self.player.y:
-                if pickup.item_id == "trapped_miner":
-                    self.rescued_in_run += 1
-                    self.message = "You rescued a miner! Escort them out to safety."
-                    self.app.audio.play_sfx(PATHS.sfx / "confirm.wav", volume=0.35)
-                    self.pickups.pop(idx)
-                    return
-                if pickup.item_id == "head_miner":
-                    self.rescued_head_miner = True
-                    self.message = "You found the head miner! Get them out—now."
-                    self.app.audio.play_sfx(PATHS.sfx / "confirm.wav", volume=0.35)
-                    self.pickups.pop(idx)
-                    return
-                if pickup.item_id == "rival_hostage":
-                    self.rescued_rival = True
-                    self.message = "You found your rival—hurt, but alive. Get them out."
-                    self.app.audio.play_sfx(PATHS.sfx / "confirm.wav", volume=0.35)
-                    self.pickups.pop(idx)
-                    return
-                STATE.add_item(pickup.item_id, pickup.amount)
-                self.items_gained[pickup.item_id] = self.items_gained.get(pickup.item_id, 0) + pickup.amount
-                item = get_item(pickup.item_id)
-                self.message = f"Picked up {item.name}."
-                self.app.audio.play_sfx(PATHS.sfx / "pickup.wav", volume=0.45)
-                self.pickups.pop(idx)
-                self._check_missions_progress()
-                break
-
-    def _commit_rescues(self) -> None:
-        if self._rescues_committed:
-            return
-        self._rescues_committed = True
-        if self.rescued_in_run > 0:
-            STATE.rescued_miners_total = int(getattr(STATE, "rescued_miners_total", 0)) + int(self.rescued_in_run)
-            # Rivalry: rival also racks up rescues sometimes.
-            if int(getattr(STATE, "chapter", 1)) >= 4:
-                try:
-                    import zlib
-
-                    h = zlib.crc32(f"{self.run.dungeon_id}:{self.run.floor}:{self.run.seed_base}".encode("utf-8"))
-                    if h % 2 == 0:
-                        STATE.rival_rescues = int(getattr(STATE, "rival_rescues", 0)) + max(1, self.rescued_in_run // 2)
-                except Exception:
-                    pass
-            self.app.toast(f"Escorted {self.rescued_in_run} miner(s) to safety.")
-        if self.rescued_head_miner and STATE.item_count("head_miner_token") <= 0:
-            STATE.add_item("head_miner_token", 1)
-            self.items_gained["head_miner_token"] = self.items_gained.get("head_miner_token", 0) + 1
-            self.app.audio.play_sfx(PATHS.sfx / "pickup.wav", volume=0.45)
-        if self.rescued_rival and STATE.item_count("rival_rescue_badge") <= 0:
-            STATE.add_item("rival_rescue_badge", 1)
-            self.items_gained["rival_rescue_badge"] = self.items_gained.get("rival_rescue_badge", 0) + 1
-            self.app.audio.play_sfx(PATHS.sfx / "pickup.wav", volume=0.45)
-
-    def _enemy_at(self, x: int, y: int) -> Enemy | None:
-        for enemy in self.enemies:
-            if enemy.is_alive() and enemy.x == x and enemy.y == y:
-                return enemy
-        return None
-
-    def _update_aggro(self, enemy: Enemy) -> None:
-        dist = abs(enemy.x - self.player.x) + abs(enemy.y - self.player.y)
-        if dist <= enemy.aggro_range and self._has_simple_los(enemy.x, enemy.y, self.player.x, self.player.y):
-            enemy.aggro_turns = 6
-        else:
-            enemy.aggro_turns = max(0, enemy.aggro_turns - 1)
-
-    def _has_simple_los(self, x1: int, y1: int, x2: int, y2: int) -> bool:
-        # Simple LOS: clear if same row/col with no walls between, else allow within 2 tiles.
-        if x1 == x2:
-            step = 1 if y2 > y1 else -1
-            for y in range(y1 + step, y2, step):
-                if self.grid[y][x1] == TILE_WALL:
-                    return False
-            return True
-        if y1 == y2:
-            step = 1 if x2 > x1 else -1
-            for x in range(x1 + step, x2, step):
-                if self.grid[y1][x] == TILE_WALL:
-                    return False
-            return True
-        return abs(x1 - x2) + abs(y1 - y2) <= 2
-
-    def _handle_player_death(self) -> None:
-        # Reset player and send them home immediately.
-        STATE.hp = STATE.max_hp_total()
-        from game.scenes.home import HomeBaseScene
-
-        self.pending_scene = HomeBaseScene(self.app)
-
     def _handle_skill_keys(self, event: pygame.event.Event) -> Scene | None:
         if event.key in (pygame.K_ESCAPE, pygame.K_k):
             self.skills_open = False
@@ -825,143 +456,12 @@ class DungeonScene(Scene):
         elif event.key in (pygame.K_DOWN, pygame.K_s):
             self.skill_index = (self.skill_index + 1) % len(skills)
         elif event.key in (pygame.K_RETURN, pygame.K_KP_ENTER, pygame.K_e):
-            self._use_skill(skills[self.skill_index])
             self.skills_open = False
-            self._enemy_turn()
-            self._reveal()
+            return self._act(UseSkill(skills[self.skill_index]))
         return None
 
     def _skills(self) -> list[str]:
-        return ["whip", "throw_rock", "guard"]
-
-    def _use_skill(self, skill_id: str) -> None:
-        if skill_id == "guard":
-            STATE.guard_turns = 1
-            self.message = "You brace yourself."
-            self.app.audio.play_sfx(PATHS.sfx / "confirm.wav", volume=0.35)
-            return
-        if skill_id == "throw_rock":
-            target = self._nearest_enemy_in_range(4)
-            if target is None:
-                self.message = "No target in range."
-                return
-            damage = max(1, STATE.attack() - 1)
-            target.hp = max(0, target.hp - damage)
-            self.message = f"You throw a rock at {target.name} ({damage})."
-            self.app.audio.play_sfx(PATHS.sfx / "shoot.wav", volume=0.4)
-            if target.hp <= 0:
-                STATE.record_kill(target.enemy_id)
-                self._grant_boss_relic_if_needed(target.enemy_id)
-                levels = STATE.add_combat_xp(5 + self.run.floor)
-                if levels:
-                    self.app.toast(f"Combat level up! Lv {STATE.combat_level}")
-                    self.app.audio.play_sfx(PATHS.sfx / "confirm.wav", volume=0.35)
-                self.kills += 1
-                gained = 4 + self.run.floor
-                STATE.gold += gained
-                self.gold_gained += gained
-                self.message += " Defeated!"
-                self._check_missions_progress()
-            return
-        if skill_id == "whip":
-            target = self._enemy_at_adjacent()
-            if target is None:
-                self.message = "No adjacent target."
-                return
-            damage = max(1, STATE.attack() + 2 - target.defense)
-            target.hp = max(0, target.hp - damage)
-            if self.rng.random() < 0.25:
-                target.stunned_turns = max(target.stunned_turns, 1)
-            self.message = f"You crack the whip at {target.name} ({damage})."
-            self.app.audio.play_sfx(PATHS.sfx / "hit.wav", volume=0.55)
-            if target.hp <= 0:
-                STATE.record_kill(target.enemy_id)
-                self._grant_boss_relic_if_needed(target.enemy_id)
-                levels = STATE.add_combat_xp(6 + self.run.floor)
-                if levels:
-                    self.app.toast(f"Combat level up! Lv {STATE.combat_level}")
-                    self.app.audio.play_sfx(PATHS.sfx / "confirm.wav", volume=0.35)
-                self.kills += 1
-                gained = 5 + self.run.floor
-                STATE.gold += gained
-                self.gold_gained += gained
-                self.message += " Defeated!"
-                self._check_missions_progress()
-            return
-
-    def _grant_boss_relic_if_needed(self, boss_enemy_id: str) -> None:
-        mission_id = STATE.active_mission
-        mission = MISSIONS.get(mission_id) if mission_id else None
-        if mission is None:
-            return
-
-        def mission_needs(item_id: str) -> bool:
-            return any(str(o.get("type", "")) == "collect_item" and str(o.get("item_id", "")) == item_id for o in mission.objectives)
-
-        if boss_enemy_id == "mummy_king":
-            if mission_needs("nephil_relic_crown") and STATE.item_count("nephil_relic_crown") <= 0:
-                STATE.add_item("nephil_relic_crown", 1)
-                self.items_gained["nephil_relic_crown"] = self.items_gained.get("nephil_relic_crown", 0) + 1
-                self.app.audio.play_sfx(PATHS.sfx / "pickup.wav", volume=0.45)
-                self.message += " You claim the Crown of Dust."
-            return
-
-        if boss_enemy_id == "ice_colossus":
-            if mission_needs("arrowhead_map") and STATE.item_count("arrowhead_map") <= 0:
-                STATE.add_item("arrowhead_map", 1)
-                self.items_gained["arrowhead_map"] = self.items_gained.get("arrowhead_map", 0) + 1
-                self.app.audio.play_sfx(PATHS.sfx / "pickup.wav", volume=0.45)
-                self.message += " You recover a frozen map."
-            return
-
-        if boss_enemy_id == "children_warmaster":
-            if mission_needs("arrowhead_tip") and STATE.item_count("arrowhead_tip") <= 0:
-                STATE.add_item("arrowhead_tip", 1)
-                self.items_gained["arrowhead_tip"] = self.items_gained.get("arrowhead_tip", 0) + 1
-                self.app.audio.play_sfx(PATHS.sfx / "pickup.wav", volume=0.45)
-                self.message += " You seize the Arrow Tip Fragment."
-            return
-
-    def _enemy_at_adjacent(self) -> Enemy | None:
-        for dx, dy in ((-1, 0), (1, 0), (0, -1), (0, 1)):
-            e = self._enemy_at(self.player.x + dx, self.player.y + dy)
-            if e is not None:
-                return e
-        return None
-
-    def _nearest_enemy_in_range(self, r: int) -> Enemy | None:
-        best = None
-        best_d = 999
-        for e in self.enemies:
-            if not e.is_alive():
-                continue
-            if not self.seen[e.y][e.x]:
-                continue
-            d = abs(e.x - self.player.x) + abs(e.y - self.player.y)
-            if d <= r and d < best_d and self._has_simple_los(self.player.x, self.player.y, e.x, e.y):
-                best = e
-                best_d = d
-        return best
-
-    def _enemy_try_ranged(self, enemy: Enemy) -> bool:
-        if not enemy.should_attack(self.turn):
-            return False
-        d = abs(enemy.x - self.player.x) + abs(enemy.y - self.player.y)
-        if enemy.ranged_range <= 0 or d > enemy.ranged_range:
-            return False
-        if not self._has_simple_los(enemy.x, enemy.y, self.player.x, self.player.y):
-            return False
-        damage = max(1, enemy.attack - STATE.defense())
-        if STATE.guard_turns > 0:
-            damage = max(1, damage // 2)
-            STATE.guard_turns = max(0, STATE.guard_turns - 1)
-        STATE.hp = max(0, STATE.hp - damage)
-        self.message = f"{enemy.name} shoots you for {damage}."
-        self.app.audio.play_sfx(PATHS.sfx / "shoot.wav", volume=0.45)
-        if STATE.hp <= 0:
-            self.message = "You collapse... (Returned to Home Base)"
-            self._handle_player_death()
-        return True
+        return list(SKILLS)
 
     def _draw_skills(self, surface: pygame.Surface) -> None:
         width, height = surface.get_size()
@@ -977,7 +477,7 @@ class DungeonScene(Scene):
         labels = {
             "whip": "Whip (melee, high damage, may stun)",
             "throw_rock": "Throw Rock (ranged, nearest target)",
-            "guard": "Guard (halve next hit)",
+            "guard": "Guard (halve the first hit next enemy turn)",
         }
         for idx, skill_id in enumerate(skills):
             prefix = "> " if idx == self.skill_index else "  "
@@ -999,60 +499,19 @@ class DungeonScene(Scene):
         elif event.key in (pygame.K_DOWN, pygame.K_s):
             self.inventory_index = (self.inventory_index + 1) % len(items)
         elif event.key in (pygame.K_RETURN, pygame.K_KP_ENTER, pygame.K_e):
-            item_id = items[self.inventory_index]
-            self._use_item(item_id)
-            self._enemy_turn()
+            return self._act(UseItem(items[self.inventory_index]))
         return None
 
     def _inventory_items(self) -> list[str]:
-        return [item_id for item_id in STATE.inventory.keys() if item_id in ITEMS]
-
-    def _use_item(self, item_id: str) -> None:
-        item = get_item(item_id)
-        if not item.usable_in_dungeon:
-            self.message = f"{item.name} can't be used here (yet)."
-            return
-        if item.effects and "heal_hp" in item.effects:
-            if STATE.hp >= STATE.max_hp_total():
-                self.message = "HP already full."
-                self.app.audio.play_sfx(PATHS.sfx / "error.wav", volume=0.40)
-                return
-            if not STATE.remove_item(item_id, 1):
-                return
-            heal = int(item.effects["heal_hp"])
-            STATE.hp = min(STATE.max_hp_total(), STATE.hp + heal)
-            self.message = f"Used {item.name} (+{heal} HP)."
-            self.app.audio.play_sfx(PATHS.sfx / "heal.wav", volume=0.35)
-            return
-        if item.effects and "cure_poison" in item.effects:
-            if STATE.poison_turns <= 0:
-                self.message = "No poison to cure."
-                self.app.audio.play_sfx(PATHS.sfx / "error.wav", volume=0.40)
-                return
-            if not STATE.remove_item(item_id, 1):
-                return
-            STATE.poison_turns = 0
-            STATE.poison_damage = 0
-            self.message = f"Used {item.name} (poison cured)."
-            self.app.audio.play_sfx(PATHS.sfx / "confirm.wav", volume=0.35)
-            return
-        self.message = f"Used {item.name}."
-
-    def _check_missions_progress(self) -> bool:
-        mission_id = STATE.active_mission
-        if not mission_id:
-            return False
-        if not is_mission_complete(STATE, mission_id, dungeon_id=self.run.dungeon_id, floor=self.run.floor):
-            return False
-        STATE.completed_missions.add(mission_id)
-        STATE.active_mission = None
-        STATE.mission_kill_baseline = {}
-        self.message = f"Mission complete: {MISSIONS.get(mission_id).name if mission_id in MISSIONS else mission_id}! Return to the Guild."
-        self.app.audio.play_sfx(PATHS.sfx / "mission.wav", volume=0.45)
-        self.pending_scene = self._summary_scene(reason="Mission complete")
-        return True
+        return self.sim.inventory_items()
 
     def _mission_hud_text(self) -> str:
+        key = tuple(STATE.field_revision(f) for f in _MISSION_HUD_FIELDS)
+        if self._mission_hud is None or self._mission_hud[0] != key:
+            self._mission_hud = (key, self._build_mission_hud_text())
+        return self._mission_hud[1]
+
+    def _build_mission_hud_text(self) -> str:
         mission_id = STATE.active_mission
         if not mission_id:
             return ""
@@ -1061,40 +520,36 @@ class DungeonScene(Scene):
             return f"Mission: {mission_id}"
         return f"Mission: {mission.name} — {mission_objective_text(mission_id)}"
 
-    def _return_scene(self) -> Scene:
-        if self.return_to == "outskirts":
-            from game.scenes.outskirts import OutskirtsScene
-
-            return OutskirtsScene(self.app, spawn=(GRID_WIDTH - 4, GRID_HEIGHT // 2))
-        from game.scenes.town import TownScene
-
-        return TownScene(self.app, spawn=(GRID_WIDTH - 4, GRID_HEIGHT // 2))
-
     def _summary_scene(self, *, reason: str) -> Scene:
         from game.scenes.run_summary import RunSummaryScene
 
-        self._commit_rescues()
-        next_scene = self._return_scene()
+        sim = self.sim
+        self._save_recording()
+        self._handle_sim_events(sim.finish())
         lines = [
             f"Reason: {reason}",
-            f"Turns: {self.turn}",
-            f"Enemies defeated: {self.kills}",
-            f"Gold gained: {self.gold_gained}",
+            f"Turns: {sim.turn}",
+            f"Enemies defeated: {sim.kills}",
+            f"Gold gained: {sim.gold_gained}",
         ]
-        if self.rescued_in_run:
-            lines.append(f"Miners escorted out: {self.rescued_in_run}")
-        if self.items_gained:
+        if sim.rescued_in_run:
+            lines.append(f"Miners escorted out: {sim.rescued_in_run}")
+        if sim.items_gained:
             lines.append("Items gained:")
-            for item_id, count in sorted(self.items_gained.items()):
+            for item_id, count in sorted(sim.items_gained.items()):
                 lines.append(f"- {item_id} x{count}")
-        return RunSummaryScene(self.app, title="Dungeon Run Summary", lines=lines, next_scene=next_scene)
+        # Built on continue; the factory holds only what it needs, not this scene.
+        app, return_to = self.app, self.return_to
+        return RunSummaryScene(
+            self.app,
+            title="Dungeon Run Summary",
+            lines=lines,
+            next_scene=lambda: _return_scene(app, return_to),
+        )
 
-    def _reveal(self) -> None:
-        r = 3
-        for yy in range(max(0, self.player.y - r), min(GRID_HEIGHT, self.player.y + r + 1)):
-            for xx in range(max(0, self.player.x - r), min(GRID_WIDTH, self.player.x + r + 1)):
-                if abs(xx - self.player.x) + abs(yy - self.player.y) <= r:
-                    self.seen[yy][xx] = True
+    def _save_recording(self) -> None:
+        # Written on the save worker; the scene doesn't touch the recording after this.
+        self.app.saves.submit(save_run, self.recording)
 
     def _draw_minimap(self, surface: pygame.Surface) -> None:
         scale = 4
@@ -1155,18 +610,12 @@ class DungeonScene(Scene):
             y += 22
 
 
-def _find_tile(grid: list[list[int]], tile: int) -> tuple[int, int] | None:
-    for y, row in enumerate(grid):
-        for x, cell in enumerate(row):
-            if cell == tile:
-                return (x, y)
-    return None
+def _return_scene(app, return_to: str) -> Scene:
+    if return_to == "outskirts":
+        from game.scenes.outskirts import OutskirtsScene
+
+        return OutskirtsScene(app, spawn=(GRID_WIDTH - 4, GRID_HEIGHT // 2))
+    from game.scenes.town import TownScene
 
+    return TownScene(app, spawn=(GRID_WIDTH - 4, GRID_HEIGHT // 2))
 
-def _all_floor_like(grid: list[list[int]]) -> list[tuple[int, int]]:
-    cells: list[tuple[int, int]] = []
-    for y, row in enumerate(grid):
-        for x, cell in enumerate(row):
-            if cell != TILE_WALL:
-                cells.append((x, y))
-    return cells
@@ -47,7 +47,7 @@ class GuildScene(Scene):
         if cs is None or STATE.has(cs.flag):
             return False
         STATE.set(cs.flag)
-        self.app.set_scene(CutsceneScene(self.app, pages=cs.pages, next_scene=GuildScene(self.app)))
+        self.app.set_scene(CutsceneScene(self.app, pages=cs.pages, next_scene="guild"))
         return True
 
     def _reward_lines(self, mission_id: str, *, before_rank: int, before_chapter: int) -> list[str]:
@@ -140,8 +140,7 @@ class GuildScene(Scene):
                 mission = MISSIONS.get(mission_id)
                 if mission is not None and bool(getattr(mission, "repeatable", False)):
                     # Allow replay: clear completion/claim markers and re-accept.
-                    STATE.completed_missions.discard(mission_id)
-                    STATE.claimed_missions.discard(mission_id)
+                    STATE.reopen_mission(mission_id)
                     STATE.active_mission = mission_id
                     STATE.mission_kill_baseline = dict(STATE.kill_log)
                     self._start_dialogue(speaker="Guild Clerk", lines=mission.accept_lines)
@@ -255,7 +254,7 @@ class GuildScene(Scene):
 
             if mission_id == "cave_in_rescue":
                 STATE.set(FLAG_CULT_STOLE_CREDIT)
-                STATE.hp = max(1, min(STATE.hp, max(1, STATE.max_hp_total() // 2)))
+                STATE.hp = max(1, min(STATE.hp, max(1, STATE.stats.max_hp // 2)))
                 post_event = "ch3_betrayal"
             elif mission_id == "rival_hostage":
                 STATE.set(FLAG_RIVAL_RESCUED)
@@ -325,7 +324,7 @@ class GuildScene(Scene):
                 return
             if mission_id == "cave_in_rescue":
                 STATE.set(FLAG_CULT_STOLE_CREDIT)
-                STATE.hp = max(1, min(STATE.hp, max(1, STATE.max_hp_total() // 2)))
+                STATE.hp = max(1, min(STATE.hp, max(1, STATE.stats.max_hp // 2)))
                 self.message = f"{CHILDREN_OF_THE_NEPHIL} stole the credit. You were left bruised—and furious."
                 self._play_cutscene("ch3_betrayal")
                 return
@@ -412,5 +411,5 @@ class GuildScene(Scene):
 
     def _after_cave_in_betrayal(self) -> None:
         STATE.set(FLAG_CULT_STOLE_CREDIT)
-        STATE.hp = max(1, min(STATE.hp, max(1, STATE.max_hp_total() // 2)))
+        STATE.hp = max(1, min(STATE.hp, max(1, STATE.stats.max_hp // 2)))
         self.message = f"{CHILDREN_OF_THE_NEPHIL} stole the credit. You were left bruised—and furious."
@@ -43,7 +43,7 @@ class HealerScene(Scene):
 
         if event.key in (pygame.K_RETURN, pygame.K_KP_ENTER, pygame.K_e):
             cost = 10
-            if STATE.hp >= STATE.max_hp_total():
+            if STATE.hp >= STATE.stats.max_hp:
                 self.message = "You're already at full health."
                 self.app.audio.play_sfx(PATHS.sfx / "error.wav", volume=0.40)
                 return None
@@ -52,7 +52,7 @@ class HealerScene(Scene):
                 self.app.audio.play_sfx(PATHS.sfx / "error.wav", volume=0.40)
                 return None
             STATE.gold -= cost
-            STATE.hp = STATE.max_hp_total()
+            STATE.hp = STATE.stats.max_hp
             self.message = "All patched up."
             self.app.audio.play_sfx(PATHS.sfx / "heal.wav", volume=0.4)
         return None
@@ -66,7 +66,7 @@ class HealerScene(Scene):
         surface.blit(title, (40, 50))
 
         body = [
-            f"HP: {STATE.hp}/{STATE.max_hp_total()}",
+            f"HP: {STATE.hp}/{STATE.stats.max_hp}",
             f"Gold: {STATE.gold}",
             "Press Enter/E to heal to full for 10g.",
             "Esc to return to town.",
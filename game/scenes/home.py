@@ -23,7 +23,6 @@ from game.constants import (
     TILE_WALL,
 )
 from game.entities.player import GridPlayer
-from game.save import save_slot
 from game.scenes.base import Scene
 from game.state import STATE
 from game.ui.status_menu import StatusMenu
@@ -145,8 +144,7 @@ class HomeBaseScene(Scene):
 
                     return TownScene(self.app, spawn=(2, GRID_HEIGHT // 2))
                 if tile in (TILE_BED_TL, TILE_BED_TR, TILE_BED_BL, TILE_BED_BR):
-                    save_slot(1)
-                    self.app.toast("Saved at bed (slot 1)")
+                    self.app.save_slot(1, toast="Saved at bed (slot 1)")
                     self.app.audio.play_sfx(PATHS.sfx / "confirm.wav", volume=0.35)
             self._last_pos = (self.player.x, self.player.y)
         return None
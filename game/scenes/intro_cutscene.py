@@ -5,6 +5,7 @@ import pygame
 from game.assets_manifest import PATHS
 from game.constants import COLOR_BG, COLOR_TEXT
 from game.scenes.base import Scene
+from game.scenes.registry import SceneRef, resolve_scene
 from game.state import STATE
 from game.story.flags import FLAG_SEEN_INTRO_CUTSCENE
 
@@ -27,7 +28,7 @@ def _wrap_text(font: pygame.font.Font, text: str, max_width: int) -> list[str]:
 
 
 class IntroCutsceneScene(Scene):
-    def __init__(self, app, *, next_scene: Scene) -> None:
+    def __init__(self, app, *, next_scene: SceneRef) -> None:
         super().__init__(app)
         self.next_scene = next_scene
         self.font_title = pygame.font.SysFont(None, 46)
@@ -87,14 +88,14 @@ class IntroCutsceneScene(Scene):
         if event.key == pygame.K_ESCAPE:
             STATE.set(FLAG_SEEN_INTRO_CUTSCENE)
             self.app.audio.play_sfx(PATHS.sfx / "ui_close.wav", volume=0.35)
-            return self.next_scene
+            return resolve_scene(self.app, self.next_scene)
 
         if event.key in (pygame.K_RETURN, pygame.K_KP_ENTER, pygame.K_SPACE, pygame.K_e):
             self.index += 1
             self.app.audio.play_sfx(PATHS.sfx / "confirm.wav", volume=0.30)
             if self.index >= len(self.pages):
                 STATE.set(FLAG_SEEN_INTRO_CUTSCENE)
-                return self.next_scene
+                return resolve_scene(self.app, self.next_scene)
         return None
 
     def update(self, dt: float) -> Scene | None:
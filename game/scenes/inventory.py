@@ -61,8 +61,8 @@ class InventoryScene(Scene):
         surface.blit(header, (40, 85))
 
         surface.blit(self.font.render(f"Gold: {STATE.gold}", True, COLOR_TEXT), (40, 115))
-        surface.blit(self.font.render(f"ATK: {STATE.attack()}  DEF: {STATE.defense()}", True, COLOR_TEXT), (40, 140))
-        surface.blit(self.font.render(f"HP: {STATE.hp}/{STATE.max_hp_total()}", True, COLOR_TEXT), (40, 165))
+        surface.blit(self.font.render(f"ATK: {STATE.stats.attack}  DEF: {STATE.stats.defense}", True, COLOR_TEXT), (40, 140))
+        surface.blit(self.font.render(f"HP: {STATE.hp}/{STATE.stats.max_hp}", True, COLOR_TEXT), (40, 165))
         surface.blit(self.font.render(f"Weapon: {STATE.equipment.get('weapon') or '-'}", True, COLOR_TEXT), (40, 190))
         surface.blit(self.font.render(f"Armor: {STATE.equipment.get('armor') or '-'}", True, COLOR_TEXT), (40, 215))
         surface.blit(self.font.render(f"Trinket: {STATE.equipment.get('trinket') or '-'}", True, COLOR_TEXT), (40, 240))
@@ -101,13 +101,13 @@ class InventoryScene(Scene):
             self.app.audio.play_sfx(PATHS.sfx / "equip.wav", volume=0.30)
             return
         if item.effects and "heal_hp" in item.effects:
-            if STATE.hp >= STATE.max_hp_total():
+            if STATE.hp >= STATE.stats.max_hp:
                 self.message = "HP already full."
                 self.app.audio.play_sfx(PATHS.sfx / "error.wav", volume=0.40)
                 return
             if STATE.remove_item(item_id, 1):
                 heal = int(item.effects["heal_hp"])
-                STATE.hp = min(STATE.max_hp_total(), STATE.hp + heal)
+                STATE.hp = min(STATE.stats.max_hp, STATE.hp + heal)
                 self.message = f"Used {item.name} (+{heal} HP)."
                 self.app.audio.play_sfx(PATHS.sfx / "heal.wav", volume=0.35)
                 return
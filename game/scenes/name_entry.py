@@ -4,11 +4,12 @@ import pygame
 
 from game.assets_manifest import PATHS
 from game.scenes.base import Scene
+from game.scenes.registry import SceneRef, resolve_scene
 from game.state import STATE
 
 
 class NameEntryScene(Scene):
-    def __init__(self, app, *, next_scene: Scene | None = None, prompt: str | None = None, autosave_slot: int | None = None) -> None:
+    def __init__(self, app, *, next_scene: SceneRef | None = None, prompt: str | None = None, autosave_slot: int | None = None) -> None:
         super().__init__(app)
         self.font_title = pygame.font.SysFont(None, 54)
         self.font = pygame.font.SysFont(None, 26)
@@ -38,15 +39,12 @@ class NameEntryScene(Scene):
                 return None
             STATE.player_name = cleaned[:24]
             if self.autosave_slot is not None:
-                from game.save import save_slot
-
-                save_slot(self.autosave_slot)
-                self.app.toast(f"Saved name: {STATE.player_name} (slot {self.autosave_slot})")
+                self.app.save_slot(self.autosave_slot, toast=f"Saved name: {STATE.player_name} (slot {self.autosave_slot})")
             else:
                 self.app.toast(f"Name set: {STATE.player_name}")
             self.app.audio.play_sfx(PATHS.sfx / "confirm.wav", volume=0.35)
             if self.next_scene is not None:
-                return self.next_scene
+                return resolve_scene(self.app, self.next_scene)
             from game.scenes.title import TitleScene
 
             return TitleScene(self.app)
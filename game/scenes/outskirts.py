@@ -24,8 +24,12 @@ from game.scenes.base import Scene
 from game.state import STATE
 from game.story.flags import FLAG_BOW_STOLEN, FLAG_FOUND_ARROWHEAD_MAP, FLAG_GOT_TEMPLE_PASS, FLAG_RIVAL_KIDNAPPED
 from game.ui.status_menu import StatusMenu
-from game.world.dungeon_run import DungeonRun
-from game.save import save_slot
+from game.world.dungeon_run import DUNGEONS, DungeonRun
+
+
+def _dungeon(dungeon_id: str) -> dict:
+    name, max_floor = DUNGEONS[dungeon_id]
+    return {"name": name, "dungeon_id": dungeon_id, "max_floor": max_floor}
 
 
 class OutskirtsScene(Scene):
@@ -33,6 +37,7 @@ class OutskirtsScene(Scene):
         super().__init__(app)
         self.font = pygame.font.SysFont(None, 22)
         self.app.audio.play_music(PATHS.music / "world_map.ogg", volume=0.45)
+        self.app.audio.prefetch_music(PATHS.music / "dungeon.ogg")
         self.status_menu = StatusMenu()
         self.status_open = False
 
@@ -209,121 +214,87 @@ class OutskirtsScene(Scene):
     def _dungeon_options(self) -> list[dict]:
         return [
             {
-                "name": "Temple Ruins",
-                "dungeon_id": "temple_ruins",
-                "max_floor": 5,
+                **_dungeon("temple_ruins"),
                 "locked": (not STATE.has(FLAG_GOT_TEMPLE_PASS)),
                 "lock_reason": "Talk to the Mayor in town to get the pass.",
             },
             {
-                "name": "Jungle Cavern",
-                "dungeon_id": "jungle_cavern",
-                "max_floor": 7,
+                **_dungeon("jungle_cavern"),
                 "locked": ("relic_shard" not in STATE.completed_missions),
                 "lock_reason": "Complete a guild mission to unlock.",
             },
             {
-                "name": "Nephil Dunes",
-                "dungeon_id": "nephil_dunes",
-                "max_floor": 4,
+                **_dungeon("nephil_dunes"),
                 "locked": (STATE.chapter < 2),
                 "lock_reason": "Reach Chapter 2 (Guild Rank 2) to unlock.",
             },
             {
-                "name": "Nephil Oasis Ruins",
-                "dungeon_id": "nephil_oasis",
-                "max_floor": 5,
+                **_dungeon("nephil_oasis"),
                 "locked": (STATE.chapter < 2),
                 "lock_reason": "Reach Chapter 2 (Guild Rank 2) to unlock.",
             },
             {
-                "name": "Nephil Sunken Tomb",
-                "dungeon_id": "nephil_tomb",
-                "max_floor": 6,
+                **_dungeon("nephil_tomb"),
                 "locked": (STATE.chapter < 2 or "nephil_relic_ankh" not in STATE.completed_missions or "nephil_relic_map" not in STATE.completed_missions),
                 "lock_reason": "Complete the first two Nephil relic missions to unlock.",
             },
             {
-                "name": "Collapsed Mines",
-                "dungeon_id": "collapsed_mines",
-                "max_floor": 6,
+                **_dungeon("collapsed_mines"),
                 "locked": (STATE.chapter < 3),
                 "lock_reason": "Reach Chapter 3 (Guild Rank 3) to unlock.",
             },
             {
-                "name": "Deepest Shaft",
-                "dungeon_id": "deep_shaft",
-                "max_floor": 8,
+                **_dungeon("deep_shaft"),
                 "locked": (STATE.chapter < 3 or STATE.rescued_miners_total < 10),
                 "lock_reason": "Rescue more miners from the Collapsed Mines to unlock.",
             },
             {
-                "name": "Children Hideout",
-                "dungeon_id": "children_hideout",
-                "max_floor": 5,
+                **_dungeon("children_hideout"),
                 "locked": (STATE.chapter < 4 or not STATE.has(FLAG_RIVAL_KIDNAPPED)),
                 "lock_reason": "Accept the Rivalry mission to reveal the hideout.",
             },
             {
-                "name": "Tower of Babel",
-                "dungeon_id": "babel_tower",
-                "max_floor": 9,
+                **_dungeon("babel_tower"),
                 "locked": (STATE.chapter < 5),
                 "lock_reason": "Reach Chapter 5 (Guild Rank 5) to unlock.",
             },
             {
-                "name": "Children Vault",
-                "dungeon_id": "children_vault",
-                "max_floor": 6,
+                **_dungeon("children_vault"),
                 "locked": (STATE.chapter < 6 or not STATE.has(FLAG_BOW_STOLEN)),
                 "lock_reason": "After the bow is stolen (Chapter 6), the vault becomes accessible.",
             },
             {
-                "name": "Ice Expedition Base Camp",
-                "dungeon_id": "_base_camp",
-                "max_floor": 1,
+                **_dungeon("_base_camp"),
                 "locked": (STATE.chapter < 7),
                 "lock_reason": "Reach Chapter 7 to unlock the ice expedition.",
             },
             {
-                "name": "Snowbound Path",
-                "dungeon_id": "snowbound_path",
-                "max_floor": 4,
+                **_dungeon("snowbound_path"),
                 "locked": (STATE.chapter < 7),
                 "lock_reason": "Reach Chapter 7 to unlock.",
             },
             {
-                "name": "Ice Cave",
-                "dungeon_id": "ice_cave",
-                "max_floor": 5,
+                **_dungeon("ice_cave"),
                 "locked": (STATE.chapter < 7),
                 "lock_reason": "Reach Chapter 7 to unlock.",
             },
             {
-                "name": "Mt Arot",
-                "dungeon_id": "mt_arot",
-                "max_floor": 6,
+                **_dungeon("mt_arot"),
                 "locked": (STATE.chapter < 7),
                 "lock_reason": "Reach Chapter 7 to unlock.",
             },
             {
-                "name": "Ice Cave (Lower)",
-                "dungeon_id": "ice_cave_2",
-                "max_floor": 6,
+                **_dungeon("ice_cave_2"),
                 "locked": (STATE.chapter < 7),
                 "lock_reason": "Reach Chapter 7 to unlock.",
             },
             {
-                "name": "Tropic Island Volcano",
-                "dungeon_id": "tropic_volcano",
-                "max_floor": 7,
+                **_dungeon("tropic_volcano"),
                 "locked": (STATE.chapter < 8 or not STATE.has(FLAG_FOUND_ARROWHEAD_MAP)),
                 "lock_reason": "Find the map in the ice expedition to unlock.",
             },
             {
-                "name": "Journey to the Core",
-                "dungeon_id": "core_descent",
-                "max_floor": 9,
+                **_dungeon("core_descent"),
                 "locked": (STATE.chapter < 9),
                 "lock_reason": "Reach Chapter 9 to unlock.",
             },
@@ -353,8 +324,7 @@ class OutskirtsScene(Scene):
 
             self.dungeon_menu_open = False
             self.app.audio.play_sfx(PATHS.sfx / "confirm.wav", volume=0.35)
-            save_slot(1)
-            self.app.toast("Autosaved (slot 1)")
+            self.app.autosave()
 
             if opt["dungeon_id"] == "_base_camp":
                 from game.scenes.base_camp import BaseCampScene
@@ -363,7 +333,7 @@ class OutskirtsScene(Scene):
 
             from game.scenes.dungeon import DungeonScene
 
-            run = DungeonRun(dungeon_id=opt["dungeon_id"], dungeon_name=opt["name"], max_floor=opt["max_floor"])
+            run = DungeonRun.for_dungeon(opt["dungeon_id"])
             return DungeonScene(self.app, run, return_to="outskirts")
         return None
 
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from importlib import import_module
+from typing import Any
+
+from game.scenes.base import Scene
+
+
+# Scene key -> "module:Class". Modules (and the item/enemy/mission/dialogue data they pull in)
+# are imported the first time a scene of that kind is built, not when `game.app` loads.
+SCENES: dict[str, str] = {
+    "startup": "game.scenes.startup:StartupScene",
+    "title": "game.scenes.title:TitleScene",
+    "name_entry": "game.scenes.name_entry:NameEntryScene",
+    "intro_cutscene": "game.scenes.intro_cutscene:IntroCutsceneScene",
+    "cutscene": "game.scenes.cutscene:CutsceneScene",
+    "home": "game.scenes.home:HomeBaseScene",
+    "town": "game.scenes.town:TownScene",
+    "outskirts": "game.scenes.outskirts:OutskirtsScene",
+    "world_map": "game.scenes.world_map:WorldMapScene",
+    "base_camp": "game.scenes.base_camp:BaseCampScene",
+    "guild": "game.scenes.guild:GuildScene",
+    "guild_hall": "game.scenes.guild_hall:GuildHallScene",
+    "shop": "game.scenes.shop:ShopScene",
+    "healer": "game.scenes.healer:HealerScene",
+    "inventory": "game.scenes.inventory:InventoryScene",
+    "dungeon": "game.scenes.dungeon:DungeonScene",
+    "run_summary": "game.scenes.run_summary:RunSummaryScene",
+    "platformer": "game.scenes.platformer:PlatformerScene",
+}
+
+# Where a transition leads: a built scene, a registry key, or a zero-arg factory.
+# Keys and factories are resolved only when the transition happens, so the next scene's
+# sprites, fonts and music aren't loaded (or kept alive) while the current one is showing.
+SceneRef = Scene | str | Callable[[], Scene]
+
+_classes: dict[str, type[Scene]] = {}
+
+
+def scene_class(key: str) -> type[Scene]:
+    cls = _classes.get(key)
+    if cls is None:
+        module_name, _, class_name = SCENES[key].partition(":")
+        cls = getattr(import_module(module_name), class_name)
+        _classes[key] = cls
+    return cls
+
+
+def make_scene(app, key: str, **kwargs: Any) -> Scene:
+    return scene_class(key)(app, **kwargs)
+
+
+def resolve_scene(app, ref: SceneRef) -> Scene:
+    if isinstance(ref, Scene):
+        return ref
+    if isinstance(ref, str):
+        return make_scene(app, ref)
+    return ref()
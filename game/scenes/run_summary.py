@@ -2,10 +2,11 @@ import pygame
 
 from game.constants import COLOR_BG, COLOR_TEXT
 from game.scenes.base import Scene
+from game.scenes.registry import SceneRef, resolve_scene
 
 
 class RunSummaryScene(Scene):
-    def __init__(self, app, *, title: str, lines: list[str], next_scene: Scene) -> None:
+    def __init__(self, app, *, title: str, lines: list[str], next_scene: SceneRef) -> None:
         super().__init__(app)
         self.title = title
         self.lines = lines
@@ -16,7 +17,7 @@ class RunSummaryScene(Scene):
     def handle_event(self, event: pygame.event.Event) -> Scene | None:
         if event.type == pygame.KEYDOWN:
             if event.key in (pygame.K_RETURN, pygame.K_KP_ENTER, pygame.K_e, pygame.K_ESCAPE, pygame.K_SPACE):
-                return self.next_scene
+                return resolve_scene(self.app, self.next_scene)
         return None
 
     def update(self, dt: float) -> Scene | None:
@@ -1,10 +1,11 @@
-import pygame
+import time
 
-from pathlib import Path
+import pygame
 
 from game.assets_manifest import PATHS
-from game.save import load_slot, reset_state
+from game.save import SlotInfo, list_slots, reset_state
 from game.scenes.base import Scene
+from game.scenes.registry import make_scene
 from game.state import STATE
 from game.story.flags import FLAG_SEEN_INTRO_CUTSCENE
 
@@ -16,7 +17,10 @@ class StartupScene(Scene):
         self.font = pygame.font.SysFont(None, 26)
         self.app.audio.play_music(PATHS.music / "title.ogg", volume=0.45)
 
-        self.available = {slot: (Path("saves") / f"save{slot}.json").exists() for slot in (1, 2, 3)}
+        # Header-only reads: nothing is loaded into STATE until a slot is picked.
+        self.slots = list_slots((1, 2, 3))
+        self.autosave = self.app.autosaves.info()
+        self.available = {slot: info is not None for slot, info in self.slots.items()}
 
     def handle_event(self, event: pygame.event.Event) -> Scene | None:
         if event.type != pygame.KEYDOWN:
@@ -26,7 +30,9 @@ class StartupScene(Scene):
             pygame.event.post(pygame.event.Event(pygame.QUIT))
             return None
 
-        if any(self.available.values()):
+        if any(self.available.values()) or self.autosave is not None:
+            if event.key == pygame.K_a and self.autosave is not None:
+                return self._load_autosave_then_home()
             if event.key == pygame.K_1 and self.available[1]:
                 return self._load_then_home(1)
             if event.key == pygame.K_2 and self.available[2]:
@@ -35,17 +41,11 @@ class StartupScene(Scene):
                 return self._load_then_home(3)
             if event.key in (pygame.K_n, pygame.K_RETURN, pygame.K_KP_ENTER):
                 reset_state()
-                from game.scenes.name_entry import NameEntryScene
-                from game.scenes.title import TitleScene
-
-                return NameEntryScene(self.app, next_scene=TitleScene(self.app))
+                return make_scene(self.app, "name_entry", next_scene="title")
         else:
             if event.key in (pygame.K_RETURN, pygame.K_KP_ENTER, pygame.K_SPACE):
                 reset_state()
-                from game.scenes.name_entry import NameEntryScene
-                from game.scenes.title import TitleScene
-
-                return NameEntryScene(self.app, next_scene=TitleScene(self.app))
+                return make_scene(self.app, "name_entry", next_scene="title")
 
         return None
 
@@ -59,11 +59,15 @@ class StartupScene(Scene):
         surface.blit(title, (40, 70))
 
         y = 170
-        if any(self.available.values()):
+        if any(self.available.values()) or self.autosave is not None:
             surface.blit(self.font.render("Press 1/2/3 to load a save slot, or N/Enter for new game.", True, (220, 220, 230)), (40, y))
             y += 40
             for slot in (1, 2, 3):
-                label = f"{slot}: {'Save present' if self.available[slot] else '—'}"
+                label = f"{slot}: {self._slot_label(self.slots[slot])}"
+                surface.blit(self.font.render(label, True, (200, 200, 210)), (60, y))
+                y += 30
+            if self.autosave is not None:
+                label = f"A: Autosave  {self._slot_label(self.autosave)}"
                 surface.blit(self.font.render(label, True, (200, 200, 210)), (60, y))
                 y += 30
         else:
@@ -71,28 +75,38 @@ class StartupScene(Scene):
 
         surface.blit(self.font.render("Esc: Quit", True, (200, 200, 210)), (40, 440))
 
+    @staticmethod
+    def _slot_label(info: SlotInfo | None) -> str:
+        if info is None:
+            return "—"
+        name = info.player_name.strip() or "(no name)"
+        when = time.strftime("%Y-%m-%d %H:%M", time.localtime(info.saved_at))
+        return f"{name}  Ch.{info.chapter} {info.chapter_title}  Lv {info.combat_level}  {info.gold}g  {when}"
+
+    def _load_autosave_then_home(self) -> Scene:
+        if self.app.load_autosave():
+            self.app.toast("Loaded autosave")
+            return self._after_load(autosave_slot=None)
+        self.app.toast("Autosave could not be read")
+        return make_scene(self.app, "title")
+
     def _load_then_home(self, slot: int) -> Scene:
-        ok = load_slot(slot)
+        ok = self.app.load_slot(slot)
         if ok:
             self.app.toast(f"Loaded (slot {slot})")
-            if not (STATE.player_name or "").strip():
-                from game.scenes.name_entry import NameEntryScene
-                from game.scenes.home import HomeBaseScene
-
-                return NameEntryScene(
-                    self.app,
-                    next_scene=HomeBaseScene(self.app),
-                    prompt="Enter your name (save was missing it)",
-                    autosave_slot=slot,
-                )
-            from game.scenes.home import HomeBaseScene
-
-            if int(getattr(STATE, "chapter", 1)) == 1 and not STATE.has(FLAG_SEEN_INTRO_CUTSCENE):
-                from game.scenes.intro_cutscene import IntroCutsceneScene
-
-                return IntroCutsceneScene(self.app, next_scene=HomeBaseScene(self.app))
-            return HomeBaseScene(self.app)
+            return self._after_load(autosave_slot=slot)
         self.app.toast(f"No save in slot {slot}")
-        from game.scenes.title import TitleScene
-
-        return TitleScene(self.app)
+        return make_scene(self.app, "title")
+
+    def _after_load(self, *, autosave_slot: int | None) -> Scene:
+        if not (STATE.player_name or "").strip():
+            return make_scene(
+                self.app,
+                "name_entry",
+                next_scene="home",
+                prompt="Enter your name (save was missing it)",
+                autosave_slot=autosave_slot,
+            )
+        if int(getattr(STATE, "chapter", 1)) == 1 and not STATE.has(FLAG_SEEN_INTRO_CUTSCENE):
+            return make_scene(self.app, "intro_cutscene", next_scene="home")
+        return make_scene(self.app, "home")
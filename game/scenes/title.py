@@ -3,6 +3,7 @@ import pygame
 from game.constants import COLOR_BG, COLOR_TEXT, TITLE
 from game.assets_manifest import PATHS
 from game.scenes.base import Scene
+from game.scenes.registry import make_scene
 from game.state import STATE
 from game.story.flags import FLAG_SEEN_INTRO_CUTSCENE
 
@@ -18,21 +19,12 @@ class TitleScene(Scene):
         if event.type == pygame.KEYDOWN:
             if event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
                 if not (STATE.player_name or "").strip():
-                    from game.scenes.name_entry import NameEntryScene
-
-                    return NameEntryScene(self.app, next_scene=self)
+                    return make_scene(self.app, "name_entry", next_scene=self)
                 if int(getattr(STATE, "chapter", 1)) == 1 and not STATE.has(FLAG_SEEN_INTRO_CUTSCENE):
-                    from game.scenes.home import HomeBaseScene
-                    from game.scenes.intro_cutscene import IntroCutsceneScene
-
-                    return IntroCutsceneScene(self.app, next_scene=HomeBaseScene(self.app))
-                from game.scenes.home import HomeBaseScene
-
-                return HomeBaseScene(self.app)
+                    return make_scene(self.app, "intro_cutscene", next_scene="home")
+                return make_scene(self.app, "home")
             if event.key == pygame.K_p:
-                from game.scenes.platformer import PlatformerScene
-
-                return PlatformerScene(self.app)
+                return make_scene(self.app, "platformer")
             if event.key == pygame.K_ESCAPE:
                 pygame.event.post(pygame.event.Event(pygame.QUIT))
         return None
@@ -42,6 +42,7 @@ class TownScene(Scene):
         super().__init__(app)
         self.font = pygame.font.SysFont(None, 22)
         self.app.audio.play_music(PATHS.music / "town.ogg", volume=0.45)
+        self.app.audio.prefetch_music(PATHS.music / "world_map.ogg")
 
         self.grid = _town_layout(GRID_WIDTH, GRID_HEIGHT)
         self.ground = _town_ground(GRID_WIDTH, GRID_HEIGHT)
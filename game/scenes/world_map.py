@@ -63,7 +63,7 @@ class WorldMapScene(Scene):
             from game.world.dungeon_run import DungeonRun
             from game.scenes.dungeon import DungeonScene
 
-            run = DungeonRun(dungeon_id="temple_ruins", dungeon_name="Temple Ruins", max_floor=5)
+            run = DungeonRun.for_dungeon("temple_ruins")
             return DungeonScene(self.app, run)
 
         if event.key == pygame.K_4:
@@ -73,7 +73,7 @@ class WorldMapScene(Scene):
             from game.world.dungeon_run import DungeonRun
             from game.scenes.dungeon import DungeonScene
 
-            run = DungeonRun(dungeon_id="jungle_cavern", dungeon_name="Jungle Cavern", max_floor=7)
+            run = DungeonRun.for_dungeon("jungle_cavern")
             return DungeonScene(self.app, run)
 
         return None
@@ -0,0 +1,149 @@
+"""
+Enemy spawn tables (data/spawns.json).
+
+Each dungeon lists weighted enemy entries, each with an optional floor range and a
+per-floor cap. It also lists bosses that are placed on its final floor, and relic items
+that only turn up there. At import the entries are compiled into one alias table per
+(dungeon, floor). A draw is then O(1): one random number picks a column, which is either
+kept or swapped for its alias (Vose's method). Dungeons without a table use temple_ruins.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from random import Random
+
+from game.data_pack import load_section
+from game.enemies import ENEMIES
+
+DEFAULT_DUNGEON = "temple_ruins"
+
+
+@dataclass(frozen=True)
+class SpawnEntry:
+    enemy_id: str
+    weight: float = 1.0
+    min_floor: int = 1
+    max_floor: int | None = None  # inclusive; None = no upper bound
+    cap: int | None = None  # most of this enemy per floor
+
+    def covers(self, floor: int) -> bool:
+        return self.min_floor <= floor and (self.max_floor is None or floor <= self.max_floor)
+
+
+@dataclass(frozen=True)
+class BossEntry:
+    enemy_id: str
+    min_distance: int = 8  # Manhattan distance from the player's spawn, when possible
+
+
+@dataclass(frozen=True)
+class DungeonSpawns:
+    dungeon_id: str
+    enemies: tuple[SpawnEntry, ...]
+    bosses: tuple[BossEntry, ...] = ()
+    relics: tuple[str, ...] = ()  # quest items that may only spawn on this dungeon's final floor
+
+
+def build_alias(weights: Sequence[float]) -> tuple[list[float], list[int]]:
+    """Vose's alias method: (prob, alias) columns for O(1) weighted draws."""
+    n = len(weights)
+    total = float(sum(weights))
+    scaled = [w * n / total for w in weights]
+    prob = [1.0] * n
+    alias = list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        s, l = small.pop(), large.pop()
+        prob[s] = scaled[s]
+        alias[s] = l
+        scaled[l] -= 1.0 - scaled[s]
+        (small if scaled[l] < 1.0 else large).append(l)
+    # Whatever is left is 1.0 up to rounding error.
+    return prob, alias
+
+
+class AliasTable:
+    __slots__ = ("ids", "weights", "caps", "_prob", "_alias")
+
+    def __init__(self, entries: Sequence[SpawnEntry]) -> None:
+        entries = [e for e in entries if e.weight > 0]
+        self.ids = tuple(e.enemy_id for e in entries)
+        self.weights = tuple(float(e.weight) for e in entries)
+        self.caps = tuple(e.cap for e in entries)
+        self._prob, self._alias = build_alias(self.weights) if entries else ([], [])
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def draw(self, rng: Random, counts: Mapping[str, int] | None = None) -> str | None:
+        """One weighted pick; `counts` (enemies already on the floor) enforces caps. None if all capped."""
+        n = len(self.ids)
+        if n == 0:
+            return None
+        u = rng.random() * n
+        i = int(u)
+        if u - i >= self._prob[i]:
+            i = self._alias[i]
+        cap = self.caps[i]
+        if cap is None or counts is None or counts.get(self.ids[i], 0) < cap:
+            return self.ids[i]
+        # That entry is capped out for this floor: fall back to a linear pick over the rest.
+        open_ = [j for j in range(n) if self.caps[j] is None or counts.get(self.ids[j], 0) < self.caps[j]]
+        if not open_:
+            return None
+        return self.ids[rng.choices(open_, weights=[self.weights[j] for j in open_])[0]]
+
+
+_DEFAULT_SPAWNS: dict[str, DungeonSpawns] = {
+    DEFAULT_DUNGEON: DungeonSpawns(
+        dungeon_id=DEFAULT_DUNGEON,
+        enemies=(
+            SpawnEntry("raider"),
+            SpawnEntry("bat"),
+            SpawnEntry("archer", min_floor=3),
+            SpawnEntry("guardian", min_floor=5, cap=2),
+        ),
+    ),
+}
+
+
+def _from_kwargs(kwargs: dict) -> DungeonSpawns:
+    # Unknown enemy ids are reported by tools/compile_data.py; here they're just skipped.
+    return DungeonSpawns(
+        dungeon_id=kwargs["dungeon_id"],
+        enemies=tuple(SpawnEntry(**e) for e in kwargs["enemies"] if e["enemy_id"] in ENEMIES),
+        bosses=tuple(BossEntry(**b) for b in kwargs["bosses"] if b["enemy_id"] in ENEMIES),
+        relics=tuple(kwargs["relics"]),
+    )
+
+
+def _compile(spawns: DungeonSpawns) -> tuple[AliasTable, ...]:
+    """One table per floor from 1 up to the last floor where the entry set changes."""
+    last = 1
+    for e in spawns.enemies:
+        last = max(last, e.min_floor, e.max_floor + 1 if e.max_floor is not None else 1)
+    return tuple(AliasTable([e for e in spawns.enemies if e.covers(floor)]) for floor in range(1, last + 1))
+
+
+SPAWNS: dict[str, DungeonSpawns] = _DEFAULT_SPAWNS
+_loaded = load_section("spawns")
+if _loaded:
+    SPAWNS = {key: _from_kwargs(kwargs) for key, kwargs in _loaded.items()}
+    SPAWNS.setdefault(DEFAULT_DUNGEON, _DEFAULT_SPAWNS[DEFAULT_DUNGEON])
+
+_TABLES: dict[str, tuple[AliasTable, ...]] = {key: _compile(spawns) for key, spawns in SPAWNS.items()}
+
+# Relic items restricted to the final floors of the dungeons that list them.
+RELIC_ITEMS: frozenset[str] = frozenset(item_id for spawns in SPAWNS.values() for item_id in spawns.relics)
+
+
+def dungeon_spawns(dungeon_id: str) -> DungeonSpawns:
+    return SPAWNS.get(dungeon_id) or SPAWNS[DEFAULT_DUNGEON]
+
+
+def spawn_table(dungeon_id: str, floor: int) -> AliasTable:
+    tables = _TABLES.get(dungeon_id) or _TABLES[DEFAULT_DUNGEON]
+    return tables[min(max(1, int(floor)), len(tables)) - 1]
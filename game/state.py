@@ -1,12 +1,61 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from game.events import (
+    EquipmentChanged,
+    EventBus,
+    FieldChanged,
+    FlagChanged,
+    ItemChanged,
+    KillRecorded,
+    MissionChanged,
+    StateEvent,
+)
+
+if TYPE_CHECKING:
+    from game.items import ItemDef
+
+# Fields whose changes invalidate the cached StatBlock.
+_STAT_FIELDS = frozenset({"max_hp", "base_attack", "base_defense", "equipment"})
+
+# game.items loads the content pack, which must not happen at startup; fetched on first use.
+_ITEMS: dict[str, ItemDef] | None = None
+
+
+def _items() -> dict[str, ItemDef]:
+    global _ITEMS
+    if _ITEMS is None:
+        from game.items import ITEMS
+
+        _ITEMS = ITEMS
+    return _ITEMS
+
+
+@dataclass(frozen=True)
+class StatBlock:
+    """Derived combat stats (base + equipment). Read via `GameState.stats`."""
+
+    attack: int
+    defense: int
+    max_hp: int
 
 
 @dataclass
 class GameState:
+    """
+    Mutations publish typed events (game.events) on `events` and bump per-field revisions:
+    assigning any field publishes FieldChanged, and the helper methods below publish the
+    finer-grained ones. In-place edits of a container field (`state.flags.add(...)`) are not
+    seen, so go through the helpers (or call `touch`).
+    """
+
+    # Names of the saved fields (set below the class); anything else is plain runtime state.
+    _field_names: ClassVar[frozenset[str]] = frozenset()
+
     flags: set[str] = field(default_factory=set)
-    player_name: str = ""
+    player_name: str = field(default="", metadata={"max_len": 24})
     gold: int = 50
     # Base stats (equipment bonuses are applied via helper methods).
     max_hp: int = 20
@@ -43,19 +92,82 @@ class GameState:
     def rivalry_rival_score(self) -> int:
         return int(self.rival_missions) + int(self.rival_rescues) + int(self.rival_relics) * 3
 
+    def __post_init__(self) -> None:
+        # Runtime-only attributes: set here, not declared, so they're not dataclass fields.
+        self._stats: StatBlock | None = None
+        self._bus: EventBus | None = None
+        self._revision = 0
+        self._revs: dict[str, int] = {}
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name not in self._field_names:
+            object.__setattr__(self, name, value)
+            return
+        d = self.__dict__
+        if name not in d:
+            # dataclass __init__
+            object.__setattr__(self, name, value)
+            return
+        old = d[name]
+        object.__setattr__(self, name, value)
+        if old is not value and old != value:
+            self._touched(name, FieldChanged(name, old, value))
+
+    @property
+    def events(self) -> EventBus:
+        bus = self._bus
+        if bus is None:
+            bus = self._bus = EventBus()
+        return bus
+
+    @property
+    def revision(self) -> int:
+        """Bumped by every change; compare against a saved value to see if anything changed."""
+        return self._revision
+
+    def field_revision(self, name: str) -> int:
+        return self._revs.get(name, 0)
+
+    def dirty_since(self, revision: int) -> set[str]:
+        """Fields changed after `revision` (a value previously read from `self.revision`)."""
+        return {name for name, rev in self._revs.items() if rev > revision}
+
+    def publish(self, event: StateEvent) -> None:
+        bus = self._bus
+        if bus is not None:
+            bus.publish(event)
+
+    def touch(self, name: str, event: StateEvent | None = None) -> None:
+        """Marks a field changed after an in-place edit; publishes `event` if given."""
+        self._touched(name, event)
+
+    def _touched(self, name: str, event: StateEvent | None) -> None:
+        self._revision += 1
+        self._revs[name] = self._revision
+        if name in _STAT_FIELDS:
+            self._stats = None
+        if event is not None:
+            self.publish(event)
+
     def has(self, flag: str) -> bool:
         return flag in self.flags
 
     def set(self, flag: str) -> None:
-        self.flags.add(flag)
+        if flag not in self.flags:
+            self.flags.add(flag)
+            self._touched("flags", FlagChanged(flag, True))
 
     def unset(self, flag: str) -> None:
-        self.flags.discard(flag)
+        if flag in self.flags:
+            self.flags.discard(flag)
+            self._touched("flags", FlagChanged(flag, False))
 
     def add_item(self, item_id: str, amount: int = 1) -> None:
         if amount <= 0:
             return
-        self.inventory[item_id] = self.inventory.get(item_id, 0) + amount
+        count = self.inventory.get(item_id, 0) + amount
+        self.inventory[item_id] = count
+        self._touched("inventory", ItemChanged(item_id, amount, count))
 
     def remove_item(self, item_id: str, amount: int = 1) -> bool:
         if amount <= 0:
@@ -68,6 +180,7 @@ class GameState:
             self.inventory.pop(item_id, None)
         else:
             self.inventory[item_id] = remaining
+        self._touched("inventory", ItemChanged(item_id, -amount, max(0, remaining)))
         return True
 
     def item_count(self, item_id: str) -> int:
@@ -75,6 +188,22 @@ class GameState:
 
     def equip(self, slot: str, item_id: str | None) -> None:
         self.equipment[slot] = item_id
+        self._touched("equipment", EquipmentChanged(slot, item_id))
+
+    def complete_mission(self, mission_id: str) -> None:
+        self.completed_missions.add(mission_id)
+        self._touched("completed_missions", MissionChanged(mission_id, "completed"))
+
+    def claim_mission(self, mission_id: str) -> None:
+        self.claimed_missions.add(mission_id)
+        self._touched("claimed_missions", MissionChanged(mission_id, "claimed"))
+
+    def reopen_mission(self, mission_id: str) -> None:
+        """Clears completion/claim markers so a repeatable mission can be taken again."""
+        self.completed_missions.discard(mission_id)
+        self.claimed_missions.discard(mission_id)
+        self._touched("completed_missions", None)
+        self._touched("claimed_missions", MissionChanged(mission_id, "reopened"))
 
     @staticmethod
     def combat_xp_to_next(level: int) -> int:
@@ -117,27 +246,58 @@ class GameState:
         return gained
 
     def record_kill(self, enemy_id: str) -> None:
-        self.kill_log[enemy_id] = int(self.kill_log.get(enemy_id, 0)) + 1
+        count = int(self.kill_log.get(enemy_id, 0)) + 1
+        self.kill_log[enemy_id] = count
+        self._touched("kill_log", KillRecorded(enemy_id, count))
 
     def equipment_stat_bonus(self, stat: str) -> int:
-        from game.items import ITEMS
-
+        items = _items()
         bonus = 0
-        for _, item_id in (self.equipment or {}).items():
-            if not item_id or item_id not in ITEMS:
-                continue
-            stats = ITEMS[item_id].stats or {}
-            bonus += int(stats.get(stat, 0))
+        for item_id in (self.equipment or {}).values():
+            item = items.get(item_id) if item_id else None
+            if item is not None and item.stats:
+                bonus += int(item.stats.get(stat, 0))
         return bonus
 
+    @property
+    def stats(self) -> StatBlock:
+        """
+        Cached; recomputed after max_hp, base_attack, base_defense or equipment change
+        (assignment, `equip`, level-ups) or after `invalidate_stats()`.
+        """
+        stats = self._stats
+        if stats is None:
+            # One pass over the equipment for all three bonuses.
+            items = _items()
+            attack = defense = max_hp = 0
+            for item_id in (self.equipment or {}).values():
+                item = items.get(item_id) if item_id else None
+                if item is not None and item.stats:
+                    attack += int(item.stats.get("attack", 0))
+                    defense += int(item.stats.get("defense", 0))
+                    max_hp += int(item.stats.get("max_hp", 0))
+            stats = StatBlock(
+                attack=int(self.base_attack) + attack,
+                defense=int(self.base_defense) + defense,
+                max_hp=max(1, int(self.max_hp) + max_hp),
+            )
+            self._stats = stats
+        return stats
+
+    def invalidate_stats(self) -> None:
+        self._stats = None
+
     def max_hp_total(self) -> int:
-        return max(1, int(self.max_hp) + self.equipment_stat_bonus("max_hp"))
+        return self.stats.max_hp
 
     def attack(self) -> int:
-        return int(self.base_attack) + self.equipment_stat_bonus("attack")
+        return self.stats.attack
 
     def defense(self) -> int:
-        return int(self.base_defense) + self.equipment_stat_bonus("defense")
+        return self.stats.defense
+
 
+# Private names are never saved state, even if one is ever declared as a field.
+GameState._field_names = frozenset(f.name for f in fields(GameState) if not f.name.startswith("_"))
 
 STATE = GameState()
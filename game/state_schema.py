@@ -0,0 +1,138 @@
+"""
+Field-by-field GameState helpers generated from `dataclasses.fields(GameState)`.
+
+At import every field's annotation is mapped to a kind (int, str, optional str, set of ids,
+id -> count map, slot -> optional id map) and straight-line functions are compiled for it:
+
+    snapshot(state)          cheap copy of every field (containers shallow-copied)
+    snapshot_fields(state, names)  the same for just `names`
+    json_fields(snapshot)    JSON-ready copy (sets -> sorted lists)
+    apply_fields(state, d)   coerce and assign each field from a loaded dict; missing -> default
+    apply_decoded(state, d)  same for a binary save's fields, which save_codec already decoded to
+                             the right types in fresh containers: assigned as-is (no coercion pass)
+    reset(state)             back to the dataclass defaults (empty containers cleared in place)
+
+Adding a field to GameState is picked up automatically. A field whose annotation isn't one
+of the kinds below fails at import. Per-field `metadata`:
+    max_len   truncate a str field on load
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import MISSING, fields
+from typing import Any
+
+from game.save_codec import INT, OPT_STR, STR, STR_INT_MAP, STR_OPT_STR_MAP, STR_SET
+from game.state import GameState
+
+
+_KINDS = {
+    "int": INT,
+    "str": STR,
+    "str|None": OPT_STR,
+    "set[str]": STR_SET,
+    "dict[str,int]": STR_INT_MAP,
+    "dict[str,str|None]": STR_OPT_STR_MAP,
+}
+
+_CONTAINERS = (STR_SET, STR_INT_MAP, STR_OPT_STR_MAP)
+
+
+def _opt_str(value: Any) -> str | None:
+    return None if value is None else str(value)
+
+
+def _kind_of(annotation: Any) -> str:
+    text = annotation if isinstance(annotation, str) else getattr(annotation, "__name__", repr(annotation))
+    kind = _KINDS.get(text.replace(" ", ""))
+    if kind is None:
+        raise TypeError(f"GameState field type {annotation!r} has no save kind; add one to game/state_schema.py")
+    return kind
+
+
+def _compile() -> tuple[tuple[tuple[str, str], ...], dict[str, Callable[..., Any]]]:
+    ns: dict[str, Any] = {"_MISSING": MISSING, "_opt_str": _opt_str}
+    kinds: list[tuple[str, str]] = []
+    snap = ["def snapshot(state):", "    return {"]
+    to_json = ["def json_fields(snapshot):", "    d = dict(snapshot)"]
+    apply = ["def apply_fields(state, data):", "    get = data.get"]
+    decoded = ["def apply_decoded(state, data):", "    get = data.get"]
+    reset = ["def reset(state):"]
+
+    for f in fields(GameState):
+        if f.name.startswith("_"):
+            continue  # runtime state, never saved (see GameState._field_names)
+        name, kind = f.name, _kind_of(f.type)
+        kinds.append((name, kind))
+        if f.default_factory is not MISSING:
+            ns[f"_new_{name}"] = f.default_factory
+            default_expr = f"_new_{name}()"
+            empty = not f.default_factory()
+        else:
+            ns[f"_default_{name}"] = f.default
+            default_expr = f"_default_{name}"
+            empty = False
+
+        snap.append(f"        {name!r}: state.{name}.copy()," if kind in _CONTAINERS else f"        {name!r}: state.{name},")
+
+        if kind == STR_SET:
+            to_json.append(f"    d[{name!r}] = sorted(snapshot[{name!r}])")
+
+        apply.append(f"    v = get({name!r}, _MISSING)")
+        decoded.append(f"    v = get({name!r}, _MISSING)")
+        typed = "v"
+        if kind == INT:
+            value = "int(v)"
+        elif kind == STR:
+            max_len = f.metadata.get("max_len")
+            value = f"str(v)[:{int(max_len)}]" if max_len is not None else "str(v)"
+            if max_len is not None:
+                typed = f"v[:{int(max_len)}]"
+        elif kind == OPT_STR:
+            value = "_opt_str(v)"
+        elif kind == STR_SET:
+            value = "set(map(str, v or ()))"
+        elif kind == STR_INT_MAP:
+            value = "{str(k): int(n) for k, n in (v or {}).items()}"
+        elif not empty:
+            # Fixed slots (e.g. equipment): keep exactly the default's keys.
+            ns[f"_keys_{name}"] = tuple(f.default_factory())
+            value = f"{{k: _opt_str((v or {{}}).get(k)) for k in _keys_{name}}}"
+            typed = value
+        else:
+            value = "{str(k): _opt_str(x) for k, x in (v or {}).items()}"
+        apply.append(f"    state.{name} = {default_expr} if v is _MISSING else {value}")
+        decoded.append(f"    state.{name} = {default_expr} if v is _MISSING else {typed}")
+
+        if kind in _CONTAINERS and empty:
+            reset.append(f"    state.{name}.clear()")
+        else:
+            reset.append(f"    state.{name} = {default_expr}")
+
+    snap.append("    }")
+    to_json.append("    return d")
+    source = "\n".join(snap + [""] + to_json + [""] + apply + [""] + decoded + [""] + reset) + "\n"
+    exec(compile(source, "<game.state_schema>", "exec"), ns)
+    funcs = {k: ns[k] for k in ("snapshot", "json_fields", "apply_fields", "apply_decoded", "reset")}
+    return tuple(kinds), funcs
+
+
+FIELD_KINDS, _FUNCS = _compile()
+
+snapshot: Callable[[GameState], dict[str, Any]] = _FUNCS["snapshot"]
+json_fields: Callable[[dict[str, Any]], dict[str, Any]] = _FUNCS["json_fields"]
+apply_fields: Callable[[GameState, dict[str, Any]], None] = _FUNCS["apply_fields"]
+apply_decoded: Callable[[GameState, dict[str, Any]], None] = _FUNCS["apply_decoded"]
+reset: Callable[[GameState], None] = _FUNCS["reset"]
+
+_SAVED_FIELDS = frozenset(name for name, _ in FIELD_KINDS)
+_CONTAINER_FIELDS = frozenset(name for name, kind in FIELD_KINDS if kind in _CONTAINERS)
+
+
+def snapshot_fields(state: GameState, names: Iterable[str]) -> dict[str, Any]:
+    return {
+        name: getattr(state, name).copy() if name in _CONTAINER_FIELDS else getattr(state, name)
+        for name in names
+        if name in _SAVED_FIELDS
+    }
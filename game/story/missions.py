@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 from game.state import GameState
 from typing import Any
 
-from game.data_loader import load_json
+from game.data_pack import load_section
 
 @dataclass(frozen=True)
 class MissionDef:
@@ -193,36 +193,10 @@ _DEFAULT_MISSIONS: dict[str, MissionDef] = {
 }
 
 
-def _missions_from_json(data: dict[str, Any]) -> dict[str, MissionDef]:
-    missions: dict[str, MissionDef] = {}
-    for mission_id, raw in data.items():
-        if not isinstance(raw, dict):
-            continue
-        missions[mission_id] = MissionDef(
-            mission_id=mission_id,
-            name=str(raw.get("name", mission_id)),
-            description=str(raw.get("description", "")),
-            mission_type=str(raw.get("mission_type", "misc")),
-            min_chapter=int(raw.get("min_chapter", 1)),
-            accept_lines=list(raw.get("accept_lines", []) or []),
-            turn_in_lines=list(raw.get("turn_in_lines", []) or []),
-            reward_gold=int(raw.get("reward_gold", 0)),
-            reward_guild_xp=int(raw.get("reward_guild_xp", 0)),
-            board=str(raw.get("board", "guild")),
-            repeatable=bool(raw.get("repeatable", False)),
-            reward_items=dict(raw.get("reward_items", {}) or {}),
-            consume_items=dict(raw.get("consume_items", {}) or {}),
-            objectives=list(raw.get("objectives", []) or []),
-        )
-    return missions
-
-
 MISSIONS: dict[str, MissionDef] = _DEFAULT_MISSIONS
-_loaded = load_json("data/missions.json")
-if isinstance(_loaded, dict):
-    parsed = _missions_from_json(_loaded)
-    if parsed:
-        MISSIONS = parsed
+_loaded = load_section("missions")
+if _loaded:
+    MISSIONS = {key: MissionDef(**kwargs) for key, kwargs in _loaded.items()}
 
 
 def is_turn_in_available(state: GameState, mission_id: str) -> bool:
@@ -245,7 +219,7 @@ def apply_turn_in_rewards(state: GameState, mission_id: str) -> bool:
             state.relics_turned_in_total = int(getattr(state, "relics_turned_in_total", 0)) + int(count)
     for item_id, count in mission.reward_items.items():
         state.add_item(item_id, count)
-    state.claimed_missions.add(mission_id)
+    state.claim_mission(mission_id)
 
     # Rival progression (simple deterministic "they also did stuff" model).
     try:
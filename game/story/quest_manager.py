@@ -45,6 +45,10 @@ def is_mission_complete(
     dungeon_id: str | None = None,
     floor: int | None = None,
 ) -> bool:
+    """
+    Walks every objective. Fine for one-off checks; tracked missions (see
+    game.story.quest_tracker.QUESTS) answer the same question from running counters.
+    """
     mission = MISSIONS.get(mission_id)
     if mission is None:
         return False
@@ -0,0 +1,198 @@
+"""
+Incremental mission-objective tracking.
+
+Each tracked mission's objectives are indexed by what can move them (item id, enemy id,
+dungeon, rescues) and keep a running `have` counter that's updated from GameState events,
+so `is_complete` is a lookup instead of a walk over every objective. Any number of missions
+can be tracked at once; `QUESTS` follows `STATE.active_mission` automatically.
+
+Objective kinds match quest_manager: collect_item, defeat_enemy (counted from the kill
+baseline taken when the mission was accepted), rescue_miners, reach_floor (true while the
+player is on that dungeon floor or deeper; see `set_location`).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from game.events import FieldChanged, ItemChanged, KillRecorded, StateReplaced
+from game.state import GameState, STATE
+from game.story.missions import MISSIONS
+
+
+@dataclass
+class Objective:
+    mission_id: str
+    kind: str
+    key: str  # item_id / enemy_id / dungeon_id; "" for rescue_miners
+    need: int
+    have: int = 0
+    baseline: int = 0  # defeat_enemy: kill count when the mission was accepted
+
+    @property
+    def done(self) -> bool:
+        return self.have >= self.need
+
+
+class QuestTracker:
+    def __init__(self, state: GameState = STATE, *, follow_active: bool = True) -> None:
+        self.state = state
+        self.follow_active = follow_active
+        self._objectives: dict[str, list[Objective]] = {}
+        self._remaining: dict[str, int] = {}
+        self._by_item: dict[str, list[Objective]] = {}
+        self._by_enemy: dict[str, list[Objective]] = {}
+        self._by_dungeon: dict[str, list[Objective]] = {}
+        self._rescues: list[Objective] = []
+        self._location: tuple[str, int] | None = None
+        self._followed: str | None = None
+
+        bus = state.events
+        bus.subscribe(ItemChanged, self._on_item)
+        bus.subscribe(KillRecorded, self._on_kill)
+        bus.subscribe(FieldChanged, self._on_field)
+        bus.subscribe(StateReplaced, lambda _event: self.resync())
+        self.resync()
+
+    # --- tracking ------------------------------------------------------------------
+
+    def track(self, mission_id: str, *, kill_baseline: dict[str, int] | None = None) -> None:
+        """(Re)starts tracking a mission; kill objectives count from `kill_baseline` (default: now)."""
+        self.untrack(mission_id)
+        mission = MISSIONS.get(mission_id)
+        if mission is None:
+            return
+        baseline = self.state.kill_log if kill_baseline is None else kill_baseline
+        objectives: list[Objective] = []
+        for obj in mission.objectives:
+            kind = str(obj.get("type", ""))
+            if kind == "collect_item":
+                o = Objective(mission_id, kind, str(obj.get("item_id", "")), int(obj.get("count", 1)))
+                self._by_item.setdefault(o.key, []).append(o)
+            elif kind == "defeat_enemy":
+                o = Objective(mission_id, kind, str(obj.get("enemy_id", "")), int(obj.get("count", 1)))
+                o.baseline = int((baseline or {}).get(o.key, 0))
+                self._by_enemy.setdefault(o.key, []).append(o)
+            elif kind == "rescue_miners":
+                o = Objective(mission_id, kind, "", int(obj.get("count", 1)))
+                self._rescues.append(o)
+            elif kind == "reach_floor":
+                o = Objective(mission_id, kind, str(obj.get("dungeon_id", "")), int(obj.get("floor", 1)))
+                self._by_dungeon.setdefault(o.key, []).append(o)
+            else:
+                # Unknown objective types never complete (same as quest_manager).
+                o = Objective(mission_id, kind, "", 1)
+            o.have = self._current(o)
+            objectives.append(o)
+        self._objectives[mission_id] = objectives
+        self._remaining[mission_id] = sum(1 for o in objectives if not o.done)
+
+    def untrack(self, mission_id: str) -> None:
+        objectives = self._objectives.pop(mission_id, None)
+        self._remaining.pop(mission_id, None)
+        if not objectives:
+            return
+        for index in (self._by_item, self._by_enemy, self._by_dungeon):
+            for key in {o.key for o in objectives}:
+                kept = [o for o in index.get(key, ()) if o.mission_id != mission_id]
+                if kept:
+                    index[key] = kept
+                else:
+                    index.pop(key, None)
+        self._rescues = [o for o in self._rescues if o.mission_id != mission_id]
+
+    def resync(self) -> None:
+        """Rebuilds everything from the state (after a load/reset)."""
+        tracked = [m for m in self._objectives if m != self._followed]
+        for mission_id in list(self._objectives):
+            self.untrack(mission_id)
+        self._followed = None
+        for mission_id in tracked:
+            self.track(mission_id)
+        self._follow_active()
+
+    # --- queries -------------------------------------------------------------------
+
+    @property
+    def tracked(self) -> tuple[str, ...]:
+        return tuple(self._objectives)
+
+    def is_complete(self, mission_id: str) -> bool:
+        return self._remaining.get(mission_id) == 0
+
+    def completed(self) -> list[str]:
+        return [m for m, left in self._remaining.items() if left == 0]
+
+    def objectives(self, mission_id: str) -> tuple[Objective, ...]:
+        return tuple(self._objectives.get(mission_id, ()))
+
+    def wants_item(self, item_id: str) -> bool:
+        """A tracked mission has a collect objective for this item (done or not)."""
+        return item_id in self._by_item
+
+    def wanted_items(self) -> list[str]:
+        """Items still to collect for tracked missions, in mission/objective order."""
+        return [o.key for objs in self._objectives.values() for o in objs if o.kind == "collect_item" and not o.done]
+
+    def set_location(self, dungeon_id: str | None, floor: int | None = None) -> None:
+        """Where the player is now (None when not in a dungeon); drives reach_floor objectives."""
+        old = self._location
+        self._location = (dungeon_id, int(floor or 0)) if dungeon_id else None
+        keys = {k for k in (old and old[0], dungeon_id) if k}
+        for key in keys:
+            for o in self._by_dungeon.get(key, ()):
+                self._set(o, self._current(o))
+
+    # --- updates -------------------------------------------------------------------
+
+    def _current(self, o: Objective) -> int:
+        if o.kind == "collect_item":
+            return self.state.item_count(o.key)
+        if o.kind == "defeat_enemy":
+            return int(self.state.kill_log.get(o.key, 0)) - o.baseline
+        if o.kind == "rescue_miners":
+            return int(self.state.rescued_miners_total)
+        if o.kind == "reach_floor":
+            loc = self._location
+            return loc[1] if loc is not None and loc[0] == o.key else 0
+        return 0
+
+    def _set(self, o: Objective, have: int) -> None:
+        was = o.done
+        o.have = have
+        if was != o.done:
+            self._remaining[o.mission_id] += 1 if was else -1
+
+    def _follow_active(self) -> None:
+        if not self.follow_active:
+            return
+        active = self.state.active_mission
+        if self._followed is not None and self._followed != active:
+            self.untrack(self._followed)
+        self._followed = active
+        if active:
+            self.track(active, kill_baseline=self.state.mission_kill_baseline)
+
+    def _on_item(self, event: ItemChanged) -> None:
+        for o in self._by_item.get(event.item_id, ()):
+            self._set(o, event.count)
+
+    def _on_kill(self, event: KillRecorded) -> None:
+        for o in self._by_enemy.get(event.enemy_id, ()):
+            self._set(o, event.count - o.baseline)
+
+    def _on_field(self, event: FieldChanged) -> None:
+        name = event.field
+        if name == "rescued_miners_total":
+            for o in self._rescues:
+                self._set(o, int(event.new))
+        elif name in ("active_mission", "mission_kill_baseline"):
+            self._follow_active()
+        elif name in ("inventory", "kill_log"):
+            # Replaced wholesale: recount everything that depends on it.
+            for objs in self._objectives.values():
+                for o in objs:
+                    self._set(o, self._current(o))
+
+
+QUESTS = QuestTracker(STATE)
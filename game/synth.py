@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import math
+import sys
+import wave
+from array import array
+from dataclasses import dataclass, replace
+from pathlib import Path
+from random import Random
+
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the array fallback is fine for short blips.
+    np = None
+
+
+@dataclass(frozen=True)
+class Tone:
+    freq: float
+    ms: int
+    volume: float = 0.35
+    slide: float = 0.0
+    attack_ms: float = 10.0
+    release_ms: float = 30.0
+
+
+# Same recipes `tools/generate_placeholders.py` uses for `assets/sfx/*.wav` (mono, 16-bit, this rate).
+PLACEHOLDER_RATE = 44100
+PLACEHOLDER_TONES: dict[str, Tone] = {
+    "hit": Tone(freq=220, ms=120, volume=0.45, slide=-80),
+    "pickup": Tone(freq=880, ms=90, volume=0.35, slide=140),
+    "door": Tone(freq=330, ms=140, volume=0.35, slide=40),
+    "confirm": Tone(freq=660, ms=90, volume=0.30),
+    "shoot": Tone(freq=520, ms=90, volume=0.30, slide=-120),
+    "heal": Tone(freq=740, ms=160, volume=0.30, slide=60),
+    "step": Tone(freq=180, ms=45, volume=0.20),
+    "ui_open": Tone(freq=860, ms=120, volume=0.28, slide=120),
+    "ui_close": Tone(freq=740, ms=110, volume=0.26, slide=-120),
+    "error": Tone(freq=190, ms=170, volume=0.32, slide=-30),
+    "equip": Tone(freq=540, ms=90, volume=0.28, slide=80),
+    "mission": Tone(freq=520, ms=240, volume=0.30, slide=260),
+}
+
+# Sounds heard many times per run get pitch-randomized variants (relative spread).
+PITCH_SPREAD: dict[str, float] = {
+    "hit": 0.08,
+    "step": 0.12,
+}
+
+
+def frame_count(tone: Tone, sample_rate: int) -> int:
+    return max(1, int(sample_rate * (tone.ms / 1000.0)))
+
+
+def is_placeholder_wav(path: Path) -> bool:
+    """
+    True if `path` is the WAV the placeholder tool writes for its name: mono 16-bit at
+    PLACEHOLDER_RATE, exactly the recipe's length. Only reads the header.
+    """
+    tone = PLACEHOLDER_TONES.get(path.stem)
+    if tone is None:
+        return False
+    try:
+        with wave.open(str(path), "rb") as wf:
+            params = (wf.getnchannels(), wf.getsampwidth(), wf.getframerate(), wf.getnframes())
+    except (OSError, EOFError, wave.Error):
+        return False
+    return params == (1, 2, PLACEHOLDER_RATE, frame_count(tone, PLACEHOLDER_RATE))
+
+
+def render(tone: Tone, *, sample_rate: int = 44100):
+    """
+    Returns mono samples in [-1, 1]: a NumPy array when NumPy is installed, else a list.
+    """
+    n = frame_count(tone, sample_rate)
+    span = max(1, n - 1)
+    attack = max(1.0, sample_rate * tone.attack_ms / 1000.0)
+    release = max(1.0, sample_rate * tone.release_ms / 1000.0)
+
+    if np is not None:
+        i = np.arange(n, dtype=np.float64)
+        freq = tone.freq + tone.slide * (i / span)
+        env = np.minimum(1.0, i / attack) * np.minimum(1.0, (n - 1 - i) / release)
+        return np.clip(np.sin((2.0 * math.pi / sample_rate) * freq * i) * (tone.volume * env), -1.0, 1.0)
+
+    sin = math.sin
+    w = 2.0 * math.pi / sample_rate
+    return [
+        max(-1.0, min(1.0, sin(w * (tone.freq + tone.slide * i / span) * i) * tone.volume * min(1.0, i / attack) * min(1.0, (n - 1 - i) / release)))
+        for i in range(n)
+    ]
+
+
+def to_pcm16(samples, *, channels: int = 1, byteorder: str = "little") -> bytes:
+    """
+    Packs mono samples as signed 16-bit PCM, duplicated across `channels`. Little-endian
+    by default, as WAV stores it; the mixer takes `sys.byteorder`.
+    """
+    if np is not None and isinstance(samples, np.ndarray):
+        pcm = (samples * 32767).astype("<i2" if byteorder == "little" else ">i2")
+        if channels > 1:
+            pcm = np.repeat(pcm, channels)
+        return pcm.tobytes()
+    pcm = array("h", [int(v * 32767) for v in samples])
+    if channels > 1:
+        pcm = array("h", [v for v in pcm for _ in range(channels)])
+    if byteorder != sys.byteorder:
+        pcm.byteswap()
+    return pcm.tobytes()
+
+
+def _to_mixer_bytes(samples, *, fmt: int, channels: int) -> bytes | None:
+    if fmt == -16:  # AUDIO_S16SYS
+        return to_pcm16(samples, channels=channels, byteorder=sys.byteorder)
+    if fmt == -32:  # AUDIO_F32SYS
+        if np is not None and isinstance(samples, np.ndarray):
+            data = samples.astype(np.float32)
+            return (np.repeat(data, channels) if channels > 1 else data).tobytes()
+        floats = array("f", samples)
+        if channels > 1:
+            floats = array("f", [v for v in floats for _ in range(channels)])
+        return floats.tobytes()
+    return None
+
+
+def make_sound(tone: Tone) -> pygame.mixer.Sound | None:
+    """Builds a Sound straight from memory in the mixer's native format (None if unsupported)."""
+    init = pygame.mixer.get_init()
+    if not init:
+        return None
+    sample_rate, fmt, channels = init
+    data = _to_mixer_bytes(render(tone, sample_rate=sample_rate), fmt=fmt, channels=channels)
+    if data is None:
+        return None
+    return pygame.mixer.Sound(buffer=data)
+
+
+def placeholder_variants(name: str, *, rng: Random, count: int = 4) -> list[pygame.mixer.Sound]:
+    """
+    Synthesizes the placeholder for `name` (e.g. "hit"); names in PITCH_SPREAD get
+    `count` detuned variants so repeated sounds don't feel canned.
+    """
+    tone = PLACEHOLDER_TONES.get(name)
+    if tone is None:
+        return []
+    spread = PITCH_SPREAD.get(name, 0.0)
+    tones = [tone]
+    if spread > 0:
+        for _ in range(max(0, count - 1)):
+            ratio = 1.0 + rng.uniform(-spread, spread)
+            tones.append(replace(tone, freq=tone.freq * ratio, slide=tone.slide * ratio))
+    sounds: list[pygame.mixer.Sound] = []
+    for t in tones:
+        snd = make_sound(t)
+        if snd is not None:
+            sounds.append(snd)
+    return sounds
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import pygame
+
+from game.profiler import Profiler
+
+_COLUMNS = (("p50", 170), ("p95", 235), ("max", 300))
+
+
+class ProfilerOverlay:
+    """Bottom-right table of span timings (ms, rolling window); re-rendered a few times a second."""
+
+    def __init__(self, profiler: Profiler, *, refresh: float = 0.25) -> None:
+        self.profiler = profiler
+        self.font = pygame.font.SysFont(None, 18)
+        self.refresh = refresh
+        self._age = refresh
+        self._panel: pygame.Surface | None = None
+
+    def draw(self, surface: pygame.Surface, dt: float) -> None:
+        self._age += dt
+        if self._panel is None or self._age >= self.refresh:
+            self._age = 0.0
+            self._panel = self._render(self.profiler)
+        w, h = self._panel.get_size()
+        surface.blit(self._panel, (surface.get_width() - w - 8, surface.get_height() - h - 8))
+
+    def _render(self, profiler: Profiler) -> pygame.Surface:
+        rows: list[tuple[str, tuple[str, ...]]] = [("span (ms)", tuple(name for name, _ in _COLUMNS))]
+        for name, stats in sorted(profiler.stats.items()):
+            p50, p95 = stats.percentiles(50, 95)
+            window_max = max(stats.recent, default=0)
+            rows.append((name, tuple(f"{ns / 1e6:.2f}" for ns in (p50, p95, window_max))))
+        if len(rows) == 1:
+            rows.append(("(no samples yet)", ()))
+        line_h = self.font.get_linesize()
+        panel = pygame.Surface((360, line_h * len(rows) + 12), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 190))
+        for i, (name, values) in enumerate(rows):
+            y = 6 + i * line_h
+            color = (200, 200, 120) if i == 0 else (235, 235, 235)
+            panel.blit(self.font.render(name, True, color), (8, y))
+            for (_, x), value in zip(_COLUMNS, values):
+                text = self.font.render(value, True, color)
+                panel.blit(text, (x + 50 - text.get_width(), y))
+        return panel
@@ -29,10 +29,11 @@ class StatusMenu:
         left_x = rect.left + 16
         y = rect.top + 60
 
+        stats = state.stats
         lines = [
             f"Name: {(state.player_name or '').strip() or '-'}",
-            f"HP: {state.hp}/{state.max_hp_total()}",
-            f"ATK: {state.attack()}  DEF: {state.defense()}",
+            f"HP: {state.hp}/{stats.max_hp}",
+            f"ATK: {stats.attack}  DEF: {stats.defense}",
             f"Gold: {state.gold}",
             f"Combat Lv: {state.combat_level}  XP: {state.combat_xp}/{state.combat_xp_to_next(state.combat_level)}",
             f"Guild Rank: {state.guild_rank}  XP: {state.guild_xp}/{state.guild_xp_to_next(state.guild_rank)}",
@@ -0,0 +1,92 @@
+"""
+Dormant enemies, parked by region.
+
+The floor is cut into square buckets of `bucket` cells. An enemy is far from the player
+when its bucket is more than `reach` buckets away (Chebyshev), which is at least
+`bucket * reach + 1` cells. DungeonSim parks idle far enemies here instead of giving them
+turns, and wakes a region when the player comes within reach of it or a noise carries
+into it. Parked enemies don't move, so they stay in the bucket they were parked in.
+
+Wake order is stable (buckets row by row, then parking order), so runs stay
+deterministic for a seed.
+"""
+
+from __future__ import annotations
+
+from game.entities.enemy import Enemy
+
+Bucket = tuple[int, int]
+
+
+class DormantSet:
+    def __init__(self, *, bucket: int = 6, reach: int = 2) -> None:
+        self.bucket = bucket
+        self.reach = reach
+        self._buckets: dict[Bucket, dict[int, Enemy]] = {}
+        self._where: dict[int, Bucket] = {}
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, enemy: Enemy) -> bool:
+        return id(enemy) in self._where
+
+    def bucket_of(self, x: int, y: int) -> Bucket:
+        return x // self.bucket, y // self.bucket
+
+    def is_far(self, enemy: Enemy, x: int, y: int) -> bool:
+        ex, ey = self.bucket_of(enemy.x, enemy.y)
+        bx, by = self.bucket_of(x, y)
+        return max(abs(ex - bx), abs(ey - by)) > self.reach
+
+    def park(self, enemy: Enemy) -> None:
+        key = self.bucket_of(enemy.x, enemy.y)
+        self._buckets.setdefault(key, {})[id(enemy)] = enemy
+        self._where[id(enemy)] = key
+
+    def discard(self, enemy: Enemy) -> None:
+        key = self._where.pop(id(enemy), None)
+        if key is not None:
+            here = self._buckets[key]
+            del here[id(enemy)]
+            if not here:
+                del self._buckets[key]
+
+    def wake_region(self, x: int, y: int) -> list[Enemy]:
+        """Takes out every enemy within `reach` buckets of (x, y)."""
+        bx, by = self.bucket_of(x, y)
+        r = self.reach
+        return self._take(
+            (cx, cy) for cy in range(by - r, by + r + 1) for cx in range(bx - r, bx + r + 1)
+        )
+
+    def wake_near(self, x: int, y: int, radius: int) -> list[Enemy]:
+        """Takes out every enemy within `radius` cells (Manhattan) of (x, y)."""
+        if not self._where:
+            return []
+        b = self.bucket
+        keys = [
+            (cx, cy)
+            for cy in range((y - radius) // b, (y + radius) // b + 1)
+            for cx in range((x - radius) // b, (x + radius) // b + 1)
+        ]
+        woken: list[Enemy] = []
+        for key in keys:
+            here = self._buckets.get(key)
+            if not here:
+                continue
+            for enemy in [e for e in here.values() if abs(e.x - x) + abs(e.y - y) <= radius]:
+                self.discard(enemy)
+                woken.append(enemy)
+        return woken
+
+    def _take(self, keys) -> list[Enemy]:
+        woken: list[Enemy] = []
+        for key in keys:
+            here = self._buckets.pop(key, None)
+            if not here:
+                continue
+            for enemy_key, enemy in here.items():
+                del self._where[enemy_key]
+                woken.append(enemy)
+        return woken
@@ -3,6 +3,27 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 import zlib
 
+# Display name and depth per dungeon id. Unlock rules live with the Outskirts menu.
+DUNGEONS: dict[str, tuple[str, int]] = {
+    "temple_ruins": ("Temple Ruins", 5),
+    "jungle_cavern": ("Jungle Cavern", 7),
+    "nephil_dunes": ("Nephil Dunes", 4),
+    "nephil_oasis": ("Nephil Oasis Ruins", 5),
+    "nephil_tomb": ("Nephil Sunken Tomb", 6),
+    "collapsed_mines": ("Collapsed Mines", 6),
+    "deep_shaft": ("Deepest Shaft", 8),
+    "children_hideout": ("Children Hideout", 5),
+    "babel_tower": ("Tower of Babel", 9),
+    "children_vault": ("Children Vault", 6),
+    "_base_camp": ("Ice Expedition Base Camp", 1),
+    "snowbound_path": ("Snowbound Path", 4),
+    "ice_cave": ("Ice Cave", 5),
+    "mt_arot": ("Mt Arot", 6),
+    "ice_cave_2": ("Ice Cave (Lower)", 6),
+    "tropic_volcano": ("Tropic Island Volcano", 7),
+    "core_descent": ("Journey to the Core", 9),
+}
+
 
 @dataclass
 class DungeonRun:
@@ -11,6 +32,8 @@ class DungeonRun:
     max_floor: int = 5
     floor: int = 1
     seed_base: int = 0
+    # Horde mode: every floor is packed with enemies (see dungeon_sim.HORDE_SPACING).
+    horde: bool = False
     _floor_seeds: dict[int, int] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
@@ -18,6 +41,11 @@ class DungeonRun:
             # Stable seed derived from dungeon_id (avoid Python's randomized hash()).
             self.seed_base = zlib.crc32(self.dungeon_id.encode("utf-8")) % 2_000_000_000
 
+    @classmethod
+    def for_dungeon(cls, dungeon_id: str, *, seed_base: int = 0, horde: bool = False) -> DungeonRun:
+        name, max_floor = DUNGEONS[dungeon_id]
+        return cls(dungeon_id, name, max_floor=max_floor, seed_base=seed_base, horde=horde)
+
     def seed_for_floor(self, floor: int) -> int:
         if floor not in self._floor_seeds:
             self._floor_seeds[floor] = self.seed_base + floor * 1013
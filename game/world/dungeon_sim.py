@@ -0,0 +1,1055 @@
+"""
+Headless dungeon rules.
+
+`DungeonSim` owns one dungeon run: the floor grid, the player, enemies, pickups, the fog,
+and the run's tallies. `step(action)` applies one player action and the enemy turn it
+triggers, and returns what happened as typed events. DungeonScene turns key presses into
+actions and maps the events to sounds, toasts, autosaves and scene changes. Balance and
+regression tools call `step` directly, without pygame. `message` holds the player-facing
+line for the last action.
+
+Once `outcome` is set ("escaped", "mission", "died"), the run is over and `step` does
+nothing.
+"""
+
+from __future__ import annotations
+
+import random
+import zlib
+from array import array
+from dataclasses import dataclass
+
+from game.constants import (
+    GRID_HEIGHT,
+    GRID_WIDTH,
+    TILE_DUNGEON_EXIT,
+    TILE_FLOOR,
+    TILE_STAIRS_DOWN,
+    TILE_STAIRS_UP,
+    TILE_WALL,
+)
+from game.enemies import spawn_enemy
+from game.entities.enemy import Enemy
+from game.entities.pickup import Pickup
+from game.entities.player import GridPlayer
+from game.items import ITEMS, get_item
+from game.spawns import RELIC_ITEMS, dungeon_spawns, spawn_table
+from game.state import GameState, STATE
+from game.story.missions import MISSIONS
+from game.story.quest_tracker import QUESTS, QuestTracker
+from game.world import enemy_table
+from game.world.dungeon_gen import generate_dungeon
+from game.world.dormancy import DormantSet
+from game.world.dungeon_run import DungeonRun
+from game.world.enemy_table import EnemyTable
+from game.world.flow_field import FlowField
+from game.world.fov import FieldOfView
+from game.world.occupancy import Occupancy
+from game.world.scheduler import TimingWheel
+
+SKILLS = ("whip", "throw_rock", "guard")
+
+# Turns an enemy keeps chasing after it last saw the player.
+AGGRO_TURNS = 6
+# Noise wakes dormant enemies within this many tiles (Manhattan) of where it happens, and
+# keeps them from dozing off again for NOISE_AWAKE_TURNS.
+NOISE_COMBAT = 8
+NOISE_ROCK = 10
+NOISE_AWAKE_TURNS = 12
+# Horde floors (DungeonRun.horde) spawn one enemy per this many open cells.
+HORDE_SPACING = 4
+# Floors with at least this many enemies (horde floors) also keep them in an EnemyTable,
+# when NumPy is installed.
+ENEMY_TABLE_MIN = 24
+
+# Bosses that seal the exit of their final floor while alive.
+_SEALED_EXIT = {
+    "mummy_king": "A cursed weight seals the exit. Defeat the Mummified King.",
+    "ice_colossus": "The mountain groans. The Colossus still stands.",
+    "children_warmaster": "Heat and steel block the way. Defeat the Warmaster.",
+    "children_high_priest": "A chant pins you in place. End the High Priest.",
+}
+
+# Story items a boss hands over when killed, if a tracked mission still wants them.
+_BOSS_RELICS = {
+    "mummy_king": ("nephil_relic_crown", " You claim the Crown of Dust."),
+    "ice_colossus": ("arrowhead_map", " You recover a frozen map."),
+    "children_warmaster": ("arrowhead_tip", " You seize the Arrow Tip Fragment."),
+}
+
+
+# --- actions ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class Action:
+    pass
+
+
+@dataclass(frozen=True)
+class Move(Action):
+    """Step one tile; walking into an enemy attacks it."""
+
+    dx: int
+    dy: int
+
+
+@dataclass(frozen=True)
+class UseStairs(Action):
+    pass
+
+
+@dataclass(frozen=True)
+class UseItem(Action):
+    item_id: str
+
+
+@dataclass(frozen=True)
+class UseSkill(Action):
+    skill_id: str
+
+
+@dataclass(frozen=True)
+class Wait(Action):
+    pass
+
+
+@dataclass(frozen=True)
+class Regenerate(Action):
+    """Debug: rebuilds the current floor from its seed. No turn passes."""
+
+
+# --- events ----------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class SimEvent:
+    pass
+
+
+@dataclass(frozen=True)
+class ActionFailed(SimEvent):
+    """The action was refused (the reason is in `message`); the scene plays an error sound."""
+
+
+@dataclass(frozen=True)
+class PlayerStepped(SimEvent):
+    dx: int
+    dy: int
+
+
+@dataclass(frozen=True)
+class PlayerAttacked(SimEvent):
+    enemy_id: str
+    damage: int
+    source: str  # "melee" | "whip" | "throw_rock"
+    killed: bool
+
+
+@dataclass(frozen=True)
+class EnemyKilled(SimEvent):
+    enemy_id: str
+    gold: int
+
+
+@dataclass(frozen=True)
+class CombatLevelUp(SimEvent):
+    level: int
+
+
+@dataclass(frozen=True)
+class PlayerHit(SimEvent):
+    enemy_id: str
+    damage: int
+    ranged: bool
+
+
+@dataclass(frozen=True)
+class ItemGained(SimEvent):
+    item_id: str
+    amount: int
+    source: str  # "pickup" | "drop" | "boss" | "rescue"
+
+
+@dataclass(frozen=True)
+class ItemUsed(SimEvent):
+    item_id: str
+    effect: str  # "heal_hp" | "cure_poison" | ""
+
+
+@dataclass(frozen=True)
+class Rescued(SimEvent):
+    kind: str  # "trapped_miner" | "head_miner" | "rival_hostage"
+
+
+@dataclass(frozen=True)
+class RescuesCommitted(SimEvent):
+    miners: int
+
+
+@dataclass(frozen=True)
+class Guarding(SimEvent):
+    pass
+
+
+@dataclass(frozen=True)
+class FloorChanged(SimEvent):
+    floor: int
+    descended: bool
+
+
+@dataclass(frozen=True)
+class MissionCompleted(SimEvent):
+    mission_id: str
+
+
+@dataclass(frozen=True)
+class DungeonEscaped(SimEvent):
+    pass
+
+
+@dataclass(frozen=True)
+class PlayerDied(SimEvent):
+    pass
+
+
+class DungeonSim:
+    def __init__(
+        self,
+        run: DungeonRun,
+        *,
+        state: GameState = STATE,
+        quests: QuestTracker = QUESTS,
+        size: tuple[int, int] = (GRID_WIDTH, GRID_HEIGHT),
+    ) -> None:
+        self.run = run
+        self.state = state
+        self.quests = quests
+        # Floor size in tiles. The scene draws the screen-sized default; headless tools may go bigger.
+        self.width, self.height = size
+        self.rng = random.Random(run.seed_for_floor(run.floor))
+        self.grid: list[list[int]] = []
+        self.player = GridPlayer(1, 1)
+        self.enemies: list[Enemy] = []
+        self.pickups: list[Pickup] = []
+        self.occupancy = Occupancy()
+        # Enemy actions keyed on the turn each is next due (rebuilt per floor), and status
+        # effects (guard expiry, poison ticks) for the whole run. A turn only touches what is due.
+        self.actors = TimingWheel()
+        self.effects = TimingWheel()
+        self._spawn_order: dict[int, int] = {}
+        # Vectorized aggro and scheduling bookkeeping on crowded floors (see EnemyTable).
+        self._table: EnemyTable | None = None
+        # Idle enemies far from the player (see DormantSet) get no turns until woken.
+        self.dormant = DormantSet()
+        self._player_bucket: tuple[int, int] | None = None
+        # Distances to the player, shared by every aggroed enemy; rebuilt when the player moves.
+        self.flow = FlowField()
+        # Shadowcast from the player, recast once per move: fog reveal, aggro and ranged attacks.
+        # A light source would raise `self.fov.light_radius`.
+        self.fov = FieldOfView()
+        self.seen: list[list[bool]] = []
+
+        self.message = ""
+        self.turn = 0
+        self.kills = 0
+        self.gold_gained = 0
+        self.items_gained: dict[str, int] = {}
+        self.rescued_in_run = 0
+        self.rescued_head_miner = False
+        self.rescued_rival = False
+        self.outcome: str | None = None
+        self._rescues_committed = False
+        self._events: list[SimEvent] = []
+
+        # A guard left over from a run that ended mid-brace doesn't carry into this one;
+        # poison does, and ticks from the first enemy turn.
+        state.guard_turns = 0
+        if state.poison_turns > 0:
+            self.effects.schedule("poison", self.turn + 1, self._poison_tick)
+
+        self.regenerate()
+
+    # --- driving -------------------------------------------------------------------
+
+    def step(self, action: Action) -> list[SimEvent]:
+        """Applies one player action (and the enemy turn it costs); returns what happened."""
+        self._events = events = []
+        if self.outcome is not None:
+            return events
+        if isinstance(action, Move):
+            if self._player_step(action.dx, action.dy):
+                self._end_turn()
+        elif isinstance(action, UseStairs):
+            # Even a failed stairs attempt costs the turn, and so does a successful one.
+            self._use_stairs()
+            self._end_turn()
+        elif isinstance(action, UseItem):
+            self._use_item(action.item_id)
+            self._end_turn()
+        elif isinstance(action, UseSkill):
+            self._use_skill(action.skill_id)
+            self._end_turn()
+        elif isinstance(action, Wait):
+            self._end_turn()
+        elif isinstance(action, Regenerate):
+            self.regenerate()
+        return events
+
+    def regenerate(self) -> None:
+        """(Re)builds the current floor from its seed: grid, player spawn, enemies, pickups, fog."""
+        self.grid = self._generate_floor()
+        self.player = self._spawn_player()
+        self._populate_floor()
+        self._reset_fog()
+
+    def finish(self) -> list[SimEvent]:
+        """Leaving the dungeon: banks rescues and clears the quest location."""
+        self._events = []
+        self._drop_guard()
+        self.quests.set_location(None)
+        self._commit_rescues()
+        return self._events
+
+    def inventory_items(self) -> list[str]:
+        return [item_id for item_id in self.state.inventory.keys() if item_id in ITEMS]
+
+    def enemy_at(self, x: int, y: int) -> Enemy | None:
+        return self.occupancy.enemy_at(x, y)
+
+    def set_enemies(self, enemies: list[Enemy]) -> None:
+        """Replaces the floor's enemies (tools and tests); keeps the indexes in step."""
+        self.enemies[:] = enemies
+        self.occupancy = Occupancy(self.enemies, self.pickups)
+        self._schedule_floor()
+
+    def in_sight(self, x: int, y: int) -> bool:
+        """Line of sight between the player and (x, y), from the cached player FOV."""
+        self.fov.update(self.grid, (self.player.x, self.player.y))
+        return self.fov.is_visible(x, y)
+
+    def state_hash(self, seed: int = 0) -> int:
+        """
+        crc32 of the turn, the floor, the player, the GameState fields the rules touch and
+        every enemy, chained onto `seed`. Replays compare it after each action.
+        """
+        state = self.state
+        values = [
+            self.turn,
+            self.run.floor,
+            self.player.x,
+            self.player.y,
+            state.hp,
+            state.gold,
+            state.combat_level,
+            state.combat_xp,
+            state.poison_turns,
+            state.guard_turns,
+            self.kills,
+            len(self.pickups),
+        ]
+        for enemy in self.enemies:
+            values += (enemy.x, enemy.y, enemy.hp)
+        return zlib.crc32(array("q", values).tobytes(), seed)
+
+    def _emit(self, event: SimEvent) -> None:
+        self._events.append(event)
+
+    def _end_turn(self) -> None:
+        if self.outcome is None:
+            self._enemy_turn()
+        self._reveal()
+
+    # --- floors --------------------------------------------------------------------
+
+    def _generate_floor(self) -> list[list[int]]:
+        self.rng = random.Random(self.run.seed_for_floor(self.run.floor))
+        grid = generate_dungeon(
+            self.width,
+            self.height,
+            seed=self.run.seed_for_floor(self.run.floor),
+            place_stairs_up=self.run.floor > 1,
+            place_stairs_down=self.run.floor < self.run.max_floor,
+        )
+        if self.run.floor >= self.run.max_floor:
+            pos = _find_tile(grid, TILE_FLOOR)
+            if pos is not None:
+                x, y = pos
+                grid[y][x] = TILE_DUNGEON_EXIT
+        return grid
+
+    def _spawn_player(self) -> GridPlayer:
+        if self.run.floor > 1:
+            pos = _find_tile(self.grid, TILE_STAIRS_UP)
+            if pos is not None:
+                return GridPlayer(*pos)
+        pos = _find_tile(self.grid, TILE_FLOOR)
+        if pos is not None:
+            return GridPlayer(*pos)
+        return GridPlayer.spawn_on_floor(self.grid)
+
+    def _change_floor(self, delta: int) -> None:
+        self.run.floor += delta
+        self.grid = self._generate_floor()
+        if delta > 0:
+            pos = _find_tile(self.grid, TILE_STAIRS_UP)
+        else:
+            pos = _find_tile(self.grid, TILE_STAIRS_DOWN) or _find_tile(self.grid, TILE_FLOOR)
+        self.player = GridPlayer(*(pos if pos is not None else (1, 1)))
+        self._populate_floor()
+        self._reset_fog()
+        self._emit(FloorChanged(self.run.floor, descended=delta > 0))
+
+    def _reset_fog(self) -> None:
+        self.seen = [[False for _ in range(self.width)] for _ in range(self.height)]
+        self._reveal()
+
+    def _reveal(self) -> None:
+        self.fov.update(self.grid, (self.player.x, self.player.y))
+        seen = self.seen
+        for x, y in self.fov.lit_cells():
+            seen[y][x] = True
+
+    def _populate_floor(self) -> None:
+        state = self.state
+        self.enemies.clear()
+        self.pickups.clear()
+
+        # Enemies and pickups are seeded per floor to stay stable until regen.
+        floor_cells = _all_floor_like(self.grid)
+        self.rng.shuffle(floor_cells)
+
+        if self.run.horde:
+            enemy_count = len(floor_cells) // HORDE_SPACING
+        else:
+            enemy_count = max(1, 2 + self.run.floor // 2)
+        difficulty_floor = self.run.floor + max(0, state.combat_level - 1) // 3
+        table = spawn_table(self.run.dungeon_id, difficulty_floor)
+        spawned: dict[str, int] = {}
+        for _ in range(enemy_count):
+            if not floor_cells:
+                break
+            x, y = floor_cells.pop()
+            if (x, y) == (self.player.x, self.player.y):
+                continue
+            if self.grid[y][x] in (TILE_STAIRS_DOWN, TILE_STAIRS_UP):
+                continue
+            enemy_id = table.draw(self.rng, spawned)
+            if enemy_id is None:
+                break
+            spawned[enemy_id] = spawned.get(enemy_id, 0) + 1
+            self.enemies.append(spawn_enemy(enemy_id, x=x, y=y, floor=self.run.floor, combat_level=state.combat_level, rng=self.rng))
+
+        # Bosses (story beats) on the final floor, away from the player when there's room.
+        spawns = dungeon_spawns(self.run.dungeon_id)
+        final_floor = self.run.floor >= self.run.max_floor
+        for boss in spawns.bosses if final_floor else ():
+            if any(e.enemy_id == boss.enemy_id for e in self.enemies):
+                continue
+            candidates = [
+                c for c in floor_cells if abs(c[0] - self.player.x) + abs(c[1] - self.player.y) >= boss.min_distance
+            ]
+            x, y = (candidates[0] if candidates else (floor_cells[0] if floor_cells else (self.player.x + 2, self.player.y)))
+            if (x, y) in floor_cells:
+                floor_cells.remove((x, y))
+            self.enemies.append(spawn_enemy(boss.enemy_id, x=x, y=y, floor=self.run.floor, combat_level=state.combat_level, rng=self.rng))
+
+        # A couple simple pickups
+        for _ in range(2):
+            if not floor_cells:
+                break
+            x, y = floor_cells.pop()
+            if self.grid[y][x] in (TILE_STAIRS_DOWN, TILE_STAIRS_UP):
+                continue
+            self.pickups.append(Pickup(item_id="potion_small", x=x, y=y))
+
+        # Rare-ish relic shard
+        if self.rng.random() < 0.35 and floor_cells:
+            x, y = floor_cells.pop()
+            self.pickups.append(Pickup(item_id="relic_shard", x=x, y=y))
+
+        # Chapter 3: miners trapped in collapsed mines / deep shaft.
+        if self.run.dungeon_id in ("collapsed_mines", "deep_shaft") and floor_cells:
+            miner_count = 2 + (self.run.floor // 2)
+            for _ in range(miner_count):
+                if not floor_cells:
+                    break
+                x, y = floor_cells.pop()
+                self.pickups.append(Pickup(item_id="trapped_miner", x=x, y=y))
+            if self.run.dungeon_id == "deep_shaft" and final_floor and floor_cells:
+                x, y = floor_cells.pop()
+                self.pickups.append(Pickup(item_id="head_miner", x=x, y=y))
+
+        # Chapter 4: hostage rescue (rival held by the Children).
+        if self.run.dungeon_id == "children_hideout" and final_floor and floor_cells:
+            x, y = floor_cells.pop()
+            self.pickups.append(Pickup(item_id="rival_hostage", x=x, y=y))
+
+        # Mission items (rescue/collect style): ensure at least a chance to find them during a run.
+        for item_id in self.quests.wanted_items():
+            if not item_id or item_id == "relic_shard":
+                continue
+            # Boss-granted story items (kept off the random floor-spawn system).
+            if item_id in ("arrowhead_map", "arrowhead_tip"):
+                continue
+            if state.item_count(item_id) > 0:
+                continue
+            if not floor_cells:
+                break
+            # Relics (Nephil crown, Nimrod's Bow, ...) only at the bottom of the dungeons listing them.
+            if item_id in RELIC_ITEMS and not (final_floor and item_id in spawns.relics):
+                continue
+            if self.rng.random() < 0.75:
+                x, y = floor_cells.pop()
+                self.pickups.append(Pickup(item_id=item_id, x=x, y=y))
+
+        self.occupancy = Occupancy(self.enemies, self.pickups)
+        self._schedule_floor()
+
+    def _schedule_floor(self) -> None:
+        self.actors = TimingWheel()
+        self.dormant = DormantSet()
+        self._player_bucket = self.dormant.bucket_of(self.player.x, self.player.y)
+        self._spawn_order = {id(enemy): i for i, enemy in enumerate(self.enemies)}
+        if enemy_table.available() and len(self.enemies) >= ENEMY_TABLE_MIN:
+            self._table = EnemyTable(self.enemies)
+        else:
+            self._table = None
+        for enemy in self.enemies:
+            if not enemy.is_alive():
+                continue
+            if self._can_doze(enemy):
+                self.dormant.park(enemy)
+            else:
+                self._schedule_enemy(enemy, self.turn)
+
+    # --- player actions ------------------------------------------------------------
+
+    def _player_step(self, dx: int, dy: int) -> bool:
+        nx = self.player.x + dx
+        ny = self.player.y + dy
+        if ny < 0 or ny >= len(self.grid) or nx < 0 or nx >= len(self.grid[0]):
+            return False
+        if self.grid[ny][nx] == TILE_WALL:
+            return False
+
+        enemy = self.enemy_at(nx, ny)
+        if enemy is not None and enemy.is_alive():
+            self._player_attack(enemy)
+            return True
+
+        self.message = ""
+        prev = (self.player.x, self.player.y)
+        self.player.try_move(dx, dy, self.grid, walls={TILE_WALL})
+        if (self.player.x, self.player.y) != prev:
+            self._emit(PlayerStepped(dx, dy))
+        self._pickup_if_present()
+        return True
+
+    def _use_stairs(self) -> None:
+        tile = self.grid[self.player.y][self.player.x]
+
+        if tile == TILE_DUNGEON_EXIT:
+            for boss in dungeon_spawns(self.run.dungeon_id).bosses:
+                sealed = _SEALED_EXIT.get(boss.enemy_id)
+                if sealed and any(e.is_alive() and e.enemy_id == boss.enemy_id for e in self.enemies):
+                    self._fail(sealed)
+                    return
+            self._commit_rescues()
+            if self._check_missions_progress():
+                return
+            self.message = "You escape the dungeon!"
+            self.outcome = "escaped"
+            self._emit(DungeonEscaped())
+            return
+
+        if tile == TILE_STAIRS_DOWN:
+            if self.run.floor >= self.run.max_floor:
+                self._fail("This is as deep as it goes (for now).")
+                return
+            self._change_floor(+1)
+            self._check_missions_progress()
+            self.message = "" if self.outcome is None else self.message
+            return
+
+        if tile == TILE_STAIRS_UP:
+            if self.run.floor <= 1:
+                self._fail("No turning back now.")
+                return
+            self._change_floor(-1)
+            self.message = ""
+            return
+
+        self._fail("No stairs here.")
+
+    def _use_item(self, item_id: str) -> None:
+        state = self.state
+        item = get_item(item_id)
+        if not item.usable_in_dungeon:
+            self.message = f"{item.name} can't be used here (yet)."
+            return
+        if item.effects and "heal_hp" in item.effects:
+            if state.hp >= state.stats.max_hp:
+                self._fail("HP already full.")
+                return
+            if not state.remove_item(item_id, 1):
+                return
+            heal = int(item.effects["heal_hp"])
+            state.hp = min(state.stats.max_hp, state.hp + heal)
+            self.message = f"Used {item.name} (+{heal} HP)."
+            self._emit(ItemUsed(item_id, "heal_hp"))
+            return
+        if item.effects and "cure_poison" in item.effects:
+            if state.poison_turns <= 0:
+                self._fail("No poison to cure.")
+                return
+            if not state.remove_item(item_id, 1):
+                return
+            state.poison_turns = 0
+            state.poison_damage = 0
+            self.effects.cancel("poison")
+            self.message = f"Used {item.name} (poison cured)."
+            self._emit(ItemUsed(item_id, "cure_poison"))
+            return
+        self.message = f"Used {item.name}."
+        self._emit(ItemUsed(item_id, ""))
+
+    def _use_skill(self, skill_id: str) -> None:
+        state = self.state
+        if skill_id == "guard":
+            state.guard_turns = 1
+            # Covers the coming enemy turn; lapses before the one after if nothing hit.
+            self.effects.schedule("guard", self.turn + 2, self._guard_expired, order=-1)
+            self.message = "You brace yourself."
+            self._emit(Guarding())
+            return
+        if skill_id == "throw_rock":
+            target = self._nearest_enemy_in_range(4)
+            if target is None:
+                self.message = "No target in range."
+                return
+            damage = max(1, state.stats.attack - 1)
+            self.message = f"You throw a rock at {target.name} ({damage})."
+            self._damage_enemy(target, damage, source="throw_rock", xp=5, gold=4)
+            return
+        if skill_id == "whip":
+            target = self._enemy_at_adjacent()
+            if target is None:
+                self.message = "No adjacent target."
+                return
+            damage = max(1, state.stats.attack + 2 - target.defense)
+            if self.rng.random() < 0.25:
+                self._stun(target, 1)
+            self.message = f"You crack the whip at {target.name} ({damage})."
+            self._damage_enemy(target, damage, source="whip", xp=6, gold=5)
+
+    def _player_attack(self, enemy: Enemy) -> None:
+        damage = max(1, self.state.stats.attack - getattr(enemy, "defense", 0))
+        self.message = f"You hit {enemy.name} for {damage}."
+        self._damage_enemy(enemy, damage, source="melee", xp=6, gold=5)
+
+    def _damage_enemy(self, enemy: Enemy, damage: int, *, source: str, xp: int, gold: int) -> None:
+        state = self.state
+        enemy.hp = max(0, enemy.hp - damage)
+        killed = enemy.hp <= 0
+        # A thrown rock clatters where it lands, louder than a scuffle.
+        self._noise(enemy.x, enemy.y, NOISE_ROCK if source == "throw_rock" else NOISE_COMBAT)
+        self._emit(PlayerAttacked(enemy.enemy_id, damage, source, killed))
+        if not killed:
+            if self._table is not None:
+                self._table.refresh(enemy)
+            return
+        self._remove_dead(enemy)
+        if source == "melee":
+            self.message = f"You defeat {enemy.name}!"
+        state.record_kill(enemy.enemy_id)
+        self._grant_boss_relic_if_needed(enemy.enemy_id)
+        levels = state.add_combat_xp(xp + self.run.floor)
+        if levels:
+            self._emit(CombatLevelUp(state.combat_level))
+        gained = gold + self.run.floor
+        state.gold += gained
+        self.gold_gained += gained
+        self.kills += 1
+        self._emit(EnemyKilled(enemy.enemy_id, gained))
+        if source == "melee":
+            if self.rng.random() < 0.25:
+                state.add_item("potion_small", 1)
+                self._gain("potion_small", 1, source="drop")
+                self.message += " Found a Small Potion."
+        else:
+            self.message += " Defeated!"
+        self._check_missions_progress()
+
+    def _grant_boss_relic_if_needed(self, boss_enemy_id: str) -> None:
+        relic = _BOSS_RELICS.get(boss_enemy_id)
+        if relic is None:
+            return
+        item_id, line = relic
+        if self.quests.wants_item(item_id) and self.state.item_count(item_id) <= 0:
+            self.state.add_item(item_id, 1)
+            self._gain(item_id, 1, source="boss")
+            self.message += line
+
+    def _pickup_if_present(self) -> None:
+        pickup = self.occupancy.pickup_at(self.player.x, self.player.y)
+        if pickup is None:
+            return
+        self.occupancy.remove_pickup(pickup)
+        self.pickups.remove(pickup)
+        if pickup.item_id == "trapped_miner":
+            self.rescued_in_run += 1
+            self.message = "You rescued a miner! Escort them out to safety."
+            self._emit(Rescued(pickup.item_id))
+            return
+        if pickup.item_id == "head_miner":
+            self.rescued_head_miner = True
+            self.message = "You found the head miner! Get them out—now."
+            self._emit(Rescued(pickup.item_id))
+            return
+        if pickup.item_id == "rival_hostage":
+            self.rescued_rival = True
+            self.message = "You found your rival—hurt, but alive. Get them out."
+            self._emit(Rescued(pickup.item_id))
+            return
+        self.state.add_item(pickup.item_id, pickup.amount)
+        self._gain(pickup.item_id, pickup.amount, source="pickup")
+        self.message = f"Picked up {get_item(pickup.item_id).name}."
+        self._check_missions_progress()
+
+    def _gain(self, item_id: str, amount: int, *, source: str) -> None:
+        self.items_gained[item_id] = self.items_gained.get(item_id, 0) + amount
+        self._emit(ItemGained(item_id, amount, source))
+
+    def _commit_rescues(self) -> None:
+        if self._rescues_committed:
+            return
+        self._rescues_committed = True
+        state = self.state
+        if self.rescued_in_run > 0:
+            state.rescued_miners_total = int(state.rescued_miners_total) + int(self.rescued_in_run)
+            # Rivalry: rival also racks up rescues sometimes.
+            if int(state.chapter) >= 4:
+                h = zlib.crc32(f"{self.run.dungeon_id}:{self.run.floor}:{self.run.seed_base}".encode("utf-8"))
+                if h % 2 == 0:
+                    state.rival_rescues = int(state.rival_rescues) + max(1, self.rescued_in_run // 2)
+            self._emit(RescuesCommitted(self.rescued_in_run))
+        if self.rescued_head_miner and state.item_count("head_miner_token") <= 0:
+            state.add_item("head_miner_token", 1)
+            self._gain("head_miner_token", 1, source="rescue")
+        if self.rescued_rival and state.item_count("rival_rescue_badge") <= 0:
+            state.add_item("rival_rescue_badge", 1)
+            self._gain("rival_rescue_badge", 1, source="rescue")
+
+    def _check_missions_progress(self) -> bool:
+        state = self.state
+        mission_id = state.active_mission
+        if not mission_id or self.outcome is not None:
+            return False
+        self.quests.set_location(self.run.dungeon_id, self.run.floor)
+        if not self.quests.is_complete(mission_id):
+            return False
+        state.complete_mission(mission_id)
+        state.active_mission = None
+        state.mission_kill_baseline = {}
+        name = MISSIONS[mission_id].name if mission_id in MISSIONS else mission_id
+        self.message = f"Mission complete: {name}! Return to the Guild."
+        self.outcome = "mission"
+        self._emit(MissionCompleted(mission_id))
+        return True
+
+    def _fail(self, message: str) -> None:
+        self.message = message
+        self._emit(ActionFailed())
+
+    # --- enemies -------------------------------------------------------------------
+
+    def _enemy_turn(self) -> None:
+        state = self.state
+        if state.hp <= 0:
+            return
+
+        # Status effects due this turn run before the counter advances, so a poison death
+        # ends the turn without using it up.
+        for effect in self.effects.pop(self.turn + 1):
+            effect()
+        if self.outcome is not None:
+            return
+
+        self.turn += 1
+        px, py = self.player.x, self.player.y
+        self.flow.update(self.grid, (px, py))
+        self.fov.update(self.grid, (px, py))
+        self._wake_region()
+        table = self._table
+        if table is None:
+            self._notice_player()
+        else:
+            for enemy in table.notice(self.turn, px, py, self.fov, AGGRO_TURNS):
+                self._schedule_enemy(enemy, self.turn - 1)
+
+        # The enemies due now: each dozes off (tick 0) or goes back in the wheel for its next turn.
+        due = self.actors.pop(self.turn)
+        if table is None:
+            ticks = [0 if self._can_doze(enemy) else self._next_tick(enemy, self.turn) for enemy in due]
+        else:
+            ticks = table.plan(due, self.turn, px, py, self.dormant)
+        active: list[Enemy] = []
+        order = self._spawn_order
+        for enemy, tick in zip(due, ticks):
+            if not tick:
+                self.dormant.park(enemy)
+                continue
+            self.actors.schedule(id(enemy), tick, enemy, order=order.get(id(enemy), 0))
+            active.append(enemy)
+        for enemy in active:
+            if enemy.is_alive() and not self._enemy_act(enemy, enemy.aggro_until > self.turn):
+                return
+
+    def _can_doze(self, enemy: Enemy) -> bool:
+        # Far means out of any aggro range and out of sight, so only idle wandering is skipped.
+        return (
+            enemy.aggro_until <= self.turn
+            and enemy.awake_until <= self.turn
+            and self.dormant.is_far(enemy, self.player.x, self.player.y)
+        )
+
+    def _wake_region(self) -> None:
+        bucket = self.dormant.bucket_of(self.player.x, self.player.y)
+        if bucket == self._player_bucket:
+            return
+        self._player_bucket = bucket
+        for enemy in self.dormant.wake_region(self.player.x, self.player.y):
+            self._schedule_enemy(enemy, self.turn - 1)
+
+    def _noise(self, x: int, y: int, radius: int) -> None:
+        for enemy in self.dormant.wake_near(x, y, radius):
+            enemy.awake_until = max(enemy.awake_until, self.turn + NOISE_AWAKE_TURNS)
+            if self._table is not None:
+                self._table.refresh(enemy)
+            self._schedule_enemy(enemy, self.turn)
+
+    def _notice_player(self) -> None:
+        """Enemies the player can see, within their aggro range, (re)start chasing."""
+        turn = self.turn
+        px, py = self.player.x, self.player.y
+        enemy_at = self.occupancy.enemy_at
+        for x, y in self.fov.visible_cells():
+            enemy = enemy_at(x, y)
+            if enemy is None or enemy.stunned_until > turn or abs(x - px) + abs(y - py) > enemy.aggro_range:
+                continue
+            was_idle = enemy.aggro_until <= turn
+            enemy.aggro_until = turn + AGGRO_TURNS
+            if was_idle:
+                # Now it may act on attack turns too, possibly this one.
+                self._schedule_enemy(enemy, turn - 1)
+
+    def _schedule_enemy(self, enemy: Enemy, after: int) -> None:
+        tick = self._next_tick(enemy, after)
+        self.actors.schedule(id(enemy), tick, enemy, order=self._spawn_order.get(id(enemy), 0))
+
+    @staticmethod
+    def _next_tick(enemy: Enemy, after: int) -> int:
+        if enemy.stunned_until > after + 1:
+            after = enemy.stunned_until - 1
+        # Idle enemies only wake on move turns; chasers also on attack turns.
+        return enemy.next_turn(after, attacks=enemy.aggro_until > after + 1)
+
+    def _stun(self, enemy: Enemy, turns: int) -> None:
+        self.dormant.discard(enemy)
+        # Skips the next `turns` enemy turns: no acting and no noticing the player.
+        enemy.stunned_until = max(enemy.stunned_until, self.turn + 1 + turns)
+        if self._table is not None:
+            self._table.refresh(enemy)
+        self._schedule_enemy(enemy, self.turn)
+
+    def _guard_expired(self) -> None:
+        self.state.guard_turns = 0
+
+    def _drop_guard(self) -> None:
+        self.effects.cancel("guard")
+        self.state.guard_turns = 0
+
+    def _poison(self, turns: int, damage: int) -> None:
+        state = self.state
+        state.poison_turns = max(state.poison_turns, turns)
+        state.poison_damage = max(state.poison_damage, damage)
+        if self.effects.due("poison") is None:
+            self.effects.schedule("poison", self.turn + 1, self._poison_tick)
+
+    def _poison_tick(self) -> None:
+        # Runs ahead of the turn counter (see _enemy_turn): turn + 1 is now, turn + 2 the next.
+        state = self.state
+        state.hp = max(0, state.hp - state.poison_damage)
+        state.poison_turns -= 1
+        if state.hp <= 0:
+            self._player_died("Poison drops you... (Returned to Home Base)")
+        elif state.poison_turns > 0:
+            self.effects.schedule("poison", self.turn + 2, self._poison_tick)
+
+    def _enemy_act(self, enemy: Enemy, aggroed: bool) -> bool:
+        """One enemy's move or attack; False once the player is down (the turn stops)."""
+        state = self.state
+        px, py = self.player.x, self.player.y
+        if not aggroed:
+            # Idle wander sometimes
+            if enemy.behavior.endswith("patrol") and enemy.should_move(self.turn):
+                self._enemy_patrol(enemy)
+            elif enemy.should_move(self.turn) and self.rng.random() < 0.35:
+                self._enemy_wander(enemy)
+            return True
+
+        if enemy.behavior == "ranged":
+            if self._enemy_try_ranged(enemy):
+                return self.outcome is None
+            # Reloading with the player in its face: back off rather than stand there.
+            if (
+                abs(enemy.x - px) + abs(enemy.y - py) == 1
+                and enemy.should_move(self.turn)
+                and self._enemy_step_away(enemy)
+            ):
+                return True
+
+        if abs(enemy.x - px) + abs(enemy.y - py) == 1 and enemy.should_attack(self.turn):
+            damage = self._hit_player(enemy)
+            self.message = f"{enemy.name} hits you for {damage}."
+            self._emit(PlayerHit(enemy.enemy_id, damage, ranged=False))
+            self._noise(px, py, NOISE_COMBAT)
+            if enemy.behavior == "poison_melee" and enemy.poison_turns > 0:
+                self._poison(enemy.poison_turns, enemy.poison_damage)
+                self.message += " You feel poison spreading."
+            if state.hp <= 0:
+                self._player_died("You collapse... (Returned to Home Base)")
+                return False
+            return True
+
+        if enemy.should_move(self.turn):
+            self._enemy_step_toward(enemy)
+        return True
+
+    def _hit_player(self, enemy: Enemy) -> int:
+        state = self.state
+        damage = max(1, enemy.attack - state.stats.defense)
+        if state.guard_turns > 0:
+            damage = max(1, damage // 2)
+            state.guard_turns = max(0, state.guard_turns - 1)
+        state.hp = max(0, state.hp - damage)
+        return damage
+
+    def _player_died(self, message: str) -> None:
+        # The player is patched up and sent home; the scene handles the trip. Rescues
+        # are lost (no finish()), but the tracker must stop counting this floor.
+        self.state.hp = self.state.stats.max_hp
+        self._drop_guard()
+        self.quests.set_location(None)
+        self.message = message
+        self.outcome = "died"
+        self._emit(PlayerDied())
+
+    def _enemy_try_ranged(self, enemy: Enemy) -> bool:
+        if not enemy.should_attack(self.turn):
+            return False
+        d = abs(enemy.x - self.player.x) + abs(enemy.y - self.player.y)
+        if enemy.ranged_range <= 0 or d > enemy.ranged_range:
+            return False
+        if not self.in_sight(enemy.x, enemy.y):
+            return False
+        damage = self._hit_player(enemy)
+        self.message = f"{enemy.name} shoots you for {damage}."
+        self._emit(PlayerHit(enemy.enemy_id, damage, ranged=True))
+        self._noise(self.player.x, self.player.y, NOISE_COMBAT)
+        if self.state.hp <= 0:
+            self._player_died("You collapse... (Returned to Home Base)")
+        return True
+
+    def _enemy_step_toward(self, enemy: Enemy) -> None:
+        step = self.flow.step_toward(enemy.x, enemy.y, self._cell_blocked, self.rng)
+        if step is not None:
+            self._move_enemy(enemy, *step)
+
+    def _enemy_step_away(self, enemy: Enemy) -> bool:
+        step = self.flow.step_away(enemy.x, enemy.y, self._cell_blocked, self.rng)
+        if step is None:
+            return False
+        self._move_enemy(enemy, *step)
+        return True
+
+    def _move_enemy(self, enemy: Enemy, x: int, y: int) -> None:
+        self.occupancy.move_enemy(enemy, x, y)
+        if self._table is not None:
+            self._table.move(enemy)
+
+    def _cell_blocked(self, x: int, y: int) -> bool:
+        return (x, y) == (self.player.x, self.player.y) or self.enemy_at(x, y) is not None
+
+    def _enemy_wander(self, enemy: Enemy) -> None:
+        dirs = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+        self.rng.shuffle(dirs)
+        for dx, dy in dirs:
+            nx, ny = enemy.x + dx, enemy.y + dy
+            if self.grid[ny][nx] == TILE_WALL:
+                continue
+            if (nx, ny) == (self.player.x, self.player.y):
+                continue
+            if self.enemy_at(nx, ny) is not None:
+                continue
+            self._move_enemy(enemy, nx, ny)
+            break
+
+    def _enemy_patrol(self, enemy: Enemy) -> None:
+        nx = enemy.x + enemy.patrol_dx
+        ny = enemy.y
+        if self.grid[ny][nx] == TILE_WALL or self.enemy_at(nx, ny) is not None or (nx, ny) == (self.player.x, self.player.y):
+            enemy.patrol_dx *= -1
+            return
+        self._move_enemy(enemy, nx, ny)
+
+    def _remove_dead(self, enemy: Enemy) -> None:
+        """Drops a killed enemy from the floor so later turns don't iterate or index it."""
+        self.occupancy.remove_enemy(enemy)
+        self.actors.cancel(id(enemy))
+        self.dormant.discard(enemy)
+        if self._table is not None:
+            self._table.remove(enemy)
+        for i, e in enumerate(self.enemies):
+            if e is enemy:
+                del self.enemies[i]
+                break
+
+    def _enemy_at_adjacent(self) -> Enemy | None:
+        for dx, dy in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+            e = self.enemy_at(self.player.x + dx, self.player.y + dy)
+            if e is not None:
+                return e
+        return None
+
+    def _nearest_enemy_in_range(self, r: int) -> Enemy | None:
+        best = None
+        best_d = 999
+        for e in self.enemies:
+            if not e.is_alive():
+                continue
+            if not self.seen[e.y][e.x]:
+                continue
+            d = abs(e.x - self.player.x) + abs(e.y - self.player.y)
+            if d <= r and d < best_d and self.in_sight(e.x, e.y):
+                best = e
+                best_d = d
+        return best
+
+
+def _find_tile(grid: list[list[int]], tile: int) -> tuple[int, int] | None:
+    for y, row in enumerate(grid):
+        for x, cell in enumerate(row):
+            if cell == tile:
+                return (x, y)
+    return None
+
+
+def _all_floor_like(grid: list[list[int]]) -> list[tuple[int, int]]:
+    cells: list[tuple[int, int]] = []
+    for y, row in enumerate(grid):
+        for x, cell in enumerate(row):
+            if cell != TILE_WALL:
+                cells.append((x, y))
+    return cells
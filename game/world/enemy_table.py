@@ -0,0 +1,134 @@
+"""
+Struct-of-arrays mirror of a floor's enemies, for horde-sized floors.
+
+The `Enemy` objects stay the per-enemy view (drawing, combat, messages); `EnemyTable`
+keeps their turn-relevant columns (position, hp, aggro range, the aggro / stun / awake
+timers, move and attack intervals and phases) in parallel NumPy arrays. The timing wheel
+still decides who acts when; the table does the per-turn bookkeeping around it in a few
+vectorized passes instead of one Python call per enemy:
+
+- `notice`: aggro for the whole floor (distance + the player's FOV), written back to the
+  enemies that see the player, returning the ones that just started chasing.
+- `plan`: for the enemies the wheel popped, whether each can doze (idle, not woken, far
+  from the player) and otherwise the next turn it may move or attack.
+
+Both give exactly what the per-object code in DungeonSim gives, so RNG draws and replays
+don't depend on whether NumPy is installed.
+
+The table is written through, not re-read: the sim calls `move` after moving an enemy,
+`refresh` after changing one outside the table (damage, a whip stun, noise) and `remove`
+when one dies. NumPy is optional; `available()` says whether the table can be used at all.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from game.entities.enemy import Enemy
+from game.world.dormancy import DormantSet
+from game.world.fov import FieldOfView
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the sim falls back to its per-enemy calls.
+    np = None
+
+
+def available() -> bool:
+    return np is not None
+
+
+class EnemyTable:
+    def __init__(self, enemies: Sequence[Enemy]) -> None:
+        self.enemies = list(enemies)
+        self._rows = {id(e): i for i, e in enumerate(self.enemies)}
+        n = len(self.enemies)
+        i64 = np.int64
+
+        def col(values) -> np.ndarray:
+            return np.fromiter(values, dtype=i64, count=n)
+
+        es = self.enemies
+        self.x = col(e.x for e in es)
+        self.y = col(e.y for e in es)
+        self.hp = col(e.hp for e in es)
+        self.aggro_range = col(e.aggro_range for e in es)
+        self.aggro_until = col(e.aggro_until for e in es)
+        self.stunned_until = col(e.stunned_until for e in es)
+        self.awake_until = col(e.awake_until for e in es)
+        self.move_interval = col(max(1, e.move_interval) for e in es)
+        self.move_phase = col(e._move_phase for e in es)
+        self.attack_interval = col(max(1, e.attack_interval) for e in es)
+        self.attack_phase = col(e._attack_phase for e in es)
+        self.live = int((self.hp > 0).sum())
+
+    def __len__(self) -> int:
+        return self.live
+
+    def move(self, enemy: Enemy) -> None:
+        row = self._rows.get(id(enemy))
+        if row is not None:
+            self.x[row] = enemy.x
+            self.y[row] = enemy.y
+
+    def refresh(self, enemy: Enemy) -> None:
+        """Re-reads an enemy's mutable columns after it was changed outside the table."""
+        row = self._rows.get(id(enemy))
+        if row is not None:
+            self.x[row], self.y[row], self.hp[row] = enemy.x, enemy.y, enemy.hp
+            self.aggro_until[row] = enemy.aggro_until
+            self.stunned_until[row] = enemy.stunned_until
+            self.awake_until[row] = enemy.awake_until
+
+    def remove(self, enemy: Enemy) -> None:
+        row = self._rows.pop(id(enemy), None)
+        if row is not None and self.hp[row] > 0:
+            self.hp[row] = 0
+            self.live -= 1
+
+    def notice(self, turn: int, px: int, py: int, fov: FieldOfView, aggro_turns: int) -> list[Enemy]:
+        """
+        Enemies the player can see, within their aggro range and not stunned, chase for
+        `aggro_turns` from `turn` (written back to the objects). Returns the ones that were
+        idle, in table order; they may now act on attack turns too.
+        """
+        visible = np.frombuffer(fov.visible, dtype=np.uint8)
+        if not len(visible):
+            return []
+        x, y = self.x, self.y
+        near = np.flatnonzero((np.abs(x - px) + np.abs(y - py) <= self.aggro_range) & (self.hp > 0))
+        # Enemies stand on the grid the FOV was cast over, so their cells index it directly.
+        sees = (visible[y[near] * fov.width + x[near]] != 0) & (self.stunned_until[near] <= turn)
+        rows = near[sees]
+        if not len(rows):
+            return []
+        was_idle = self.aggro_until[rows] <= turn
+        until = turn + aggro_turns
+        self.aggro_until[rows] = until
+        es = self.enemies
+        for i in rows.tolist():
+            es[i].aggro_until = until
+        return [es[i] for i in rows[was_idle].tolist()]
+
+    def plan(self, enemies: Sequence[Enemy], turn: int, px: int, py: int, dormant: DormantSet) -> list[int]:
+        """
+        For each of `enemies` (due at `turn`): 0 if it can doze (not chasing, not woken,
+        and `dormant.is_far` from the player), else the next turn it may act, as
+        DungeonSim._next_tick would give it.
+        """
+        if not enemies:
+            return []
+        rows = np.fromiter((self._rows[id(e)] for e in enemies), dtype=np.int64, count=len(enemies))
+        aggro_until = self.aggro_until[rows]
+        b = dormant.bucket
+        far = np.maximum(np.abs(self.x[rows] // b - px // b), np.abs(self.y[rows] // b - py // b)) > dormant.reach
+        doze = far & (aggro_until <= turn) & (self.awake_until[rows] <= turn)
+
+        # Enemy.next_turn after the later of `turn` and the end of a stun.
+        after = np.maximum(turn, self.stunned_until[rows] - 1)
+        t = after + 1
+        tick = t + (-(t + self.move_phase[rows])) % self.move_interval[rows]
+        attacks = (aggro_until > t) & (tick > t)
+        attack_tick = t + (-(t + self.attack_phase[rows])) % self.attack_interval[rows]
+        tick = np.where(attacks, np.minimum(tick, attack_tick), tick)
+        return np.where(doze, 0, tick).tolist()
@@ -0,0 +1,108 @@
+"""
+Shared BFS flow field toward one target cell (the player).
+
+One breadth-first pass over the non-wall tiles gives every cell its step distance to the
+target. Any number of enemies can then read their next step from it in O(1): a neighbour
+one step closer (`step_toward`), or one step farther (`step_away`, for kiting). The field
+is rebuilt only when the target cell or the grid changes. Other actors don't block the
+BFS; they're checked at step time through `blocked`, so a crowd flows around itself.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from random import Random
+
+from game.constants import TILE_WALL
+
+Cell = tuple[int, int]
+
+UNREACHABLE = -1
+_DIRS = ((1, 0), (0, 1), (-1, 0), (0, -1))
+
+
+class FlowField:
+    def __init__(self) -> None:
+        self.grid: list[list[int]] | None = None
+        self.target: Cell | None = None
+        self.width = 0
+        self.height = 0
+        self._dist: list[int] = []
+        self._neighbours: list[tuple[int, ...]] = []
+        self.rebuilds = 0
+
+    def update(self, grid: list[list[int]], target: Cell) -> bool:
+        """Recomputes if the target moved or the grid object changed; returns True if it did."""
+        if grid is self.grid and target == self.target:
+            return False
+        if grid is not self.grid:
+            self._index(grid)
+        self.target = target
+        w, h = self.width, self.height
+        dist = [UNREACHABLE] * (w * h)
+        tx, ty = target
+        if 0 <= tx < w and 0 <= ty < h:
+            neighbours = self._neighbours
+            start = ty * w + tx
+            dist[start] = 0
+            frontier = [start]
+            d = 0
+            while frontier:
+                d += 1
+                nxt = []
+                for i in frontier:
+                    for j in neighbours[i]:
+                        if dist[j] == UNREACHABLE:
+                            dist[j] = d
+                            nxt.append(j)
+                frontier = nxt
+        self._dist = dist
+        self.rebuilds += 1
+        return True
+
+    def _index(self, grid: list[list[int]]) -> None:
+        # Walkable neighbours per flat cell index; only redone when the floor changes.
+        self.grid = grid
+        self.height, self.width = len(grid), len(grid[0]) if grid else 0
+        w, h = self.width, self.height
+        neighbours: list[tuple[int, ...]] = []
+        for y in range(h):
+            for x in range(w):
+                neighbours.append(
+                    tuple(
+                        (y + dy) * w + x + dx
+                        for dx, dy in _DIRS
+                        if 0 <= x + dx < w and 0 <= y + dy < h and grid[y + dy][x + dx] != TILE_WALL
+                    )
+                )
+        self._neighbours = neighbours
+
+    def distance(self, x: int, y: int) -> int:
+        """Steps to the target, or UNREACHABLE (also for cells off the grid)."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self._dist[y * self.width + x]
+        return UNREACHABLE
+
+    def step_toward(self, x: int, y: int, blocked: Callable[[int, int], bool], rng: Random | None = None) -> Cell | None:
+        """An unblocked neighbour one step closer to the target, or None (stay put)."""
+        here = self.distance(x, y)
+        if here <= 0:
+            return None
+        return self._pick(x, y, here - 1, blocked, rng)
+
+    def step_away(self, x: int, y: int, blocked: Callable[[int, int], bool], rng: Random | None = None) -> Cell | None:
+        """An unblocked neighbour one step farther from the target, or None."""
+        here = self.distance(x, y)
+        if here == UNREACHABLE:
+            return None
+        return self._pick(x, y, here + 1, blocked, rng)
+
+    def _pick(self, x: int, y: int, want: int, blocked: Callable[[int, int], bool], rng: Random | None) -> Cell | None:
+        # Rotating the start direction keeps equally good steps from always favouring one axis.
+        start = int(rng.random() * 4) if rng is not None else 0
+        for i in range(4):
+            dx, dy = _DIRS[(start + i) & 3]
+            nx, ny = x + dx, y + dy
+            if self.distance(nx, ny) == want and not blocked(nx, ny):
+                return nx, ny
+        return None
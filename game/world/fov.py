@@ -0,0 +1,145 @@
+"""
+Recursive shadowcasting field of view.
+
+`FieldOfView.update` casts from the player's cell once per move (cached on the cell,
+the grid and the radii) and keeps two bitsets over the floor:
+
+- visible: in line of sight within `sight_radius`; used for enemy aggro and for ranged
+  attacks in both directions. `visible_cells()` lists them, so aggro checks only look
+  at what the player can see.
+- lit: visible and within `light_radius`; these cells are revealed in the fog.
+
+Walls stop sight but are themselves visible, so room edges light up. The light radius
+is separate from sight so a light source (e.g. a torch) can widen what gets revealed
+without changing who can see whom.
+"""
+
+from __future__ import annotations
+
+from game.constants import TILE_WALL
+
+LIGHT_RADIUS = 3
+# Enough for the longest aggro_range / ranged_range in data/enemies.json.
+SIGHT_RADIUS = 12
+
+# (xx, xy, yx, yy) transforms mapping octant 0 onto the other seven.
+_OCTANTS = (
+    (1, 0, 0, 1),
+    (0, 1, 1, 0),
+    (0, -1, 1, 0),
+    (-1, 0, 0, 1),
+    (-1, 0, 0, -1),
+    (0, -1, -1, 0),
+    (0, 1, -1, 0),
+    (1, 0, 0, -1),
+)
+
+
+class FieldOfView:
+    def __init__(self, *, light_radius: int = LIGHT_RADIUS, sight_radius: int = SIGHT_RADIUS) -> None:
+        self.light_radius = light_radius
+        self.sight_radius = sight_radius
+        self.width = 0
+        self.height = 0
+        self.visible = bytearray()
+        self.lit = bytearray()
+        self._lit_cells: list[tuple[int, int]] = []
+        self._visible_cells: list[tuple[int, int]] = []
+        self._key: tuple | None = None
+        self._grid: list[list[int]] | None = None
+
+    def update(self, grid: list[list[int]], origin: tuple[int, int]) -> bool:
+        """Recasts if the origin, grid or radii changed; returns True if it did."""
+        key = (origin, self.light_radius, self.sight_radius)
+        if grid is self._grid and key == self._key:
+            return False
+        self._grid, self._key = grid, key
+        self.height, self.width = len(grid), len(grid[0]) if grid else 0
+        w, h = self.width, self.height
+        self.visible = bytearray(w * h)
+        self._visible_cells = []
+        ox, oy = origin
+        if 0 <= ox < w and 0 <= oy < h:
+            self.visible[oy * w + ox] = 1
+            self._visible_cells.append(origin)
+            radius = max(self.sight_radius, self.light_radius)
+            for xx, xy, yx, yy in _OCTANTS:
+                self._cast(grid, ox, oy, 1, 1.0, 0.0, radius, xx, xy, yx, yy)
+        lr2 = self.light_radius * (self.light_radius + 1)
+        lit = bytearray(w * h)
+        lit_cells: list[tuple[int, int]] = []
+        for y in range(max(0, oy - self.light_radius), min(h, oy + self.light_radius + 1)):
+            dy2 = (y - oy) * (y - oy)
+            for x in range(max(0, ox - self.light_radius), min(w, ox + self.light_radius + 1)):
+                i = y * w + x
+                if self.visible[i] and (x - ox) * (x - ox) + dy2 <= lr2:
+                    lit[i] = 1
+                    lit_cells.append((x, y))
+        self.lit = lit
+        self._lit_cells = lit_cells
+        return True
+
+    def is_visible(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height and bool(self.visible[y * self.width + x])
+
+    def is_lit(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height and bool(self.lit[y * self.width + x])
+
+    def lit_cells(self) -> list[tuple[int, int]]:
+        return self._lit_cells
+
+    def visible_cells(self) -> list[tuple[int, int]]:
+        return self._visible_cells
+
+    def _cast(
+        self,
+        grid: list[list[int]],
+        ox: int,
+        oy: int,
+        row: int,
+        start: float,
+        end: float,
+        radius: int,
+        xx: int,
+        xy: int,
+        yx: int,
+        yy: int,
+    ) -> None:
+        # Scans one octant row by row between the slopes `start` (high) and `end` (low),
+        # recursing past each wall run with a narrowed slope window.
+        if start < end:
+            return
+        w, h = self.width, self.height
+        visible = self.visible
+        cells = self._visible_cells
+        r2 = radius * (radius + 1)
+        new_start = start
+        for j in range(row, radius + 1):
+            blocked = False
+            dy = -j
+            for dx in range(-j, 1):
+                l_slope = (dx - 0.5) / (dy + 0.5)
+                r_slope = (dx + 0.5) / (dy - 0.5)
+                if start < r_slope:
+                    continue
+                if end > l_slope:
+                    break
+                x = ox + dx * xx + dy * xy
+                y = oy + dx * yx + dy * yy
+                inside = 0 <= x < w and 0 <= y < h
+                if inside and dx * dx + dy * dy <= r2 and not visible[y * w + x]:
+                    visible[y * w + x] = 1
+                    cells.append((x, y))
+                opaque = not inside or grid[y][x] == TILE_WALL
+                if blocked:
+                    if opaque:
+                        new_start = r_slope
+                        continue
+                    blocked = False
+                    start = new_start
+                elif opaque and j < radius:
+                    blocked = True
+                    self._cast(grid, ox, oy, j + 1, start, l_slope, radius, xx, xy, yx, yy)
+                    new_start = r_slope
+            if blocked:
+                break
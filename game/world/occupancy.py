@@ -0,0 +1,63 @@
+"""
+Per-floor cell index for enemies and pickups.
+
+`enemy_at` / `pickup_at` are dict lookups instead of scans over every entity, so an
+enemy turn costs O(enemies) rather than O(enemies²). The index has to be kept current:
+move enemies with `move_enemy` (which also updates `enemy.x/y`), and remove the dead and
+the picked up.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from game.entities.enemy import Enemy
+from game.entities.pickup import Pickup
+
+Cell = tuple[int, int]
+
+
+class Occupancy:
+    def __init__(self, enemies: Iterable[Enemy] = (), pickups: Iterable[Pickup] = ()) -> None:
+        self._enemies: dict[Cell, Enemy] = {}
+        self._pickups: dict[Cell, list[Pickup]] = {}
+        for enemy in enemies:
+            self.add_enemy(enemy)
+        for pickup in pickups:
+            self.add_pickup(pickup)
+
+    # --- enemies -------------------------------------------------------------------
+
+    def enemy_at(self, x: int, y: int) -> Enemy | None:
+        return self._enemies.get((x, y))
+
+    def add_enemy(self, enemy: Enemy) -> None:
+        if not enemy.is_alive():
+            return
+        # First one wins if two ever share a cell (same as the old list scan).
+        self._enemies.setdefault((enemy.x, enemy.y), enemy)
+
+    def remove_enemy(self, enemy: Enemy) -> None:
+        if self._enemies.get((enemy.x, enemy.y)) is enemy:
+            del self._enemies[(enemy.x, enemy.y)]
+
+    def move_enemy(self, enemy: Enemy, x: int, y: int) -> None:
+        self.remove_enemy(enemy)
+        enemy.x, enemy.y = x, y
+        self.add_enemy(enemy)
+
+    # --- pickups -------------------------------------------------------------------
+
+    def pickup_at(self, x: int, y: int) -> Pickup | None:
+        here = self._pickups.get((x, y))
+        return here[0] if here else None
+
+    def add_pickup(self, pickup: Pickup) -> None:
+        self._pickups.setdefault((pickup.x, pickup.y), []).append(pickup)
+
+    def remove_pickup(self, pickup: Pickup) -> None:
+        here = self._pickups.get((pickup.x, pickup.y))
+        if here and pickup in here:
+            here.remove(pickup)
+            if not here:
+                del self._pickups[(pickup.x, pickup.y)]
@@ -0,0 +1,282 @@
+"""
+Run recordings and headless replay.
+
+A `RunRecording` holds what a dungeon run needs to play out again: the run's identity
+(dungeon id, seed base, max floor, horde flag, floor size), a GameState snapshot taken
+before the run started and the ordered actions the player took. DungeonSim is
+deterministic for those inputs, so `replay` feeds the actions back without pygame as
+fast as the rules allow. After each action the recording also keeps a rolling
+`DungeonSim.state_hash`; replay stops at the first action whose hash differs, which is
+where the rules diverged from the recorded run.
+
+File layout (".run"): `MAGIC`, a version byte, then one zlib stream holding
+  <I length> header JSON (identity, item-id table, hash of the starting floor)
+  <I length> GameState snapshot in the binary save format (see game.save_codec)
+  one opcode byte per action (see `_encode_action`)
+  one <I rolling hash per action
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import time
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from game import save_codec
+from game.constants import GRID_HEIGHT, GRID_WIDTH
+from game.save import _apply_state, decode_save, snapshot_state
+from game.state import GameState, STATE
+from game.story.quest_tracker import QuestTracker
+from game.world.dungeon_run import DungeonRun
+from game.world.dungeon_sim import SKILLS, Action, DungeonSim, Move, Regenerate, UseItem, UseSkill, UseStairs, Wait
+
+MAGIC = b"CCDRUN"
+RUN_VERSION = 1
+RUNS_DIR = Path("saves/runs")
+
+_LEN = struct.Struct("<I")
+
+# Opcodes: 0-3 moves, then the fixed actions, then skills, then items via the header's table.
+_MOVES = ((0, -1), (0, 1), (-1, 0), (1, 0))
+_OP_STAIRS, _OP_WAIT, _OP_REGENERATE = 4, 5, 6
+_OP_SKILL = 8
+_OP_ITEM = 16
+
+
+@dataclass
+class RunRecording:
+    dungeon_id: str
+    dungeon_name: str
+    max_floor: int
+    seed_base: int
+    snapshot: dict[str, Any]
+    floor: int = 1
+    horde: bool = False
+    size: tuple[int, int] = (GRID_WIDTH, GRID_HEIGHT)
+    start_hash: int = 0  # state_hash of the sim before the first action
+    actions: list[Action] = field(default_factory=list)
+    hashes: list[int] = field(default_factory=list)  # rolling state_hash after each action
+
+    @classmethod
+    def start(cls, run: DungeonRun, state: GameState = STATE, *, size: tuple[int, int] = (GRID_WIDTH, GRID_HEIGHT)) -> RunRecording:
+        """Call before building the run's DungeonSim: the snapshot must predate the run."""
+        return cls(
+            dungeon_id=run.dungeon_id,
+            dungeon_name=run.dungeon_name,
+            max_floor=run.max_floor,
+            seed_base=run.seed_base,
+            snapshot=snapshot_state(state),
+            floor=run.floor,
+            horde=run.horde,
+            size=size,
+        )
+
+    def begin(self, sim: DungeonSim) -> None:
+        """Hashes the freshly built sim; the action hashes chain on from it."""
+        self.start_hash = sim.state_hash()
+
+    def record(self, action: Action, sim: DungeonSim) -> None:
+        """Call after `sim.step(action)`."""
+        self.actions.append(action)
+        self.hashes.append(sim.state_hash(self.hashes[-1] if self.hashes else self.start_hash))
+
+    def make_run(self) -> DungeonRun:
+        return DungeonRun(
+            self.dungeon_id,
+            self.dungeon_name,
+            max_floor=self.max_floor,
+            floor=self.floor,
+            seed_base=self.seed_base,
+            horde=self.horde,
+        )
+
+    def make_sim(self) -> DungeonSim:
+        """A sim on a private GameState restored from the snapshot (the global one is untouched)."""
+        state = GameState()
+        _apply_state(state, {"state": self.snapshot})
+        return DungeonSim(self.make_run(), state=state, quests=QuestTracker(state), size=self.size)
+
+    # --- file format ---------------------------------------------------------------
+
+    def to_bytes(self) -> bytes:
+        items: list[str] = []
+        ops = bytearray(_encode_action(a, items) for a in self.actions)
+        header = {
+            "dungeon_id": self.dungeon_id,
+            "dungeon_name": self.dungeon_name,
+            "max_floor": self.max_floor,
+            "seed_base": self.seed_base,
+            "floor": self.floor,
+            "horde": self.horde,
+            "size": list(self.size),
+            "start_hash": self.start_hash,
+            "items": items,
+            "actions": len(self.actions),
+        }
+        header_json = json.dumps(header, separators=(",", ":")).encode("utf-8")
+        snapshot = save_codec.encode(self.snapshot, compress=False)
+        hashes = struct.pack(f"<{len(self.hashes)}I", *self.hashes)
+        body = b"".join((_LEN.pack(len(header_json)), header_json, _LEN.pack(len(snapshot)), snapshot, bytes(ops), hashes))
+        return MAGIC + bytes((RUN_VERSION,)) + zlib.compress(body, 6)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> RunRecording:
+        """Parses a .run file; anything short, truncated or malformed raises ValueError."""
+        if len(data) <= len(MAGIC) or data[: len(MAGIC)] != MAGIC:
+            raise ValueError("not a run recording")
+        version = data[len(MAGIC)]
+        if version != RUN_VERSION:
+            raise ValueError(f"unsupported run recording version: {version}")
+        try:
+            body = memoryview(zlib.decompress(data[len(MAGIC) + 1 :]))
+        except zlib.error as e:
+            raise ValueError(f"corrupt run recording: {e}") from None
+        try:
+            return cls._parse(body)
+        except (struct.error, KeyError, TypeError) as e:
+            raise ValueError(f"corrupt run recording: {e!r}") from None
+
+    @classmethod
+    def _parse(cls, body: memoryview) -> RunRecording:
+        header_bytes, pos = _chunk(body, 0)
+        header = json.loads(header_bytes)
+        if not isinstance(header, dict):
+            raise ValueError("run recording header is not an object")
+        snapshot_bytes, pos = _chunk(body, pos)
+        snapshot = decode_save(snapshot_bytes)["state"]
+        count = int(header["actions"])
+        items = list(header["items"])
+        if len(body) != pos + 5 * count:
+            raise ValueError("truncated run recording")
+        actions = [_decode_action(op, items) for op in body[pos : pos + count]]
+        pos += count
+        hashes = list(struct.unpack_from(f"<{count}I", body, pos))
+        width, height = header["size"]
+        return cls(
+            dungeon_id=str(header["dungeon_id"]),
+            dungeon_name=str(header["dungeon_name"]),
+            max_floor=int(header["max_floor"]),
+            seed_base=int(header["seed_base"]),
+            snapshot=snapshot,
+            floor=int(header["floor"]),
+            horde=bool(header["horde"]),
+            size=(int(width), int(height)),
+            start_hash=int(header["start_hash"]),
+            actions=actions,
+            hashes=hashes,
+        )
+
+
+def write_recording(path: str | Path, recording: RunRecording) -> None:
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_bytes(recording.to_bytes())
+
+
+def read_recording(path: str | Path) -> RunRecording:
+    return RunRecording.from_bytes(Path(path).read_bytes())
+
+
+def save_run(recording: RunRecording, *, directory: str | Path = RUNS_DIR, keep: int = 20) -> Path:
+    """Writes a finished run under `directory` and drops all but the newest `keep` recordings."""
+    d = Path(directory)
+    stamp = time.strftime("%Y%m%d-%H%M%S")
+    path = d / f"{stamp}-{recording.dungeon_id}.run"
+    n = 1
+    while path.exists():
+        n += 1
+        path = d / f"{stamp}-{recording.dungeon_id}-{n}.run"
+    write_recording(path, recording)
+    for old in sorted(d.glob("*.run"), key=lambda q: q.stat().st_mtime)[: -max(1, keep)]:
+        try:
+            old.unlink()
+        except OSError:
+            pass
+    return path
+
+
+@dataclass(frozen=True)
+class ReplayResult:
+    actions: int  # actions replayed (up to and including a diverging one)
+    turns: int
+    seconds: float  # the action loop only, not restoring the state or building floor 1
+    outcome: str | None
+    diverged_at: int | None = None  # index of the first action whose hash differed
+
+    @property
+    def ok(self) -> bool:
+        return self.diverged_at is None
+
+
+def replay(recording: RunRecording, *, verify: bool = True) -> ReplayResult:
+    """
+    Plays the recorded actions through a fresh DungeonSim. With `verify`, compares the
+    rolling state hash after every action and stops at the first mismatch (-1 means the
+    starting floor already differs).
+    """
+    sim = recording.make_sim()
+    if verify and sim.state_hash() != recording.start_hash:
+        return ReplayResult(0, 0, 0.0, sim.outcome, diverged_at=-1)
+    step = sim.step
+    start = time.perf_counter()
+    if not verify:
+        for action in recording.actions:
+            step(action)
+        return ReplayResult(len(recording.actions), sim.turn, time.perf_counter() - start, sim.outcome)
+    h = recording.start_hash
+    state_hash = sim.state_hash
+    for i, (action, expected) in enumerate(zip(recording.actions, recording.hashes)):
+        step(action)
+        h = state_hash(h)
+        if h != expected:
+            return ReplayResult(i + 1, sim.turn, time.perf_counter() - start, sim.outcome, diverged_at=i)
+    return ReplayResult(len(recording.actions), sim.turn, time.perf_counter() - start, sim.outcome)
+
+
+def _chunk(body: memoryview, pos: int) -> tuple[bytes, int]:
+    """One `<I length`-prefixed block at `pos`, and the position after it."""
+    (n,) = _LEN.unpack_from(body, pos)
+    start = pos + _LEN.size
+    if start + n > len(body):
+        raise ValueError("truncated run recording")
+    return bytes(body[start : start + n]), start + n
+
+
+def _encode_action(action: Action, items: list[str]) -> int:
+    if isinstance(action, Move) and (action.dx, action.dy) in _MOVES:
+        return _MOVES.index((action.dx, action.dy))
+    if isinstance(action, UseStairs):
+        return _OP_STAIRS
+    if isinstance(action, Wait):
+        return _OP_WAIT
+    if isinstance(action, Regenerate):
+        return _OP_REGENERATE
+    if isinstance(action, UseSkill) and action.skill_id in SKILLS:
+        return _OP_SKILL + SKILLS.index(action.skill_id)
+    if isinstance(action, UseItem):
+        if action.item_id not in items:
+            if _OP_ITEM + len(items) > 0xFF:
+                raise ValueError("too many distinct items in one run recording")
+            items.append(action.item_id)
+        return _OP_ITEM + items.index(action.item_id)
+    raise ValueError(f"can't record action: {action!r}")
+
+
+def _decode_action(op: int, items: list[str]) -> Action:
+    if op < len(_MOVES):
+        return Move(*_MOVES[op])
+    if op == _OP_STAIRS:
+        return UseStairs()
+    if op == _OP_WAIT:
+        return Wait()
+    if op == _OP_REGENERATE:
+        return Regenerate()
+    if _OP_SKILL <= op < _OP_SKILL + len(SKILLS):
+        return UseSkill(SKILLS[op - _OP_SKILL])
+    if _OP_ITEM <= op < _OP_ITEM + len(items):
+        return UseItem(items[op - _OP_ITEM])
+    raise ValueError(f"unknown action opcode in run recording: {op}")
@@ -0,0 +1,59 @@
+"""
+Timing wheel keyed on the turn something is next due.
+
+Entries land in slot `tick % slots`; `pop(tick)` empties that one slot and hands back
+what is due now, leaving entries for a later lap where they are. Scheduling a key again
+moves it (the old entry goes stale and is skipped), `cancel` drops it. Popped items come
+back sorted by `order`, so callers get a stable order (e.g. spawn order) regardless of
+when each was scheduled.
+
+DungeonSim keeps one wheel of enemy actions per floor, so a turn only touches the
+enemies due to act, and one of status effects (guard expiry, poison ticks) per run.
+On crowded floors the sim's EnemyTable works out, in a vectorized pass, who dozes off
+and when each popped enemy is next due; the wheel still holds them.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable
+from typing import Any
+
+
+class TimingWheel:
+    def __init__(self, slots: int = 64) -> None:
+        self._slots: list[list[tuple[int, int, Hashable, Any]]] = [[] for _ in range(slots)]
+        self._ticks: dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._ticks)
+
+    def schedule(self, key: Hashable, tick: int, item: Any, *, order: int = 0) -> None:
+        """(Re)schedules `key` for `tick`; `pop(tick)` will return `item`."""
+        self._ticks[key] = tick
+        self._slots[tick % len(self._slots)].append((order, tick, key, item))
+
+    def cancel(self, key: Hashable) -> None:
+        self._ticks.pop(key, None)
+
+    def due(self, key: Hashable) -> int | None:
+        return self._ticks.get(key)
+
+    def pop(self, tick: int) -> list[Any]:
+        """Everything due at `tick` (or overdue in this slot), sorted by order."""
+        i = tick % len(self._slots)
+        ticks = self._ticks
+        due: list[tuple[int, int, Hashable, Any]] = []
+        later: list[tuple[int, int, Hashable, Any]] = []
+        # Newest first, so a key rescheduled onto the same tick yields its latest item.
+        for entry in reversed(self._slots[i]):
+            _order, t, key, _item = entry
+            if ticks.get(key) != t:
+                continue  # cancelled, rescheduled, or an older duplicate
+            if t <= tick:
+                del ticks[key]
+                due.append(entry)
+            else:
+                later.append(entry)
+        self._slots[i] = later
+        due.sort(key=lambda e: e[0])
+        return [e[3] for e in due]
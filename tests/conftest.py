@@ -0,0 +1,33 @@
+"""Tests run against the repo root: game modules read data/ and assets/ relative to it."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+os.chdir(ROOT)
+
+from game.state import GameState  # noqa: E402
+
+
+@pytest.fixture
+def state() -> GameState:
+    """A private GameState with a bit of everything the save format stores."""
+    s = GameState()
+    s.player_name = "Tester"
+    s.gold = 1234
+    s.chapter = 3
+    s.set("met_guildmaster")
+    s.set("seen_intro")
+    s.add_item("potion_small", 3)
+    s.add_item("rope", 1)
+    s.equip("weapon", "whip")
+    s.record_kill("bat")
+    s.record_kill("bat")
+    s.complete_mission("first_steps")
+    return s
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from game.autosave import AutosaveRing, apply_delta, diff_snapshots
+from game.save import snapshot_state
+from game.save_service import SaveService
+from game.state import GameState
+
+
+@pytest.fixture
+def saves() -> Iterator[SaveService]:
+    service = SaveService(fsync="never")
+    yield service
+    service.shutdown()
+
+
+def _play(state: GameState) -> None:
+    state.gold += 50
+    state.add_item("rope", 2)
+    state.remove_item("potion_small", 1)
+    state.set("found_cave")
+    state.unset("seen_intro")
+    state.record_kill("slime")
+    state.equip("weapon", None)
+
+
+def test_diff_and_apply_round_trip(state: GameState) -> None:
+    before = snapshot_state(state)
+    _play(state)
+    after = snapshot_state(state)
+    delta = diff_snapshots(before, after)
+    assert set(delta) >= {"gold", "inventory", "flags", "kill_log", "equipment"}
+    fields = dict(before)
+    apply_delta(fields, delta)
+    assert fields == after
+    assert diff_snapshots(after, after) == {}
+
+
+def test_load_latest_replays_the_journal(state: GameState, saves: SaveService, tmp_path: Path) -> None:
+    ring = AutosaveRing(saves, directory=tmp_path)
+    ring.autosave(state)  # snapshot
+    _play(state)
+    ring.autosave(state)  # journal record
+    state.gold = 777
+    ring.autosave(state)  # another record
+    saves.flush()
+    assert ring.journal_path(ring.latest_index()).stat().st_size > 0
+
+    loaded = GameState()
+    assert ring.load_latest(loaded)
+    assert snapshot_state(loaded) == snapshot_state(state)
+
+    info = ring.info()
+    assert info is not None and info.gold == 777
+
+
+def test_journal_autosaves_copy_only_the_changed_fields(
+    state: GameState, saves: SaveService, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ring = AutosaveRing(saves, directory=tmp_path)
+    ring.autosave(state)  # snapshot
+
+    import game.autosave
+
+    copied: list[set[str]] = []
+    real = game.autosave.snapshot_fields
+
+    def spy(state: GameState, names: set[str]) -> dict:
+        copied.append(set(names))
+        return real(state, names)
+
+    monkeypatch.setattr(game.autosave, "snapshot_state", None)  # never a full copy from here on
+    monkeypatch.setattr(game.autosave, "snapshot_fields", spy)
+    ring.autosave(state)  # nothing changed: no copy, no record
+    state.gold += 5
+    state.add_item("rope", 1)
+    ring.autosave(state)
+    state.set("found_cave")
+    ring.autosave(state)
+    assert copied == [{"gold", "inventory"}, {"flags"}]
+    saves.flush()
+
+    monkeypatch.undo()
+    loaded = GameState()
+    assert ring.load_latest(loaded)
+    assert snapshot_state(loaded) == snapshot_state(state)
+
+
+def test_torn_journal_tail_loses_only_the_last_autosave(state: GameState, saves: SaveService, tmp_path: Path) -> None:
+    ring = AutosaveRing(saves, directory=tmp_path)
+    ring.autosave(state)
+    state.gold = 10
+    ring.autosave(state)
+    expected = snapshot_state(state)
+    state.gold = 20
+    ring.autosave(state)
+    saves.flush()
+
+    journal = ring.journal_path(ring.latest_index())
+    journal.write_bytes(journal.read_bytes()[:-3])
+    loaded = GameState()
+    assert ring.load_latest(loaded)
+    assert snapshot_state(loaded) == expected
+
+
+def test_compaction_starts_the_next_ring_entry(state: GameState, saves: SaveService, tmp_path: Path) -> None:
+    ring = AutosaveRing(saves, directory=tmp_path, size=3, compact_after=2)
+    ring.autosave(state)
+    first = ring._index
+    for gold in (1, 2):
+        state.gold = gold
+        ring.autosave(state)
+    assert ring._index == first
+    state.gold = 3
+    ring.autosave(state)  # journal is full: fresh snapshot in the next entry
+    saves.flush()
+    assert ring.latest_index() == (first + 1) % 3
+
+    # A new session continues after the newest entry and still loads the latest state.
+    loaded = GameState()
+    assert AutosaveRing(saves, directory=tmp_path, size=3).load_latest(loaded)
+    assert loaded.gold == 3
+
+
+def test_journal_for_another_snapshot_is_ignored(state: GameState, saves: SaveService, tmp_path: Path) -> None:
+    ring = AutosaveRing(saves, directory=tmp_path, size=1)
+    ring.autosave(state)
+    state.gold = 99
+    ring.autosave(state)
+    saves.flush()
+    stale = ring.journal_path(0).read_bytes()
+
+    ring.restart()
+    state.gold = 5
+    ring.autosave(state)  # size 1: rewrites entry 0 and its journal
+    saves.flush()
+    ring.journal_path(0).write_bytes(stale)
+
+    loaded = GameState()
+    assert ring.load_latest(loaded)
+    assert loaded.gold == 5
+
+
+def test_failed_snapshot_write_forces_a_fresh_snapshot(
+    state: GameState, saves: SaveService, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ring = AutosaveRing(saves, directory=tmp_path, size=3)
+    state.gold = 1
+    ring.autosave(state)
+    state.gold = 2
+    ring.autosave(state)  # journal on entry 0
+    saves.flush()
+    ring.restart()
+
+    import game.autosave
+
+    real_write = game.autosave.write_save
+
+    def failing_write(*args, **kwargs):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(game.autosave, "write_save", failing_write)
+    results: list[bool] = []
+    state.gold = 3
+    ring.autosave(state, on_done=results.append)  # snapshot for entry 1 fails
+    state.gold = 4
+    ring.autosave(state)  # queued before the failure is known: must not count against entry 1
+    saves.flush()
+    assert results == [False]
+
+    monkeypatch.setattr(game.autosave, "write_save", real_write)
+    state.gold = 5
+    ring.autosave(state)  # restart() after the failure: a fresh snapshot, not a delta
+    saves.flush()
+    loaded = GameState()
+    assert ring.load_latest(loaded)
+    assert loaded.gold == 5
+    assert snapshot_state(loaded) == snapshot_state(state)
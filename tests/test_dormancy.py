@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from random import Random
+
+import pytest
+
+from game.enemies import spawn_enemy
+from game.entities.enemy import Enemy
+from game.state import GameState
+from game.story.quest_tracker import QuestTracker
+from game.world.dormancy import DormantSet
+from game.world.dungeon_run import DungeonRun
+from game.world.dungeon_sim import NOISE_AWAKE_TURNS, NOISE_COMBAT, DungeonSim, Wait
+
+
+def _enemy(x: int, y: int) -> Enemy:
+    return spawn_enemy("bat", x=x, y=y, floor=1, rng=Random(0))
+
+
+def test_far_means_more_than_reach_buckets_away() -> None:
+    dormant = DormantSet(bucket=6, reach=2)
+    assert not dormant.is_far(_enemy(17, 0), 0, 0)  # bucket 2
+    assert dormant.is_far(_enemy(18, 0), 0, 0)  # bucket 3
+    assert dormant.is_far(_enemy(0, 18), 0, 0)
+    assert not dormant.is_far(_enemy(17, 17), 0, 0)
+
+
+def test_wake_region_takes_the_nearby_buckets_in_a_stable_order() -> None:
+    dormant = DormantSet(bucket=4, reach=1)
+    a, b, c, far = _enemy(5, 0), _enemy(0, 5), _enemy(1, 5), _enemy(20, 20)
+    for enemy in (c, a, far, b):
+        dormant.park(enemy)
+    assert len(dormant) == 4
+    # Bucket (1, 0) before (0, 1); within a bucket, parking order.
+    assert dormant.wake_region(0, 0) == [a, c, b]
+    assert far in dormant and a not in dormant
+    assert dormant.wake_region(0, 0) == []
+
+
+def test_wake_near_uses_the_manhattan_radius() -> None:
+    dormant = DormantSet(bucket=4, reach=1)
+    near, edge, past = _enemy(10, 10), _enemy(13, 11), _enemy(14, 11)
+    for enemy in (near, edge, past):
+        dormant.park(enemy)
+    assert dormant.wake_near(10, 10, 4) == [near, edge]
+    assert list(dormant._where) == [id(past)]
+    dormant.discard(past)
+    assert len(dormant) == 0 and dormant._buckets == {}
+
+
+@pytest.fixture
+def sim() -> DungeonSim:
+    state = GameState()
+    state.hp = state.stats.max_hp
+    run = DungeonRun.for_dungeon("temple_ruins", seed_base=2)
+    return DungeonSim(run, state=state, quests=QuestTracker(state), size=(72, 48))
+
+
+def _far_enemy(sim: DungeonSim) -> Enemy:
+    px, py = sim.player.x, sim.player.y
+    cells = [
+        (x, y)
+        for y, row in enumerate(sim.grid)
+        for x, tile in enumerate(row)
+        if tile == 0 and abs(x - px) + abs(y - py) > 40
+    ]
+    x, y = cells[0]
+    return _enemy(x, y)
+
+
+def test_far_idle_enemies_get_no_turns_until_noise(sim: DungeonSim) -> None:
+    enemy = _far_enemy(sim)
+    sim.set_enemies([enemy])
+    assert enemy in sim.dormant
+    assert sim.actors.due(id(enemy)) is None
+    before = (enemy.x, enemy.y)
+    for _ in range(5):
+        sim.step(Wait())
+    assert (enemy.x, enemy.y) == before
+
+    sim._noise(enemy.x, enemy.y, NOISE_COMBAT)
+    assert enemy not in sim.dormant
+    assert sim.actors.due(id(enemy)) is not None
+    assert enemy.awake_until == sim.turn + NOISE_AWAKE_TURNS
+
+
+def test_player_entering_the_region_wakes_it(sim: DungeonSim) -> None:
+    enemy = _far_enemy(sim)
+    sim.set_enemies([enemy])
+    assert enemy in sim.dormant
+    sim.player.x, sim.player.y = enemy.x, enemy.y + 1
+    sim.step(Wait())
+    assert enemy not in sim.dormant
+    assert sim.actors.due(id(enemy)) is not None
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from random import Random
+
+import pytest
+
+from game.state import GameState
+from game.story.quest_tracker import QuestTracker
+from game.world import dungeon_sim, enemy_table
+from game.world.dungeon_run import DungeonRun
+from game.world.dungeon_sim import AGGRO_TURNS, DungeonSim, Move, UseItem, UseSkill, UseStairs, Wait
+
+pytestmark = pytest.mark.skipif(not enemy_table.available(), reason="NumPy is not installed")
+
+_CHOICES = (
+    Move(0, -1),
+    Move(0, 1),
+    Move(-1, 0),
+    Move(1, 0),
+    Wait(),
+    UseStairs(),
+    UseSkill("whip"),
+    UseSkill("throw_rock"),
+    UseSkill("guard"),
+    UseItem("potion_small"),
+)
+
+
+def _horde(seed: int) -> DungeonSim:
+    state = GameState()
+    state.hp = 10**4
+    state.add_item("potion_small", 5)
+    run = DungeonRun.for_dungeon("temple_ruins", seed_base=seed, horde=True)
+    return DungeonSim(run, state=state, quests=QuestTracker(state), size=(64, 48))
+
+
+@pytest.fixture
+def sim() -> DungeonSim:
+    s = _horde(3)
+    assert s._table is not None
+    return s
+
+
+def test_plan_matches_the_per_object_scheduling(sim: DungeonSim) -> None:
+    rng = Random(1)
+    enemies = sim.enemies
+    for enemy in enemies:
+        # A spread of chasing, stunned, woken and idle enemies around the current turn.
+        enemy.aggro_until = sim.turn + rng.randrange(-2, 4)
+        enemy.stunned_until = sim.turn + rng.randrange(-2, 4)
+        enemy.awake_until = sim.turn + rng.randrange(-2, 2)
+        sim._table.refresh(enemy)
+    for turn in range(sim.turn, sim.turn + 6):
+        sim.turn = turn
+        expected = [0 if sim._can_doze(e) else sim._next_tick(e, turn) for e in enemies]
+        assert sim._table.plan(enemies, turn, sim.player.x, sim.player.y, sim.dormant) == expected
+    assert 0 in expected and len(set(expected)) > 2
+
+
+def test_notice_matches_the_visible_cell_scan(sim: DungeonSim) -> None:
+    px, py = sim.player.x, sim.player.y
+    sim.fov.update(sim.grid, (px, py))
+    near = [e for e in sim.enemies if sim.fov.is_visible(e.x, e.y)]
+    assert near
+    near[0].stunned_until = sim.turn + 5
+    sim._table.refresh(near[0])
+
+    woken = sim._table.notice(sim.turn, px, py, sim.fov, AGGRO_TURNS)
+    expected = [
+        e
+        for e in sim.enemies
+        if sim.fov.is_visible(e.x, e.y)
+        and e.stunned_until <= sim.turn
+        and abs(e.x - px) + abs(e.y - py) <= e.aggro_range
+    ]
+    assert woken == expected
+    assert all(e.aggro_until == sim.turn + AGGRO_TURNS for e in expected)
+    assert near[0] not in woken and near[0].aggro_until <= sim.turn
+    assert sim._table.notice(sim.turn, px, py, sim.fov, AGGRO_TURNS) == []  # already chasing
+
+
+def test_writes_go_through_to_the_columns(sim: DungeonSim) -> None:
+    table = sim._table
+    enemy = sim.enemies[0]
+    row = table._rows[id(enemy)]
+    sim._stun(enemy, 2)
+    assert table.stunned_until[row] == enemy.stunned_until
+    live = len(table)
+    sim._damage_enemy(enemy, enemy.hp, source="melee", xp=0, gold=0)
+    assert len(table) == live - 1 and table.hp[row] == 0
+
+
+def test_horde_runs_match_with_and_without_the_table(monkeypatch: pytest.MonkeyPatch) -> None:
+    def trace() -> list[int]:
+        sim = _horde(1)
+        rng = Random(7)
+        hashes = []
+        for _ in range(400):
+            sim.step(rng.choice(_CHOICES))
+            hashes.append(sim.state_hash())
+        return hashes
+
+    with_table = trace()
+    monkeypatch.setattr(dungeon_sim, "ENEMY_TABLE_MIN", 10**9)
+    assert trace() == with_table
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from collections import deque
+from random import Random
+
+from game.constants import TILE_FLOOR, TILE_WALL
+from game.world.flow_field import UNREACHABLE, FlowField
+
+MAZE = """
+#########
+#...#...#
+#.#.#.#.#
+#.#...#.#
+#.#####.#
+#.......#
+###.#####
+#...#..##
+#########
+"""
+
+
+def _grid(text: str) -> list[list[int]]:
+    return [[TILE_WALL if c == "#" else TILE_FLOOR for c in line] for line in text.strip().splitlines()]
+
+
+def _bfs(grid: list[list[int]], target: tuple[int, int]) -> dict[tuple[int, int], int]:
+    dist = {target: 0}
+    queue = deque([target])
+    while queue:
+        x, y = queue.popleft()
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if grid[ny][nx] != TILE_WALL and (nx, ny) not in dist:
+                dist[(nx, ny)] = dist[(x, y)] + 1
+                queue.append((nx, ny))
+    return dist
+
+
+def _never(x: int, y: int) -> bool:
+    return False
+
+
+def test_distances_match_a_plain_bfs() -> None:
+    grid = _grid(MAZE)
+    for target in ((1, 1), (7, 5), (3, 7)):
+        field = FlowField()
+        field.update(grid, target)
+        expected = _bfs(grid, target)
+        for y, row in enumerate(grid):
+            for x, _ in enumerate(row):
+                assert field.distance(x, y) == expected.get((x, y), UNREACHABLE), (target, x, y)
+
+
+def test_unreachable_and_off_grid_cells() -> None:
+    grid = _grid(MAZE)
+    field = FlowField()
+    field.update(grid, (1, 1))
+    assert field.distance(6, 7) == UNREACHABLE  # sealed pocket
+    assert field.distance(0, 0) == UNREACHABLE  # wall
+    assert field.distance(-1, 3) == UNREACHABLE
+    assert field.distance(99, 3) == UNREACHABLE
+    assert field.step_toward(6, 7, _never) is None
+
+
+def test_following_steps_reaches_the_target_by_a_shortest_path() -> None:
+    grid = _grid(MAZE)
+    field = FlowField()
+    field.update(grid, (1, 1))
+    rng = Random(3)
+    x, y = 3, 7
+    start = field.distance(x, y)
+    for _ in range(start):
+        x, y = field.step_toward(x, y, _never, rng)
+    assert (x, y) == (1, 1)
+    assert field.step_toward(x, y, _never) is None  # already there
+
+
+def test_blocked_cells_are_skipped_and_step_away_backs_off() -> None:
+    grid = _grid(MAZE)
+    field = FlowField()
+    field.update(grid, (5, 5))
+    # (3, 5) has a single closer neighbour, (4, 5): blocking it means staying put.
+    assert field.step_toward(3, 5, lambda x, y: (x, y) == (4, 5)) is None
+    away = field.step_away(3, 5, _never)
+    assert away is not None and field.distance(*away) == field.distance(3, 5) + 1
+
+
+def test_rebuilds_only_when_the_target_or_grid_changes() -> None:
+    grid = _grid(MAZE)
+    field = FlowField()
+    assert field.update(grid, (1, 1))
+    assert not field.update(grid, (1, 1))
+    assert field.update(grid, (2, 1))
+    assert field.update(_grid(MAZE), (2, 1))  # a new floor, same layout
+    assert field.rebuilds == 3
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from game.constants import TILE_FLOOR, TILE_WALL
+from game.world.fov import FieldOfView
+
+
+def _grid(text: str) -> list[list[int]]:
+    return [[TILE_WALL if c == "#" else TILE_FLOOR for c in line] for line in text.strip().splitlines()]
+
+
+ROOM = """
+###########
+#.........#
+#.........#
+#.........#
+#.........#
+#.........#
+###########
+"""
+
+PILLAR = """
+###########
+#.........#
+#.........#
+#...#.....#
+#.........#
+#.........#
+###########
+"""
+
+TWO_ROOMS = """
+###########
+#...#.....#
+#...#.....#
+#.........#
+#...#.....#
+#...#.....#
+###########
+"""
+
+
+def test_open_room_is_all_visible_walls_included() -> None:
+    grid = _grid(ROOM)
+    fov = FieldOfView(light_radius=3, sight_radius=12)
+    fov.update(grid, (5, 3))
+    for y, row in enumerate(grid):
+        for x, _ in enumerate(row):
+            assert fov.is_visible(x, y), (x, y)
+
+
+def test_visible_cells_match_the_bitset() -> None:
+    fov = FieldOfView()
+    fov.update(_grid(TWO_ROOMS), (2, 3))
+    cells = fov.visible_cells()
+    assert len(cells) == len(set(cells))
+    assert set(cells) == {(x, y) for y in range(fov.height) for x in range(fov.width) if fov.is_visible(x, y)}
+
+
+def test_pillar_casts_a_shadow() -> None:
+    grid = _grid(PILLAR)
+    fov = FieldOfView()
+    fov.update(grid, (2, 3))
+    assert fov.is_visible(4, 3)  # the pillar itself
+    assert not fov.is_visible(5, 3)
+    assert not fov.is_visible(8, 3)
+    assert fov.is_visible(8, 1)
+
+
+def test_wall_hides_the_next_room_except_through_the_door() -> None:
+    grid = _grid(TWO_ROOMS)
+    fov = FieldOfView()
+    fov.update(grid, (1, 1))
+    assert not fov.is_visible(6, 1)
+    assert not fov.is_visible(9, 2)
+    assert fov.is_visible(7, 5)  # the diagonal through the doorway at (4, 3)
+    fov.update(grid, (2, 3))  # level with the doorway
+    assert fov.is_visible(9, 3)
+    assert not fov.is_visible(5, 1)
+
+
+def test_sight_and_light_radii() -> None:
+    grid = _grid(ROOM)
+    fov = FieldOfView(light_radius=1, sight_radius=2)
+    fov.update(grid, (1, 1))
+    assert fov.is_visible(3, 1) and not fov.is_visible(4, 1)
+    assert fov.is_lit(2, 1) and fov.is_lit(2, 2)
+    assert not fov.is_lit(3, 1)
+    assert set(fov.lit_cells()) <= set(fov.visible_cells())
+
+
+def test_recasts_only_when_something_changed() -> None:
+    grid = _grid(ROOM)
+    fov = FieldOfView()
+    assert fov.update(grid, (2, 2))
+    assert not fov.update(grid, (2, 2))
+    assert fov.update(grid, (3, 2))
+    fov.light_radius += 1
+    assert fov.update(grid, (3, 2))
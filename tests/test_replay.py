@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import dataclasses
+from random import Random
+
+import pytest
+
+from game.save import snapshot_state
+from game.state import STATE, GameState
+from game.story.quest_tracker import QuestTracker
+from game.world.dungeon_run import DungeonRun
+from game.world.dungeon_sim import Action, DungeonSim, Move, UseItem, UseSkill, UseStairs, Wait
+from game.world.replay import RunRecording, replay
+
+_CHOICES: tuple[Action, ...] = (
+    Move(0, -1),
+    Move(0, 1),
+    Move(-1, 0),
+    Move(1, 0),
+    Move(1, 0),
+    Move(0, 1),
+    Wait(),
+    UseStairs(),
+    UseSkill("whip"),
+    UseSkill("throw_rock"),
+    UseSkill("guard"),
+    UseItem("potion_small"),
+)
+
+
+@pytest.fixture(scope="module")
+def recording() -> RunRecording:
+    state = GameState()
+    state.hp = state.stats.max_hp
+    state.add_item("potion_small", 3)
+    run = DungeonRun.for_dungeon("jungle_cavern", seed_base=11)
+    rec = RunRecording.start(run, state)
+    sim = DungeonSim(run, state=state, quests=QuestTracker(state))
+    rec.begin(sim)
+    rng = Random(99)
+    while sim.outcome is None and len(rec.actions) < 300:
+        action = rng.choice(_CHOICES)
+        sim.step(action)
+        rec.record(action, sim)
+    return rec
+
+
+def test_replay_matches_every_hash(recording: RunRecording) -> None:
+    result = replay(recording)
+    assert result.ok
+    assert result.actions == len(recording.actions)
+    again = replay(recording)
+    assert (again.turns, again.outcome) == (result.turns, result.outcome)
+
+
+def test_file_round_trip(recording: RunRecording) -> None:
+    loaded = RunRecording.from_bytes(recording.to_bytes())
+    assert loaded == recording
+    assert replay(loaded).ok
+
+
+def test_replay_leaves_the_global_state_alone(recording: RunRecording) -> None:
+    before = snapshot_state(STATE)
+    replay(recording)
+    assert snapshot_state(STATE) == before
+
+
+def test_divergence_is_reported_at_the_first_bad_action(recording: RunRecording) -> None:
+    hashes = list(recording.hashes)
+    hashes[17] ^= 1
+    result = replay(dataclasses.replace(recording, hashes=hashes))
+    assert result.diverged_at == 17
+    assert result.actions == 18
+
+    other_seed = replay(dataclasses.replace(recording, seed_base=recording.seed_base + 1))
+    assert other_seed.diverged_at == -1
+
+
+def test_unverified_replay_plays_everything(recording: RunRecording) -> None:
+    result = replay(recording, verify=False)
+    assert result.actions == len(recording.actions)
+    assert result.turns == replay(recording).turns
+
+
+def test_truncated_or_foreign_files_raise_value_error(recording: RunRecording) -> None:
+    data = recording.to_bytes()
+    for n in range(len(data)):
+        with pytest.raises(ValueError):
+            RunRecording.from_bytes(data[:n])
+    with pytest.raises(ValueError):
+        RunRecording.from_bytes(b"CCDS" + data[4:])
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import io
+
+import pytest
+
+from game import save_codec
+from game.save import _apply_state, encode_save, snapshot_state
+from game.state import GameState
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_round_trip(state: GameState, compress: bool) -> None:
+    snap = snapshot_state(state)
+    payload = save_codec.decode(save_codec.encode(snap, compress=compress, meta={"note": "x"}))
+    assert payload["version"] == save_codec.SCHEMA_VERSION
+    assert payload["typed"] is True
+    assert payload["meta"]["note"] == "x"
+    assert payload["state"] == snap
+
+    restored = GameState()
+    _apply_state(restored, payload)
+    assert snapshot_state(restored) == snap
+
+
+def test_read_meta_only_reads_the_header(state: GameState) -> None:
+    data = encode_save(snapshot_state(state))
+    meta = save_codec.read_meta(io.BytesIO(data))
+    assert meta is not None
+    assert meta["player_name"] == "Tester"
+    assert meta["gold"] == 1234
+    assert meta["hash"] == save_codec.decode(data)["meta"]["hash"]
+
+
+def test_empty_ids_are_rejected(state: GameState) -> None:
+    snap = snapshot_state(state)
+    snap["flags"] = {""}
+    with pytest.raises(ValueError):
+        save_codec.encode(snap)
+
+
+def test_unknown_sections_are_skipped() -> None:
+    data = save_codec.encode({"gold": 7}, compress=False)
+    extra = save_codec._SECTION.pack(len(save_codec.SCHEMA) + 5, 3) + b"abc"
+    head = save_codec._HEADER.unpack_from(data, 0)
+    payload = data[save_codec._HEADER.size :] + extra
+    patched = save_codec._HEADER.pack(head[0], head[1], head[2], len(payload)) + payload
+    assert save_codec.decode(patched)["state"] == {"gold": 7}
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_every_truncation_raises_value_error(state: GameState, compress: bool) -> None:
+    data = save_codec.encode(snapshot_state(state), compress=compress, meta={"note": "x"})
+    for n in range(len(data)):
+        with pytest.raises(ValueError):
+            save_codec.decode(data[:n])
+
+
+def test_corrupt_payload_raises_value_error(state: GameState) -> None:
+    data = bytearray(save_codec.encode(snapshot_state(state), meta={}))
+    data[-1] ^= 0xFF  # caught by the payload hash in the meta block
+    with pytest.raises(ValueError, match="hash"):
+        save_codec.decode(bytes(data))
+
+    bare = bytearray(save_codec.encode(snapshot_state(state)))
+    bare[save_codec._HEADER.size + 2] ^= 0xFF  # no hash: zlib has to notice
+    with pytest.raises(ValueError):
+        save_codec.decode(bytes(bare))
+
+
+def test_wrong_magic_or_version() -> None:
+    data = save_codec.encode({"gold": 1})
+    with pytest.raises(ValueError, match="not a binary save"):
+        save_codec.decode(b"XXXX" + data[4:])
+    head = save_codec._HEADER.unpack_from(data, 0)
+    newer = save_codec._HEADER.pack(head[0], head[1] + 1, head[2], head[3]) + data[save_codec._HEADER.size :]
+    with pytest.raises(ValueError, match="unsupported save version"):
+        save_codec.decode(newer)
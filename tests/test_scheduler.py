@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import pytest
+
+from game.state import GameState
+from game.story.quest_tracker import QuestTracker
+from game.world.dungeon_run import DungeonRun
+from game.world.dungeon_sim import DungeonSim, UseSkill, Wait
+from game.world.scheduler import TimingWheel
+
+
+def test_pop_returns_only_what_is_due_sorted_by_order() -> None:
+    wheel = TimingWheel(slots=8)
+    wheel.schedule("c", 3, "c", order=2)
+    wheel.schedule("a", 3, "a", order=0)
+    wheel.schedule("b", 3, "b", order=1)
+    wheel.schedule("later", 4, "later")
+    assert wheel.pop(2) == []
+    assert wheel.pop(3) == ["a", "b", "c"]
+    assert wheel.pop(3) == []
+    assert wheel.pop(4) == ["later"]
+    assert len(wheel) == 0
+
+
+def test_entries_a_lap_ahead_stay_put() -> None:
+    wheel = TimingWheel(slots=4)
+    wheel.schedule("far", 9, "far")  # same slot as tick 1 and 5
+    assert wheel.pop(1) == []
+    assert wheel.pop(5) == []
+    assert wheel.pop(9) == ["far"]
+
+
+def test_reschedule_moves_and_cancel_drops() -> None:
+    wheel = TimingWheel(slots=8)
+    wheel.schedule("x", 2, "old")
+    wheel.schedule("x", 5, "new")
+    wheel.schedule("y", 2, "y")
+    wheel.cancel("y")
+    assert wheel.due("x") == 5
+    assert wheel.due("y") is None
+    assert wheel.pop(2) == []
+    assert wheel.pop(5) == ["new"]
+
+
+def test_rescheduling_onto_the_same_tick_yields_the_latest_item() -> None:
+    wheel = TimingWheel(slots=8)
+    wheel.schedule("x", 3, "first")
+    wheel.schedule("x", 3, "second")
+    assert wheel.pop(3) == ["second"]
+
+
+def test_overdue_entries_in_the_popped_slot_come_out() -> None:
+    wheel = TimingWheel(slots=4)
+    wheel.schedule("late", 2, "late")
+    assert wheel.pop(6) == ["late"]
+
+
+@pytest.fixture
+def sim() -> DungeonSim:
+    state = GameState()
+    state.hp = state.stats.max_hp
+    s = DungeonSim(DungeonRun.for_dungeon("temple_ruins", seed_base=5), state=state, quests=QuestTracker(state))
+    s.set_enemies([])
+    return s
+
+
+def test_poison_ticks_from_the_effects_wheel(sim: DungeonSim) -> None:
+    state = sim.state
+    hp = state.hp
+    sim._poison(3, 2)
+    for expected in (hp - 2, hp - 4, hp - 6):
+        sim.step(Wait())
+        assert state.hp == expected
+    sim.step(Wait())
+    assert state.hp == hp - 6
+    assert state.poison_turns == 0
+    assert sim.effects.due("poison") is None
+
+
+def test_poison_death_does_not_use_up_the_turn(sim: DungeonSim) -> None:
+    state = sim.state
+    state.hp = 2
+    sim._poison(5, 3)
+    turn = sim.turn
+    sim.step(Wait())
+    assert sim.outcome == "died"
+    assert sim.turn == turn
+
+
+def test_guard_lapses_after_one_enemy_turn(sim: DungeonSim) -> None:
+    state = sim.state
+    sim.step(UseSkill("guard"))
+    assert state.guard_turns == 1
+    sim.step(Wait())
+    assert state.guard_turns == 0
+
+
+def test_guard_and_poison_at_the_start_of_a_run(sim: DungeonSim) -> None:
+    state = sim.state
+    state.guard_turns = 1
+    state.poison_turns, state.poison_damage = 2, 1
+    hp = state.hp
+    fresh = DungeonSim(DungeonRun.for_dungeon("temple_ruins", seed_base=5), state=state, quests=QuestTracker(state))
+    fresh.set_enemies([])
+    assert state.guard_turns == 0  # a guard doesn't carry into the next run
+    fresh.step(Wait())
+    assert state.hp == hp - 1  # poison does, from the first enemy turn
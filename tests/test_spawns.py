@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from collections import Counter
+from random import Random
+
+import pytest
+
+from game.spawns import AliasTable, DungeonSpawns, SpawnEntry, _compile, build_alias
+
+
+def _column_mass(weights: list[float]) -> list[float]:
+    """Exact probability the alias columns give each index."""
+    prob, alias = build_alias(weights)
+    n = len(weights)
+    mass = [0.0] * n
+    for i in range(n):
+        mass[i] += prob[i] / n
+        mass[alias[i]] += (1.0 - prob[i]) / n
+    return mass
+
+
+@pytest.mark.parametrize(
+    "weights",
+    [[1.0], [1.0, 1.0, 1.0], [5.0, 1.0], [0.5, 3.0, 1.5, 10.0, 0.25], [1.0] * 7 + [30.0]],
+)
+def test_alias_columns_match_the_weights(weights: list[float]) -> None:
+    total = sum(weights)
+    for got, w in zip(_column_mass(weights), weights):
+        assert got == pytest.approx(w / total, abs=1e-12)
+
+
+def test_draws_follow_the_weights() -> None:
+    entries = [SpawnEntry("a", 1.0), SpawnEntry("b", 2.0), SpawnEntry("c", 7.0)]
+    table = AliasTable(entries)
+    rng = Random(1234)
+    n = 60_000
+    counts = Counter(table.draw(rng) for _ in range(n))
+    for e in entries:
+        expected = n * e.weight / 10.0
+        # ~4 standard deviations of a binomial count.
+        assert abs(counts[e.enemy_id] - expected) < 4 * (expected * (1 - e.weight / 10.0)) ** 0.5
+
+
+def test_caps_fall_back_to_the_open_entries() -> None:
+    table = AliasTable([SpawnEntry("boss", 100.0, cap=1), SpawnEntry("bat", 1.0)])
+    rng = Random(7)
+    assert {table.draw(rng, {"boss": 1}) for _ in range(200)} == {"bat"}
+    assert AliasTable([SpawnEntry("boss", cap=1)]).draw(rng, {"boss": 1}) is None
+    assert AliasTable([]).draw(rng) is None
+
+
+def test_zero_weight_entries_are_dropped() -> None:
+    table = AliasTable([SpawnEntry("ghost", 0.0), SpawnEntry("bat", 1.0)])
+    assert table.ids == ("bat",)
+
+
+def test_one_table_per_floor_until_the_entries_stop_changing() -> None:
+    spawns = DungeonSpawns(
+        "test",
+        enemies=(
+            SpawnEntry("bat"),
+            SpawnEntry("archer", min_floor=3),
+            SpawnEntry("slime", max_floor=2),
+        ),
+    )
+    tables = _compile(spawns)
+    assert [t.ids for t in tables] == [("bat", "slime"), ("bat", "slime"), ("bat", "archer")]
@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+import zlib
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from game.constants import TILE_DUNGEON_EXIT, TILE_STAIRS_DOWN, TILE_WALL  # noqa: E402
+from game.spawns import dungeon_spawns  # noqa: E402
+from game.state import GameState  # noqa: E402
+from game.story.quest_tracker import QuestTracker  # noqa: E402
+from game.world.dungeon_run import DUNGEONS, DungeonRun  # noqa: E402
+from game.world.dungeon_sim import Action, DungeonSim, ItemUsed, Move, UseItem, UseStairs, Wait  # noqa: E402
+from game.world.flow_field import FlowField  # noqa: E402
+
+POTION = "potion_small"
+_DIRS = ((1, 0), (0, 1), (-1, 0), (0, -1))
+
+
+class GreedyBot:
+    """
+    Drinks a potion at or below `potion_threshold` of max HP, attacks anything adjacent,
+    then walks to (in order) the nearest seen pickup, a living boss, the stairs down (or
+    the exit) once seen, the nearest unexplored cell, and finally the stairs unseen.
+    """
+
+    def __init__(self, *, potion_threshold: float = 0.4) -> None:
+        self.potion_threshold = potion_threshold
+        self.nav = FlowField()
+        self._grid: list[list[int]] | None = None
+        self._stairs: tuple[int, int] | None = None
+
+    def act(self, sim: DungeonSim) -> Action:
+        state = sim.state
+        max_hp = state.stats.max_hp
+        if state.hp < max_hp and state.hp <= max_hp * self.potion_threshold and state.item_count(POTION) > 0:
+            return UseItem(POTION)
+        px, py = sim.player.x, sim.player.y
+        for dx, dy in _DIRS:
+            enemy = sim.enemy_at(px + dx, py + dy)
+            if enemy is not None and enemy.is_alive():
+                return Move(dx, dy)
+        goal = self._goal(sim)
+        if goal is None:
+            return Wait()
+        if goal == (px, py):
+            return UseStairs()
+        self.nav.update(sim.grid, goal)
+        step = self.nav.step_toward(px, py, lambda x, y: False)
+        if step is None:
+            return Wait()
+        return Move(step[0] - px, step[1] - py)
+
+    def _goal(self, sim: DungeonSim) -> tuple[int, int] | None:
+        grid, seen = sim.grid, sim.seen
+        if grid is not self._grid:
+            self._grid = grid
+            want = TILE_DUNGEON_EXIT if sim.run.floor >= sim.run.max_floor else TILE_STAIRS_DOWN
+            self._stairs = next(((x, y) for y, row in enumerate(grid) for x, t in enumerate(row) if t == want), None)
+        # The sim's own field holds every cell's distance to the player.
+        sim.flow.update(grid, (sim.player.x, sim.player.y))
+        dist = sim.flow.distance
+
+        best: tuple[int, tuple[int, int]] | None = None
+        for pickup in sim.pickups:
+            d = dist(pickup.x, pickup.y)
+            if seen[pickup.y][pickup.x] and d > 0 and (best is None or d < best[0]):
+                best = (d, (pickup.x, pickup.y))
+        if best is not None:
+            return best[1]
+        bosses = {b.enemy_id for b in dungeon_spawns(sim.run.dungeon_id).bosses}
+        for enemy in sim.enemies if bosses else ():
+            if enemy.enemy_id in bosses and enemy.is_alive() and dist(enemy.x, enemy.y) > 0:
+                return enemy.x, enemy.y
+        if self._stairs is not None and seen[self._stairs[1]][self._stairs[0]]:
+            return self._stairs
+        for y, row in enumerate(grid):
+            for x, tile in enumerate(row):
+                if tile != TILE_WALL and not seen[y][x]:
+                    d = dist(x, y)
+                    if d > 0 and (best is None or d < best[0]):
+                        best = (d, (x, y))
+        if best is not None:
+            return best[1]
+        return self._stairs
+
+
+POLICIES = {"greedy": GreedyBot}
+
+
+@dataclass(frozen=True)
+class RunResult:
+    dungeon_id: str
+    outcome: str  # escaped | mission | died | timeout
+    floor: int  # floor the run ended on
+    floor_turns: tuple[int, ...]  # turns spent per floor, floor 1 first
+    gold: int
+    xp: int
+    kills: int
+    potions_used: int
+
+
+def play_run(
+    dungeon_id: str,
+    seed_base: int,
+    *,
+    policy: str,
+    potions: int,
+    level: int,
+    threshold: float,
+    max_turns: int,
+    horde: bool = False,
+) -> RunResult:
+    state = GameState()
+    for lv in range(1, level):
+        state.add_combat_xp(GameState.combat_xp_to_next(lv))
+    state.hp = state.stats.max_hp
+    if potions > 0:
+        state.add_item(POTION, potions)
+    xp_before = _total_xp(state)
+    sim = DungeonSim(DungeonRun.for_dungeon(dungeon_id, seed_base=seed_base, horde=horde), state=state, quests=QuestTracker(state))
+    bot = POLICIES[policy](potion_threshold=threshold)
+    floor_turns = [0] * sim.run.max_floor
+    potions_used = 0
+    actions = 0
+    # Failed actions cost no turn, so cap those too in case a policy gets stuck.
+    while sim.outcome is None and sim.turn < max_turns and actions < 4 * max_turns:
+        floor, turn = sim.run.floor, sim.turn
+        for event in sim.step(bot.act(sim)):
+            if isinstance(event, ItemUsed) and event.item_id == POTION:
+                potions_used += 1
+        floor_turns[floor - 1] += sim.turn - turn
+        actions += 1
+    return RunResult(
+        dungeon_id=dungeon_id,
+        outcome=sim.outcome or "timeout",
+        floor=sim.run.floor,
+        floor_turns=tuple(floor_turns),
+        gold=sim.gold_gained,
+        xp=_total_xp(state) - xp_before,
+        kills=sim.kills,
+        potions_used=potions_used,
+    )
+
+
+def _total_xp(state: GameState) -> int:
+    return sum(GameState.combat_xp_to_next(lv) for lv in range(1, state.combat_level)) + state.combat_xp
+
+
+def _play_chunk(job: tuple[str, list[int], dict]) -> list[RunResult]:
+    dungeon_id, seeds, options = job
+    return [play_run(dungeon_id, seed, **options) for seed in seeds]
+
+
+@dataclass
+class DungeonReport:
+    dungeon_id: str
+    max_floor: int
+    runs: int = 0
+    outcomes: dict[str, int] = field(default_factory=dict)
+    death_floors: dict[int, int] = field(default_factory=dict)
+    floor_turns: list[int] = field(default_factory=list)  # summed over runs that reached the floor
+    floor_visits: list[int] = field(default_factory=list)
+    gold: int = 0
+    xp: int = 0
+    kills: int = 0
+    potions_used: int = 0
+
+    def add(self, result: RunResult) -> None:
+        if not self.floor_turns:
+            self.floor_turns = [0] * self.max_floor
+            self.floor_visits = [0] * self.max_floor
+        self.runs += 1
+        self.outcomes[result.outcome] = self.outcomes.get(result.outcome, 0) + 1
+        if result.outcome == "died":
+            self.death_floors[result.floor] = self.death_floors.get(result.floor, 0) + 1
+        for i, turns in enumerate(result.floor_turns[: result.floor]):
+            self.floor_turns[i] += turns
+            self.floor_visits[i] += 1
+        self.gold += result.gold
+        self.xp += result.xp
+        self.kills += result.kills
+        self.potions_used += result.potions_used
+
+    def to_json(self) -> dict:
+        n = max(1, self.runs)
+        return {
+            "dungeon_id": self.dungeon_id,
+            "max_floor": self.max_floor,
+            "runs": self.runs,
+            "outcomes": dict(sorted(self.outcomes.items())),
+            "survival_rate": round(1 - self.outcomes.get("died", 0) / n, 4),
+            "death_floors": {str(f): c for f, c in sorted(self.death_floors.items())},
+            "mean_turns_per_floor": [round(t / v, 1) if v else None for t, v in zip(self.floor_turns, self.floor_visits)],
+            "mean_gold": round(self.gold / n, 2),
+            "mean_xp": round(self.xp / n, 2),
+            "mean_kills": round(self.kills / n, 2),
+            "mean_potions_used": round(self.potions_used / n, 3),
+        }
+
+
+def _jobs(dungeon_ids: list[str], runs: int, seed: int, chunk: int, options: dict) -> Iterator[tuple[str, list[int], dict]]:
+    for dungeon_id in dungeon_ids:
+        seeds = [zlib.crc32(f"{dungeon_id}:{seed}:{i}".encode("utf-8")) % 2_000_000_000 + 1 for i in range(runs)]
+        for i in range(0, runs, chunk):
+            yield dungeon_id, seeds[i : i + chunk], options
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Monte-Carlo balance runs: a scripted bot plays seeded DungeonSim runs of each dungeon across a process pool")
+    parser.add_argument("--dungeons", default="", help="Comma-separated dungeon ids (default: every dungeon)")
+    parser.add_argument("--runs", type=int, default=200, help="Runs per dungeon (default: 200)")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="greedy")
+    parser.add_argument("--threshold", type=float, default=0.4, help="Drink a potion at or below this fraction of max HP (default: 0.4)")
+    parser.add_argument("--potions", type=int, default=2, help=f"{POTION} in the starting inventory (default: 2)")
+    parser.add_argument("--level", type=int, default=1, help="Starting combat level, with its stat growth (default: 1)")
+    parser.add_argument("--horde", action="store_true", help="Horde floors: packed with enemies")
+    parser.add_argument("--max-turns", type=int, default=3000, help="Turns before a run counts as a timeout (default: 3000)")
+    parser.add_argument("--jobs", type=int, default=0, help="Worker processes (default: CPU count; 1 runs in-process)")
+    parser.add_argument("--chunk", type=int, default=25, help="Runs per worker task (default: 25)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", type=Path, default=None, help="Also write the report as JSON here")
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    dungeon_ids = [d.strip() for d in args.dungeons.split(",") if d.strip()] or [d for d in DUNGEONS if not d.startswith("_")]
+    unknown = [d for d in dungeon_ids if d not in DUNGEONS or d.startswith("_")]
+    if unknown:
+        print(f"unknown dungeon ids: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+    options = {
+        "policy": args.policy,
+        "potions": args.potions,
+        "level": args.level,
+        "threshold": args.threshold,
+        "max_turns": args.max_turns,
+        "horde": args.horde,
+    }
+    reports = {d: DungeonReport(d, DUNGEONS[d][1]) for d in dungeon_ids}
+    jobs = list(_jobs(dungeon_ids, args.runs, args.seed, max(1, args.chunk), options))
+    workers = args.jobs or os.cpu_count() or 1
+
+    t0 = time.perf_counter()
+    if workers == 1:
+        chunks: Iterator[list[RunResult]] = map(_play_chunk, jobs)
+        for results in chunks:
+            for result in results:
+                reports[result.dungeon_id].add(result)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for results in pool.map(_play_chunk, jobs):
+                for result in results:
+                    reports[result.dungeon_id].add(result)
+    elapsed = time.perf_counter() - t0
+    total = sum(r.runs for r in reports.values())
+
+    mode = ", horde floors" if args.horde else ""
+    print(f"{total} runs ({args.policy} bot, level {args.level}, {args.potions} potions, drink at {args.threshold:.0%}{mode}) on {workers} worker(s) in {elapsed:.1f}s = {total / max(elapsed, 1e-9):,.0f} runs/s")
+    print()
+    print(f"{'dungeon':<18} {'runs':>6} {'survive':>8} {'escaped':>8} {'timeout':>8} {'gold':>7} {'xp':>7} {'kills':>6} {'potions':>8}  deaths by floor / mean turns per floor")
+    for report in reports.values():
+        j = report.to_json()
+        n = max(1, report.runs)
+        deaths = " ".join(f"F{f}:{c / n:.0%}" for f, c in sorted(report.death_floors.items())) or "-"
+        turns = " ".join("-" if t is None else f"{t:g}" for t in j["mean_turns_per_floor"])
+        print(
+            f"{report.dungeon_id:<18} {report.runs:>6} {j['survival_rate']:>8.1%} {report.outcomes.get('escaped', 0) / n:>8.1%} "
+            f"{report.outcomes.get('timeout', 0) / n:>8.1%} {j['mean_gold']:>7.1f} {j['mean_xp']:>7.1f} {j['mean_kills']:>6.1f} "
+            f"{j['mean_potions_used']:>8.2f}  {deaths} / {turns}"
+        )
+
+    if args.json is not None:
+        payload = {
+            "options": {**options, "runs": args.runs, "seed": args.seed},
+            "dungeons": [r.to_json() for r in reports.values()],
+        }
+        args.json.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        print(f"\nwrote {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
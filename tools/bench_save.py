@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from random import Random
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from game import save_codec  # noqa: E402
+from game.save import _apply_state, _payload, snapshot_state  # noqa: E402
+from game.state import GameState  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Save format benchmark: JSON vs binary (raw and zlib) on a synthetic late-campaign save")
+    parser.add_argument("--flags", type=int, default=5000, help="Number of story flags (default: 5000)")
+    parser.add_argument("--kills", type=int, default=3000, help="Number of distinct kill_log entries (default: 3000)")
+    parser.add_argument("--items", type=int, default=400, help="Number of distinct inventory items (default: 400)")
+    parser.add_argument("--runs", type=int, default=20, help="Repetitions per measurement, best is kept (default: 20)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    state = _synthetic_state(Random(args.seed), flags=args.flags, kills=args.kills, items=args.items)
+    snapshot = snapshot_state(state)
+
+    formats: dict[str, tuple[Callable[[], bytes], Callable[[bytes], dict]]] = {
+        "json": (
+            lambda: json.dumps(_payload(snapshot), indent=2, sort_keys=True).encode("utf-8"),
+            lambda data: json.loads(data.decode("utf-8")),
+        ),
+        "binary": (
+            lambda: save_codec.encode(snapshot, compress=False),
+            lambda data: save_codec.decode(data),
+        ),
+        "binary+zlib": (
+            lambda: save_codec.encode(snapshot, compress=True),
+            lambda data: save_codec.decode(data),
+        ),
+    }
+
+    print(f"synthetic save: {args.flags} flags, {args.kills} kill_log entries, {args.items} inventory items")
+    print()
+    print("decode: bytes -> field dict (JSON's still needs coercing); load: bytes -> GameState, what a slot load costs")
+    print(f"{'format':<12} {'bytes':>10} {'encode ms':>10} {'decode ms':>10} {'load ms':>10}")
+    ok = True
+    for name, (enc, dec) in formats.items():
+        data = enc()
+        encode_ms = _best_ms(enc, args.runs)
+        decode_ms = _best_ms(lambda: dec(data), args.runs)
+        load_ms = _best_ms(lambda: _apply_state(GameState(), dec(data)), args.runs)
+        print(f"{name:<12} {len(data):>10} {encode_ms:>10.2f} {decode_ms:>10.2f} {load_ms:>10.2f}")
+
+        loaded = GameState()
+        _apply_state(loaded, dec(data))
+        if snapshot_state(loaded) != snapshot:
+            print(f"FAIL: {name} did not round-trip")
+            ok = False
+    return 0 if ok else 1
+
+
+def _synthetic_state(rng: Random, *, flags: int, kills: int, items: int) -> GameState:
+    state = GameState()
+    state.player_name = "Benchmark"
+    state.gold = 123_456
+    state.combat_level = 42
+    state.chapter = 9
+    state.flags = {f"flag_chapter{rng.randint(1, 10)}_{i:05d}" for i in range(flags)}
+    state.kill_log = {f"enemy_{i:05d}": rng.randint(1, 5000) for i in range(kills)}
+    state.mission_kill_baseline = {k: v // 2 for k, v in list(state.kill_log.items())[: kills // 4]}
+    state.inventory = {f"item_{i:04d}": rng.randint(1, 99) for i in range(items)}
+    state.completed_missions = {f"mission_{i:04d}" for i in range(flags // 20)}
+    state.claimed_missions = set(list(state.completed_missions)[: len(state.completed_missions) // 2])
+    state.active_mission = "mission_9999"
+    state.equipment = {"weapon": "item_0001", "armor": None, "trinket": "item_0002"}
+    return state
+
+
+def _best_ms(fn: Callable[[], object], runs: int) -> float:
+    best = float("inf")
+    for _ in range(max(1, runs)):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
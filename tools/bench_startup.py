@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Content modules that parse data/*.json or hold large script tables. None of them
+# should be needed to show the first frame.
+CONTENT_MODULES = (
+    "game.items",
+    "game.enemies",
+    "game.spawns",
+    "game.story.missions",
+    "game.story.scripts",
+    "game.story.cutscenes",
+)
+
+
+# Runs the real GameApp and exits right after its first `pygame.display.flip()`.
+_FIRST_FRAME_PROBE = """
+import time
+t0 = time.perf_counter()
+import os
+import pygame
+_flip = pygame.display.flip
+def _probe_flip():
+    _flip()
+    print(f"{(time.perf_counter() - t0) * 1000:.3f}", flush=True)
+    os._exit(0)
+pygame.display.flip = _probe_flip
+from game.app import GameApp
+GameApp().run()
+"""
+
+
+@dataclass(frozen=True)
+class ImportRow:
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Startup report: `-X importtime` breakdown of importing the game entry module")
+    parser.add_argument(
+        "--first-frame",
+        action="store_true",
+        help="Instead, time interpreter start -> first display.flip headless (SDL dummy drivers)",
+    )
+    parser.add_argument("--module", default="game.app", help="Module to import (default: game.app)")
+    parser.add_argument("--runs", type=int, default=5, help="Import in N fresh interpreters and keep the fastest (default: 5)")
+    parser.add_argument("--top", type=int, default=12, help="Show the N slowest game modules (default: 12)")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Fail if game-owned import time (or first frame) exceeds this")
+    args = parser.parse_args()
+
+    if args.first_frame:
+        return _first_frame_report(runs=max(1, args.runs), budget_ms=args.budget_ms)
+
+    rows = min((_import_rows(args.module) for _ in range(max(1, args.runs))), key=_game_self_us)
+    total_us = next((r.cumulative_us for r in rows if r.module == args.module), 0)
+    game_rows = [r for r in rows if r.module == "game" or r.module.startswith("game.")]
+    game_us = _game_self_us(rows)
+
+    print(f"import {args.module}: {total_us / 1000:.1f} ms total, {game_us / 1000:.1f} ms in game.* ({len(game_rows)} modules)")
+    print()
+    print(f"{'self ms':>9} {'cumul ms':>9}  module")
+    for r in sorted(game_rows, key=lambda r: r.self_us, reverse=True)[: args.top]:
+        print(f"{r.self_us / 1000:9.2f} {r.cumulative_us / 1000:9.2f}  {r.module}")
+
+    loaded = {r.module for r in rows}
+    eager = [m for m in CONTENT_MODULES if m in loaded]
+    print()
+    if eager:
+        print("FAIL: content modules imported at startup: " + ", ".join(eager))
+    else:
+        print("OK: no content modules imported at startup")
+
+    over_budget = args.budget_ms is not None and game_us / 1000 > args.budget_ms
+    if over_budget:
+        print(f"FAIL: game.* import time {game_us / 1000:.1f} ms exceeds budget {args.budget_ms:.1f} ms")
+    return 1 if (eager or over_budget) else 0
+
+
+def _first_frame_report(*, runs: int, budget_ms: float | None) -> int:
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+    samples: list[float] = []
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-c", _FIRST_FRAME_PROBE],
+            cwd=ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+        lines = proc.stdout.strip().splitlines()
+        if not lines:
+            print(proc.stderr)
+            print("FAIL: the game exited before its first frame")
+            return 1
+        samples.append(float(lines[-1]))
+
+    best = min(samples)
+    print(f"time to first display.flip over {runs} runs: best {best:.1f} ms, median {statistics.median(samples):.1f} ms, worst {max(samples):.1f} ms")
+    if budget_ms is not None and best > budget_ms:
+        print(f"FAIL: first frame {best:.1f} ms exceeds budget {budget_ms:.1f} ms")
+        return 1
+    return 0
+
+
+def _import_rows(module: str) -> list[ImportRow]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    rows: list[ImportRow] = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header line
+        rows.append(ImportRow(module=parts[2].strip(), self_us=int(parts[0]), cumulative_us=int(parts[1])))
+    return rows
+
+
+def _game_self_us(rows: list[ImportRow]) -> int:
+    return sum(r.self_us for r in rows if r.module == "game" or r.module.startswith("game."))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+from random import Random
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Dungeon turn benchmark: enemy-turn time vs enemy count, on DungeonSim without pygame")
+    parser.add_argument("--counts", default="10,50,100,200,400", help="Comma-separated enemy counts (default: 10,50,100,200,400)")
+    parser.add_argument("--turns", type=int, default=200, help="Turns per count (default: 200)")
+    parser.add_argument("--size", default="64x48", help="Arena size WxH; the real floors are too small for big hordes (default: 64x48)")
+    parser.add_argument("--walk", type=int, default=2000, help="Random-walk turns through real floors for the turns/s figure (default: 2000)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+
+    from game.constants import TILE_FLOOR, TILE_WALL
+    from game.enemies import ENEMIES, spawn_enemy
+    from game.state import STATE
+    from game.world.dungeon_run import DungeonRun
+    from game.world import dungeon_sim, enemy_table
+    from game.world.dungeon_sim import DungeonSim, Move, UseStairs
+    from game.world.flow_field import FlowField
+
+    width, height = (int(v) for v in args.size.lower().split("x"))
+    enemy_ids = [e for e in ("raider", "bat", "archer", "guardian") if e in ENEMIES]
+    # Per-object calls vs the NumPy EnemyTable (when installed), on the same seeded arena.
+    table_default = dungeon_sim.ENEMY_TABLE_MIN
+    modes = [("loop", 10**9)] + ([("table", 0)] if enemy_table.available() else [])
+    print(f"arena {width}x{height}, every enemy aggroed, player moves whenever it is not boxed in")
+    print(f"{'enemies':>8} {'mode':>6} {'ms/turn':>9} {'us/enemy':>9} {'rebuilds':>9} {'flow ms':>8}")
+    for count, (mode, table_min) in ((int(c), m) for c in args.counts.split(",") if c.strip() for m in modes):
+        dungeon_sim.ENEMY_TABLE_MIN = table_min
+        rng = Random(args.seed)
+        scene = DungeonSim(DungeonRun("temple_ruins", "Temple Ruins"))
+        # Open arena with scattered pillars so paths have to bend around walls.
+        scene.grid = [
+            [
+                TILE_WALL if x in (0, width - 1) or y in (0, height - 1) or rng.random() < 0.12 else TILE_FLOOR
+                for x in range(width)
+            ]
+            for y in range(height)
+        ]
+        player = scene.player
+        player.x, player.y = width // 2, height // 2
+        scene.grid[player.y][player.x] = TILE_FLOOR
+        cells = [
+            (x, y)
+            for y in range(height)
+            for x in range(width)
+            if scene.grid[y][x] == TILE_FLOOR and abs(x - player.x) + abs(y - player.y) > 3
+        ]
+        rng.shuffle(cells)
+        enemies = [spawn_enemy(rng.choice(enemy_ids), x=x, y=y, floor=1, rng=rng) for x, y in cells[:count]]
+        for enemy in enemies:
+            enemy.aggro_until = 10**9  # worst case: the whole floor is chasing the player
+        scene.pickups.clear()
+        scene.set_enemies(enemies)
+
+        turn_s = 0.0
+        rebuilds = scene.flow.rebuilds
+        for turn in range(args.turns + 10):
+            STATE.hp = 10**6
+            # Move the player every turn it isn't boxed in, so the flow field is rebuilt.
+            x, y = player.x, player.y
+            for dx, dy in rng.sample(((1, 0), (-1, 0), (0, 1), (0, -1)), 4):
+                if scene.grid[y + dy][x + dx] != TILE_WALL and scene.occupancy.enemy_at(x + dx, y + dy) is None:
+                    player.x, player.y = x + dx, y + dy
+                    break
+            t0 = time.perf_counter()
+            scene._enemy_turn()
+            if turn >= 10:  # first turns are warm-up
+                turn_s += time.perf_counter() - t0
+        rebuilds = scene.flow.rebuilds - rebuilds
+
+        # One flow-field rebuild on its own, for scale.
+        field = FlowField()
+        t0 = time.perf_counter()
+        for i in range(50):
+            field.update(scene.grid, (player.x, player.y + (i & 1)))
+        flow_ms = (time.perf_counter() - t0) / 50 * 1000
+
+        n = len(scene.enemies)
+        per_turn = turn_s / args.turns * 1000
+        print(f"{n:>8} {mode:>6} {per_turn:>9.3f} {per_turn * 1000 / max(1, n):>9.2f} {rebuilds:>9} {flow_ms:>8.3f}")
+
+    # Whole turns (player action, enemy turn, fog) through real generated floors: the
+    # screen-sized ones, then a horde run packed with enemies on arena-sized floors.
+    dungeon_sim.ENEMY_TABLE_MIN = table_default
+    moves = [Move(1, 0), Move(-1, 0), Move(0, 1), Move(0, -1), UseStairs()]
+    walks = [("random walk", False, None, table_default), ("horde walk", True, (width, height), table_default)]
+    if enemy_table.available():
+        walks.append(("horde walk, loop", True, (width, height), 10**9))
+    for label, horde, size, table_min in walks:
+        dungeon_sim.ENEMY_TABLE_MIN = table_min
+        rng = Random(args.seed)
+        new_sim = lambda: DungeonSim(  # noqa: E731
+            DungeonRun("temple_ruins", "Temple Ruins", horde=horde), **({"size": size} if size else {})
+        )
+        sim = new_sim()
+        enemies = len(sim.enemies)
+        t0 = time.perf_counter()
+        for _ in range(args.walk):
+            STATE.hp = 10**6
+            sim.step(rng.choice(moves))
+            if sim.outcome is not None:
+                sim = new_sim()
+        elapsed = time.perf_counter() - t0
+        print(
+            f"{label}: {args.walk} turns in {elapsed:.2f}s = {args.walk / elapsed:,.0f} turns/s "
+            f"({enemies} enemies on floor 1, pygame loaded: {'pygame' in sys.modules})"
+        )
+    dungeon_sim.ENEMY_TABLE_MIN = table_default
+    STATE.hp = STATE.stats.max_hp
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from game.data_pack import DATA_DIR, PACK_PATH, build_pack, write_pack  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Validate data/*.json and write the precompiled content pack")
+    parser.add_argument("--data", type=Path, default=ROOT / DATA_DIR, help="Data directory (default: ./data)")
+    parser.add_argument("--out", type=Path, default=ROOT / PACK_PATH, help="Pack path (default: data/.cache/content.pack)")
+    parser.add_argument("--check", action="store_true", help="Only validate; don't write the pack")
+    args = parser.parse_args()
+
+    pack, problems = build_pack(args.data)
+    for name, section in pack["sections"].items():
+        state = "missing/unreadable, using built-in defaults" if section is None else f"{len(section)} entries"
+        print(f"{name}: {state}")
+    for problem in problems:
+        print(f"  {problem}")
+
+    if not args.check:
+        write_pack(pack, args.out)
+        print(f"wrote {args.out} (hash {pack['hash']})")
+    if problems:
+        print(f"FAIL: {len(problems)} problem(s)")
+        return 1
+    print("OK: data is valid")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
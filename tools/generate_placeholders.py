@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import argparse
 import math
+import sys
 import wave
 from dataclasses import dataclass
 from pathlib import Path
@@ -461,43 +462,20 @@ def _draw_texture(surf, icon: str, colors: Colors, *, variant: int) -> None:
 
 
 def _generate_sfx(*, sfx_dir: Path, overwrite: bool) -> None:
-    sample_rate = 44100
+    # Reuse the runtime synthesizer so the WAVs match what the game builds in memory.
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from game.synth import PLACEHOLDER_RATE, PLACEHOLDER_TONES, render, to_pcm16
 
-    def write_beep(path: Path, *, freq: float, ms: int, volume: float = 0.35, slide: float = 0.0) -> None:
+    sample_rate = PLACEHOLDER_RATE
+    for name, tone in PLACEHOLDER_TONES.items():
+        path = sfx_dir / f"{name}.wav"
         if path.exists() and not overwrite:
-            return
-        n = int(sample_rate * (ms / 1000.0))
-        frames = bytearray()
-        for i in range(n):
-            t = i / sample_rate
-            f = freq + slide * (i / max(1, n - 1))
-            # Simple envelope
-            a = min(1.0, i / (sample_rate * 0.01))
-            d = min(1.0, (n - 1 - i) / (sample_rate * 0.03))
-            env = a * d
-            s = math.sin(2.0 * math.pi * f * t) * volume * env
-            v = int(max(-1.0, min(1.0, s)) * 32767)
-            frames += int(v).to_bytes(2, byteorder="little", signed=True)
+            continue
         with wave.open(str(path), "wb") as wf:
             wf.setnchannels(1)
             wf.setsampwidth(2)
             wf.setframerate(sample_rate)
-            wf.writeframes(frames)
-
-    write_beep(sfx_dir / "hit.wav", freq=220, ms=120, volume=0.45, slide=-80)
-    write_beep(sfx_dir / "pickup.wav", freq=880, ms=90, volume=0.35, slide=140)
-    write_beep(sfx_dir / "door.wav", freq=330, ms=140, volume=0.35, slide=40)
-    write_beep(sfx_dir / "confirm.wav", freq=660, ms=90, volume=0.30, slide=0)
-    write_beep(sfx_dir / "shoot.wav", freq=520, ms=90, volume=0.30, slide=-120)
-    write_beep(sfx_dir / "heal.wav", freq=740, ms=160, volume=0.30, slide=60)
-
-    # Extra UI/feedback sounds
-    write_beep(sfx_dir / "step.wav", freq=180, ms=45, volume=0.20, slide=0)
-    write_beep(sfx_dir / "ui_open.wav", freq=860, ms=120, volume=0.28, slide=120)
-    write_beep(sfx_dir / "ui_close.wav", freq=740, ms=110, volume=0.26, slide=-120)
-    write_beep(sfx_dir / "error.wav", freq=190, ms=170, volume=0.32, slide=-30)
-    write_beep(sfx_dir / "equip.wav", freq=540, ms=90, volume=0.28, slide=80)
-    write_beep(sfx_dir / "mission.wav", freq=520, ms=240, volume=0.30, slide=260)
+            wf.writeframes(to_pcm16(render(tone, sample_rate=sample_rate)))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from game.profiler import PROFILER, sim_targets  # noqa: E402
+from game.world.replay import RUNS_DIR, RunRecording, read_recording, replay, write_recording  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Replay recorded dungeon runs headless, checking the per-action state hash; doubles as a turn-engine benchmark"
+    )
+    parser.add_argument("runs", nargs="*", help=f"Recordings to replay (default: every {RUNS_DIR}/*.run)")
+    parser.add_argument("--repeat", type=int, default=1, help="Replay each run this many times and report the best (default: 1)")
+    parser.add_argument("--no-verify", action="store_true", help="Skip the state hashes: raw turn-engine speed")
+    parser.add_argument("--profile", action="store_true", help="Time the dungeon turn phases (game.profiler) and print p50/p95/max per phase")
+    parser.add_argument("--record", metavar="DUNGEON", help="Instead of replaying, record a bot run of this dungeon (tools/balance.py's bot) to --out")
+    parser.add_argument("--out", default="", help="Where --record writes (default: saves/runs/bot-<dungeon>-<seed>.run)")
+    parser.add_argument("--seed", type=int, default=1, help="--record: seed base (default: 1)")
+    parser.add_argument("--level", type=int, default=5, help="--record: starting combat level (default: 5)")
+    parser.add_argument("--potions", type=int, default=5, help="--record: starting potion_small count (default: 5)")
+    parser.add_argument("--horde", action="store_true", help="--record: horde floors")
+    parser.add_argument("--max-actions", type=int, default=5000, help="--record: stop after this many actions (default: 5000)")
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+
+    if args.record:
+        return _record(args)
+
+    paths = [Path(p) for p in args.runs] or sorted(RUNS_DIR.glob("*.run"))
+    if not paths:
+        print(f"no recordings given and none in {RUNS_DIR}/")
+        return 1
+    if args.profile:
+        PROFILER.enable(sim_targets())
+    print(f"{'run':<40} {'actions':>8} {'turns':>7} {'outcome':>8} {'ms':>9} {'turns/s':>9}  check")
+    failed = 0
+    total_turns, total_seconds = 0, 0.0
+    for path in paths:
+        try:
+            recording = read_recording(path)
+        except (OSError, ValueError) as e:
+            print(f"{path.name:<40} unreadable: {e}")
+            failed += 1
+            continue
+        results = [replay(recording, verify=not args.no_verify) for _ in range(max(1, args.repeat))]
+        best = min(results, key=lambda r: r.seconds)
+        if args.no_verify:
+            check = "-"
+        elif best.ok:
+            check = "ok"
+        else:
+            check = "DIVERGED at start" if best.diverged_at == -1 else f"DIVERGED at action {best.diverged_at}"
+            failed += 1
+        rate = best.turns / best.seconds if best.seconds > 0 else 0.0
+        total_turns += best.turns
+        total_seconds += best.seconds
+        print(
+            f"{path.name:<40} {best.actions:>8} {best.turns:>7} {best.outcome or '-':>8} "
+            f"{best.seconds * 1000:>9.1f} {rate:>9.0f}  {check}"
+        )
+    if len(paths) > 1 and total_seconds > 0:
+        print(f"{'total':<40} {'':>8} {total_turns:>7} {'':>8} {total_seconds * 1000:>9.1f} {total_turns / total_seconds:>9.0f}")
+    if args.profile:
+        PROFILER.disable()
+        print()
+        print(f"{'phase':<20} {'count':>8} {'total ms':>10} {'p50 us':>9} {'p95 us':>9} {'max us':>9}")
+        for name, row in PROFILER.rows():
+            print(
+                f"{name:<20} {row['count']:>8} {row['total_ms']:>10.1f} {row['p50_us']:>9.1f} {row['p95_us']:>9.1f} {row['max_us']:>9.1f}"
+            )
+    return 1 if failed else 0
+
+
+def _record(args: argparse.Namespace) -> int:
+    sys.path.insert(0, str(ROOT / "tools"))
+    from balance import POTION, GreedyBot
+
+    from game.state import GameState
+    from game.story.quest_tracker import QuestTracker
+    from game.world.dungeon_run import DUNGEONS, DungeonRun
+    from game.world.dungeon_sim import DungeonSim
+
+    if args.record not in DUNGEONS:
+        print(f"unknown dungeon: {args.record}")
+        return 1
+    state = GameState()
+    for lv in range(1, args.level):
+        state.add_combat_xp(GameState.combat_xp_to_next(lv))
+    state.hp = state.stats.max_hp
+    if args.potions > 0:
+        state.add_item(POTION, args.potions)
+
+    run = DungeonRun.for_dungeon(args.record, seed_base=args.seed, horde=args.horde)
+    recording = RunRecording.start(run, state)
+    sim = DungeonSim(run, state=state, quests=QuestTracker(state))
+    recording.begin(sim)
+    bot = GreedyBot()
+    start = time.perf_counter()
+    while sim.outcome is None and len(recording.actions) < args.max_actions:
+        action = bot.act(sim)
+        sim.step(action)
+        recording.record(action, sim)
+    elapsed = time.perf_counter() - start
+
+    out = Path(args.out or RUNS_DIR / f"bot-{args.record}-{args.seed}.run")
+    write_recording(out, recording)
+    print(
+        f"recorded {len(recording.actions)} actions, {sim.turn} turns, floor {sim.run.floor}, "
+        f"{sim.outcome or 'unfinished'} in {elapsed:.2f}s -> {out} ({out.stat().st_size} bytes)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from game.save import decode_save, load_state, save_state  # noqa: E402
+from game.state import GameState  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Convert saves between the binary slot format and readable JSON")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    export = sub.add_parser("export", help="Binary (or JSON) save -> pretty JSON")
+    export.add_argument("src", type=Path)
+    export.add_argument("dst", type=Path)
+
+    imp = sub.add_parser("import", help="JSON (or binary) save -> binary slot file")
+    imp.add_argument("src", type=Path)
+    imp.add_argument("dst", type=Path)
+
+    info = sub.add_parser("info", help="Print a save's version, field count and slot-menu header")
+    info.add_argument("src", type=Path)
+    args = parser.parse_args()
+
+    if not args.src.exists():
+        print(f"FAIL: {args.src} does not exist")
+        return 1
+
+    if args.command == "info":
+        data = args.src.read_bytes()
+        payload = decode_save(data)
+        kind = "json" if data[:1] == b"{" else "binary"
+        print(f"{args.src}: {kind}, {len(data)} bytes, version {payload.get('version')}, {len(payload.get('state', {}))} fields")
+        for key, value in sorted((payload.get("meta") or {}).items()):
+            print(f"  {key}: {value}")
+        return 0
+
+    # Round-trip through a GameState so both directions apply the same coercions as a real load.
+    state = GameState()
+    load_state(args.src, state=state)
+    dst = args.dst
+    if args.command == "export" and dst.suffix != ".json":
+        dst = dst.with_suffix(".json")
+    if args.command == "import" and dst.suffix == ".json":
+        dst = dst.with_suffix(".sav")
+    save_state(dst, state=state, fsync="never")
+    print(f"OK: wrote {dst}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())